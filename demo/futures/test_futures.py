@@ -1,5 +1,7 @@
 import contextlib
 import functools
+import itertools
+import operator
 import os
 import random
 import sys
@@ -298,6 +300,131 @@ class ProcessPoolInitTest(ProcessPoolMixin, unittest.TestCase):
             with self.assertRaises(ValueError):
                 self.executor_type(max_workers=number)
 
+    def test_max_inflight(self):
+        executor = self.executor_type(max_inflight=4)
+        fs = [executor.submit(abs, -i) for i in range(100)]
+        self.assertEqual([f.result() for f in fs], list(range(100)))
+        executor.shutdown()
+        for number in (0, -1):
+            with self.assertRaises(ValueError):
+                self.executor_type(max_inflight=number)
+
+    def test_max_inflight_environ(self):
+        save = os.environ.get("MPI4PY_FUTURES_MAX_INFLIGHT")
+        os.environ["MPI4PY_FUTURES_MAX_INFLIGHT"] = "3"
+        try:
+            executor = self.executor_type()
+            fs = [executor.submit(abs, -i) for i in range(100)]
+            self.assertEqual([f.result() for f in fs], list(range(100)))
+            executor.shutdown()
+        finally:
+            del os.environ["MPI4PY_FUTURES_MAX_INFLIGHT"]
+            if save is not None:
+                os.environ["MPI4PY_FUTURES_MAX_INFLIGHT"] = save
+
+    def test_progress(self):
+        executor = self.executor_type(progress="wakeup")
+        fs = [executor.submit(abs, -i) for i in range(100)]
+        self.assertEqual([f.result() for f in fs], list(range(100)))
+        time.sleep(0.01)
+        fs = [executor.submit(abs, -i) for i in range(10)]
+        self.assertEqual([f.result() for f in fs], list(range(10)))
+        executor.shutdown()
+        with self.assertRaises(ValueError):
+            self.executor_type(progress="foobar")
+
+    def test_progress_environ(self):
+        save = os.environ.get("MPI4PY_FUTURES_PROGRESS")
+        try:
+            os.environ["MPI4PY_FUTURES_PROGRESS"] = "wakeup"
+            executor = self.executor_type()
+            executor.submit(time.sleep, 0).result()
+            executor.shutdown()
+            with warnings.catch_warnings(record=True) as wlist:
+                warnings.simplefilter("always")
+                os.environ["MPI4PY_FUTURES_PROGRESS"] = "foobar"
+                executor = self.executor_type()
+                executor.submit(time.sleep, 0).result()
+                executor.shutdown()
+            self.assertTrue(wlist)
+            msg = wlist[0].message
+            self.assertIsInstance(msg, RuntimeWarning)
+            assert isinstance(msg, RuntimeWarning)
+            self.assertIn("foobar", msg.args[0])
+        finally:
+            del os.environ["MPI4PY_FUTURES_PROGRESS"]
+            if save is not None:
+                os.environ["MPI4PY_FUTURES_PROGRESS"] = save
+
+    def test_batch_size(self):
+        executor = self.executor_type(batch_size=8, batch_delay=0.01)
+        fs = [executor.submit(abs, -i) for i in range(100)]
+        self.assertEqual([f.result() for f in fs], list(range(100)))
+        executor.shutdown()
+        for number in (0, -1):
+            with self.assertRaises(ValueError):
+                self.executor_type(batch_size=number)
+        with self.assertRaises(ValueError):
+            self.executor_type(batch_delay=-1)
+
+    def test_batch_size_environ(self):
+        names = ("MPI4PY_FUTURES_BATCH_SIZE", "MPI4PY_FUTURES_BATCH_DELAY")
+        saves = [os.environ.get(name) for name in names]
+        os.environ.update(zip(names, ("5", "0.001")))
+        try:
+            executor = self.executor_type()
+            fs = [executor.submit(abs, -i) for i in range(100)]
+            self.assertEqual([f.result() for f in fs], list(range(100)))
+            executor.shutdown()
+        finally:
+            for name, save in zip(names, saves):
+                del os.environ[name]
+                if save is not None:
+                    os.environ[name] = save
+
+    def test_store_size(self):
+        executor = self.executor_type(store_size=1)
+        handles = [executor.put([i] * i) for i in range(3)]
+        self.assertEqual(executor.submit(len, handles[2]).result(), 2)
+        if not isinstance(handles[1], list):
+            with self.assertRaises(LookupError):
+                executor.submit(len, handles[1]).result()
+        executor.shutdown()
+        with self.assertRaises(RuntimeError):
+            executor.put(None)
+        for number in (0, -1):
+            with self.assertRaises(ValueError):
+                self.executor_type(store_size=number)
+
+    def test_func_cache(self):
+        executor = self.executor_type(func_cache=2)
+        func = CountPickle()
+        fs = [executor.submit(func, i) for i in range(50)]
+        self.assertEqual([f.result() for f in fs], list(range(50)))
+        self.assertLessEqual(func.count, executor.num_workers)
+        funcs = [functools.partial(mul, i) for i in range(5)]
+        fs = [executor.submit(funcs[i % 5], i) for i in range(50)]
+        results = [(i % 5) * i for i in range(50)]
+        self.assertEqual([f.result() for f in fs], results)
+        executor.shutdown()
+        for number in (-1, -2):
+            with self.assertRaises(ValueError):
+                self.executor_type(func_cache=number)
+
+    def test_func_cache_environ(self):
+        save = os.environ.get("MPI4PY_FUTURES_FUNC_CACHE")
+        os.environ["MPI4PY_FUTURES_FUNC_CACHE"] = "1"
+        try:
+            executor = self.executor_type()
+            func = functools.partial(mul, 2)
+            fs = [executor.submit(func, i) for i in range(10)]
+            self.assertEqual([f.result() for f in fs], list(range(0, 20, 2)))
+            executor.shutdown()
+        finally:
+            del os.environ["MPI4PY_FUTURES_FUNC_CACHE"]
+            if save is not None:
+                os.environ["MPI4PY_FUTURES_FUNC_CACHE"] = save
+
     def test_get_comm_workers(self):
         executor = self.executor_type()
         num_workers = executor.submit(check_comm_workers).result()
@@ -825,6 +952,47 @@ class ExecutorTestMixin(BaseMixin):
             list(map(pow, range(10), range(10))),
         )
 
+    def test_put(self):
+        data = list(range(100))
+        handle = self.executor.put(data)
+        future = self.executor.submit(len, handle)
+        self.assertEqual(future.result(), 100)
+        future = self.executor.submit(operator.getitem, handle, 7)
+        self.assertEqual(future.result(), 7)
+        results = self.executor.map(
+            operator.getitem,
+            itertools.repeat(handle),
+            range(10),
+            chunksize=3,
+        )
+        self.assertEqual(list(results), data[:10])
+
+    def test_map_reduce(self):
+        map_reduce = self.executor.map_reduce
+        ref = sum(range(1, 101))
+        for cs in (1, 7, 100, 200):
+            args = (abs, operator.add, range(-100, 0))
+            future = map_reduce(*args, chunksize=cs)
+            self.assertEqual(future.result(), ref)
+        future = map_reduce(abs, max, iter([-3, 5, -7]), initial=6)
+        self.assertEqual(future.result(), 7)
+        future = map_reduce(abs, operator.add, [], initial=5)
+        self.assertEqual(future.result(), 5)
+        future = map_reduce(abs, operator.add, [])
+        with self.assertRaises(TypeError):
+            future.result()
+        future = map_reduce(abs, operator.truediv, [1, 0], chunksize=2)
+        with self.assertRaises(ZeroDivisionError):
+            future.result()
+        future = map_reduce(inout, operator.add, [1, 2, "3"], chunksize=2)
+        with self.assertRaises(TypeError):
+            future.result()
+        future = map_reduce(abs, operator.add, [1, -2, "3"])
+        with self.assertRaises(TypeError):
+            future.result()
+        with self.assertRaises(ValueError):
+            map_reduce(abs, operator.add, [1], chunksize=0)
+
     def test_map_exception(self):
         i = self.executor.map(divmod, [1, 1, 1, 1], [2, 3, 0, 5])
         self.assertEqual(next(i), (0, 1))
@@ -896,6 +1064,54 @@ class ProcessPoolExecutorTest(
         with self.assertRaises(ValueError):
             list(self.executor.starmap(pow, sequence, chunksize=-1))
 
+    def test_map_chunksize_auto(self):
+        ref = list(map(pow, range(100), range(100)))
+        for unordered in (False, True):
+            for bs in (None, 1, 5):
+                results = self.executor.map(
+                    pow,
+                    range(100),
+                    range(100),
+                    chunksize="auto",
+                    buffersize=bs,
+                    unordered=unordered,
+                )
+                if unordered:
+                    self.assertEqual(sorted(results), sorted(ref))
+                else:
+                    self.assertEqual(list(results), ref)
+        sequence = [(a, a) for a in range(100)]
+        results = self.executor.starmap(pow, iter(sequence), chunksize="auto")
+        self.assertEqual(list(results), ref)
+        results = self.executor.map(abs, itertools.count(), chunksize="auto")
+        self.assertEqual(list(itertools.islice(results, 50)), list(range(50)))
+        results.close()
+        i = self.executor.map(
+            divmod, [1, 1, 1, 1], [2, 3, 0, 5], chunksize="auto"
+        )
+        with self.assertRaises(ZeroDivisionError):
+            list(i)
+
+    def test_map_chunksize_sizer(self):
+        sizer = futures.pool._ChunkSizer(2, 1000)
+        self.assertEqual(sizer.size(), 1)
+        future = futures.Future()
+        sizer.submit(future, ((1,) * 10,))
+        future.set_result(([None] * 10, 1e-6))
+        size = sizer.size()
+        self.assertGreater(size, 1)
+        self.assertLessEqual(size, 1000 // 4)
+        sizer.consume(990)
+        self.assertLessEqual(sizer.size(), 10 // 4)
+        future = futures.Future()
+        sizer.submit(future, ((1,),))
+        future.set_exception(ZeroDivisionError())
+        sizer = futures.pool._ChunkSizer(1)
+        future = futures.Future()
+        sizer.submit(future, ((1,),))
+        future.set_result(([None], 1.0))
+        self.assertEqual(sizer.size(), 1)
+
     def test_map_buffersize(self):
         ref = list(map(pow, range(10), range(10)))
         for bs in (1, 2, 9, 10, 11):
@@ -926,14 +1142,51 @@ class ProcessPoolExecutorTest(
                 range(10),
                 buffersize=-1,
             )
-        with self.assertRaises(ValueError):
-            self.executor.map(
-                pow,
-                range(10),
-                range(10),
-                buffersize=1,
-                unordered=True,
-            )
+        for bs in (1, 2, 9, 10, 11):
+            for cs in (1, 2, 9, 10, 11):
+                self.assertEqual(
+                    sorted(
+                        self.executor.map(
+                            pow,
+                            range(10),
+                            range(10),
+                            chunksize=cs,
+                            buffersize=bs,
+                            unordered=True,
+                        )
+                    ),
+                    sorted(ref),
+                )
+        for args in ([(), ()], iter([(), ()])):
+            results = self.executor.starmap(int, args, buffersize=1)
+            self.assertEqual(list(results), [0, 0])
+
+    def test_map_buffersize_stream(self):
+        pulled = []
+
+        def stream():
+            for i in itertools.count():
+                pulled.append(i)
+                yield i
+
+        for unordered in (False, True):
+            for cs in (1, 3):
+                del pulled[:]
+                results = self.executor.map(
+                    abs,
+                    stream(),
+                    chunksize=cs,
+                    buffersize=2,
+                    unordered=unordered,
+                )
+                values = list(itertools.islice(results, 10))
+                self.assertLessEqual(len(pulled), 10 + 3 * cs)
+                if unordered:
+                    self.assertEqual(len(set(values)), 10)
+                    self.assertLessEqual(set(values), set(pulled))
+                else:
+                    self.assertEqual(values, list(range(10)))
+                results.close()
 
     def test_map_unordered(self):
         map_unordered = functools.partial(self.executor.map, unordered=True)
@@ -988,6 +1241,34 @@ class ProcessPoolExecutorTest(
             set(map_unordered(pow, range(40), range(40), chunksize=-1))
 
 
+class ProcessPoolInflightTest(ProcessPoolExecutorTest):
+    executor_type = staticmethod(
+        functools.partial(
+            ProcessPoolExecutorTest.executor_type,
+            max_inflight=3,
+        )
+    )
+
+
+class ProcessPoolBatchTest(ProcessPoolExecutorTest):
+    executor_type = staticmethod(
+        functools.partial(
+            ProcessPoolExecutorTest.executor_type,
+            max_inflight=2,
+            batch_size=4,
+        )
+    )
+
+
+class ProcessPoolWakeupTest(ProcessPoolExecutorTest):
+    executor_type = staticmethod(
+        functools.partial(
+            ProcessPoolExecutorTest.executor_type,
+            progress="wakeup",
+        )
+    )
+
+
 class ProcessPoolSubmitTest(unittest.TestCase):
     @unittest.skipIf(MPI.get_vendor()[0] == "Microsoft MPI", "msmpi")
     def test_multiple_executors(self):
@@ -1046,6 +1327,18 @@ def inout(arg):
     return arg
 
 
+class CountPickle:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, arg):
+        return arg
+
+    def __getstate__(self):
+        self.count += 1
+        return {}
+
+
 class GoodPickle:
     def __init__(self, value=0):
         self.value = value
@@ -1136,6 +1429,41 @@ class ProcessPoolPickleTest(unittest.TestCase):
         f = self.executor.submit(abs, 42)
         self.assertEqual(f.result(), 42)
 
+    def test_put_pickle(self):
+        with self.assertRaises(ZeroDivisionError):
+            self.executor.put(BadPickle())
+        handle = self.executor.put(BadUnpickle())
+        with self.assertRaises(ZeroDivisionError):
+            handle.future.result()
+        f = self.executor.submit(inout, handle)
+        with self.assertRaises(RuntimeError) as cm:
+            f.result()
+        self.assertIsInstance(cm.exception.__cause__, ZeroDivisionError)
+        handle = self.executor.put(GoodPickle(7))
+        self.assertIsNone(handle.future.result())
+        f = self.executor.submit(inout, handle)
+        self.assertEqual(f.result().value, 7)
+
+    def test_func_cache_pickle(self):
+        executor = futures.MPIPoolExecutor(1, func_cache=4)
+        try:
+            func = functools.partial(inout, BadUnpickle())
+            for _ in range(2):
+                f = executor.submit(func)
+                with self.assertRaises(ZeroDivisionError):
+                    f.result()
+            func = functools.partial(inout)
+            f = executor.submit(func, BadUnpickle())
+            with self.assertRaises(ZeroDivisionError):
+                f.result()
+            f = executor.submit(func, 42)
+            self.assertEqual(f.result(), 42)
+            f = executor.submit(functools.partial(inout, BadPickle()))
+            with self.assertRaises(ZeroDivisionError):
+                f.result()
+        finally:
+            executor.shutdown()
+
     def test_exc_pickle(self):
         o = BadPickle()
         f = self.executor.submit(inout, o)
@@ -1152,6 +1480,72 @@ class ProcessPoolPickleTest(unittest.TestCase):
         cause = exc.__cause__
         self.assertIsInstance(cause, futures._core.RemoteTraceback)
 
+    def test_batch_pickle(self):
+        executor = futures.MPIPoolExecutor(1, batch_size=8, batch_delay=0.1)
+        try:
+            fs = [
+                executor.submit(abs, -1),
+                executor.submit(inout, BadPickle()),
+                executor.submit(GoodPickle, 7),
+                executor.submit(BadPickle),
+            ]
+            self.assertEqual(fs[0].result(), 1)
+            with self.assertRaises(ZeroDivisionError):
+                fs[1].result()
+            self.assertEqual(fs[2].result().value, 7)
+            with self.assertRaises(ZeroDivisionError):
+                fs[3].result()
+            f = executor.submit(inout, BadUnpickle())
+            with self.assertRaises(ZeroDivisionError):
+                f.result()
+            f = executor.submit(abs, 42)
+            self.assertEqual(f.result(), 42)
+        finally:
+            executor.shutdown()
+
+    def test_batch_partial(self):
+        executor = futures.MPIPoolExecutor(1, batch_size=6, batch_delay=0.1)
+        try:
+            executor.bootup()
+            fs = [
+                executor.submit(abs, -1),
+                executor.submit(BadUnpickle),
+                executor.submit(time.sleep, 0.2),
+                executor.submit(abs, -4),
+                executor.submit(time.sleep, 0.2),
+                executor.submit(time.sleep, 2),
+            ]
+            done, _ = futures.wait(fs[:5], timeout=1.5)
+            self.assertEqual(len(done), 5)
+            self.assertFalse(fs[5].done())
+            with self.assertRaises(ZeroDivisionError):
+                fs[1].result()
+            self.assertEqual(fs[3].result(), 4)
+            self.assertIsNone(fs[4].result())
+            self.assertIsNone(fs[5].result())
+        finally:
+            executor.shutdown()
+
+    def test_batch_latency(self):
+        executor = futures.MPIPoolExecutor(1, batch_size=4, batch_delay=0.2)
+        try:
+            executor.bootup()
+            fs = [
+                executor.submit(abs, -1),
+                executor.submit(time.sleep, 2),
+                executor.submit(abs, -2),
+                executor.submit(abs, -3),
+            ]
+            done, _ = futures.wait(fs[:1], timeout=1)
+            self.assertEqual(len(done), 1)
+            self.assertFalse(fs[1].done())
+            self.assertEqual(fs[0].result(), 1)
+            self.assertIsNone(fs[1].result())
+            self.assertEqual(fs[2].result(), 2)
+            self.assertEqual(fs[3].result(), 3)
+        finally:
+            executor.shutdown()
+
 
 class MPICommExecutorTest(unittest.TestCase):
     MPICommExecutor = futures.MPICommExecutor
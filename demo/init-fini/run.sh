@@ -18,11 +18,21 @@ $MPIEXEC $NP_FLAG $NP $PYTHON "$dir/test_0.py" thread_level=serialized
 $MPIEXEC $NP_FLAG $NP $PYTHON "$dir/test_0.py" thread_level=multiple
 $MPIEXEC $NP_FLAG $NP $PYTHON "$dir/test_0.py" fast_reduce=true
 $MPIEXEC $NP_FLAG $NP $PYTHON "$dir/test_0.py" fast_reduce=false
+$MPIEXEC $NP_FLAG $NP $PYTHON "$dir/test_0.py" buffer_reduce=true
+$MPIEXEC $NP_FLAG $NP $PYTHON "$dir/test_0.py" buffer_reduce=false
 $MPIEXEC $NP_FLAG $NP $PYTHON "$dir/test_0.py" recv_mprobe=true
 $MPIEXEC $NP_FLAG $NP $PYTHON "$dir/test_0.py" recv_mprobe=false
 $MPIEXEC $NP_FLAG $NP $PYTHON "$dir/test_0.py" irecv_bufsz=0
 $MPIEXEC $NP_FLAG $NP $PYTHON "$dir/test_0.py" irecv_bufsz=1
 $MPIEXEC $NP_FLAG $NP $PYTHON "$dir/test_0.py" irecv_bufsz=1024
+$MPIEXEC $NP_FLAG $NP $PYTHON "$dir/test_0.py" irecv_adapt=false
+$MPIEXEC $NP_FLAG $NP $PYTHON "$dir/test_0.py" irecv_adapt=true
+$MPIEXEC $NP_FLAG $NP $PYTHON "$dir/test_0.py" recv_arena=0
+$MPIEXEC $NP_FLAG $NP $PYTHON "$dir/test_0.py" recv_arena=1024
+$MPIEXEC $NP_FLAG $NP $PYTHON "$dir/test_0.py" bcast_segsz=0
+$MPIEXEC $NP_FLAG $NP $PYTHON "$dir/test_0.py" bcast_segsz=1024
+$MPIEXEC $NP_FLAG $NP $PYTHON "$dir/test_0.py" pickle_oob=false
+$MPIEXEC $NP_FLAG $NP $PYTHON "$dir/test_0.py" pickle_oob=true
 $MPIEXEC $NP_FLAG $NP $PYTHON "$dir/test_0.py" errors=default
 $MPIEXEC $NP_FLAG $NP $PYTHON "$dir/test_0.py" errors=exception
 $MPIEXEC $NP_FLAG $NP $PYTHON "$dir/test_0.py" errors=abort
@@ -490,6 +490,7 @@ class Prequest(Request):
     def Start(self) -> None: ...
     @classmethod
     def Startall(cls, requests: list[Prequest]) -> None: ...
+    def start(self, obj: Any = None) -> None: ...
     def Pready(self, partition: int) -> None: ...
     def Pready_range(self, partition_low: int, partition_high: int) -> None: ...
     def Pready_list(self, partitions: Sequence[int]) -> None: ...
@@ -884,6 +885,8 @@ class Comm:
     def ibsend(self, obj: Any, dest: int, tag: int = 0) -> Request: ...
     def issend(self, obj: Any, dest: int, tag: int = 0) -> Request: ...
     def irecv(self, buf: Buffer | None = None, source: int = ANY_SOURCE, tag: int = ANY_TAG) -> Request: ...
+    def send_init(self, dest: int, tag: int = 0) -> Prequest: ...
+    def recv_init(self, source: int = ANY_SOURCE, tag: int = ANY_TAG) -> Prequest: ...
     def probe(self, source: int = ANY_SOURCE, tag: int = ANY_TAG, status: Status | None = None) -> Literal[True]: ...
     def iprobe(self, source: int = ANY_SOURCE, tag: int = ANY_TAG, status: Status | None = None) -> bool: ...
     def mprobe(self, source: int = ANY_SOURCE, tag: int = ANY_TAG, status: Status | None = None) -> Message: ...
@@ -891,11 +894,17 @@ class Comm:
     def barrier(self) -> None: ...
     def bcast(self, obj: Any, root: int = 0) -> Any: ...
     def gather(self, sendobj: Any, root: int = 0) -> list[Any] | None: ...
+    def gather_iter(self, sendobj: Any, root: int = 0) -> Iterator[Any] | None: ...
     def scatter(self, sendobj: Sequence[Any] | None, root: int = 0) -> Any: ...
     def allgather(self, sendobj: Any) -> list[Any]: ...
     def alltoall(self, sendobj: Sequence[Any]) -> list[Any]: ...
     def reduce(self, sendobj: Any, op: Op | Callable[[Any, Any], Any] = SUM, root: int = 0) -> Any | None: ...
     def allreduce(self, sendobj: Any, op: Op | Callable[[Any, Any], Any] = SUM) -> Any: ...
+    def ibcast(self, obj: Any, root: int = 0) -> Request: ...
+    def igather(self, sendobj: Any, root: int = 0) -> Request: ...
+    def iscatter(self, sendobj: Sequence[Any] | None, root: int = 0) -> Request: ...
+    def iallgather(self, sendobj: Any) -> Request: ...
+    def ialltoall(self, sendobj: Sequence[Any]) -> Request: ...
     handle: int
     group: Group
     size: int
@@ -1274,12 +1283,18 @@ class Pickle:
         loads: Callable[[SupportsBuffer], Any],
         protocol: int | None = None,
         threshold: int | None = None,
+        *,
+        compress: str | None = None,
+        compress_threshold: int | None = None,
     ) -> None: ...
     @overload
     def __init__(
         self,
         dumps: Callable[[Any], bytes] | None = None,
         loads: Callable[[SupportsBuffer], Any] | None = None,
+        *,
+        compress: str | None = None,
+        compress_threshold: int | None = None,
     ) -> None: ...
     @overload
     def __init__(
@@ -1287,13 +1302,17 @@ class Pickle:
         *,
         protocol: int | None = None,
         threshold: int | None = None,
+        compress: str | None = None,
+        compress_threshold: int | None = None,
     ) -> None: ...
     def dumps(self, obj: Any) -> bytes: ...
     def loads(self, data: Buffer) -> Any: ...
-    def dumps_oob(self, obj: Any) -> tuple[bytes, list[buffer]]: ...
+    def dumps_oob(self, obj: Any, buffer_callback: Callable[[buffer], Any] | None = None) -> tuple[bytes, list[buffer]]: ...
     def loads_oob(self, data: Buffer, buffers: Iterable[Buffer]) -> Any: ...
     PROTOCOL: int | None
     THRESHOLD: int
+    COMPRESS: str | None
+    COMPRESS_THRESHOLD: int
 
 pickle: Final[Pickle] = ...
 
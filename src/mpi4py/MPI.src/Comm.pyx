@@ -2068,6 +2068,41 @@ cdef class Comm:
         request.ob_buf = PyMPI_irecv(buf, source, tag, comm, &request.ob_mpi)
         return request
 
+    def send_init(
+        self,
+        int dest: int,
+        int tag: int = 0,
+    ) -> Prequest:
+        """
+        Create a persistent request for a send.
+
+        Call `Prequest.start` with the object to send to initiate the
+        communication. The object is pickled directly into a buffer
+        reused across starts along with the MPI request. The messages
+        can only be received with requests created by `recv_init`.
+        """
+        cdef MPI_Comm comm = self.ob_mpi
+        cdef Prequest request = <Prequest>New(Prequest)
+        request.ob_buf = PyMPI_send_init(dest, tag, comm, &request.ob_mpi)
+        return request
+
+    def recv_init(
+        self,
+        int source: int = ANY_SOURCE,
+        int tag: int = ANY_TAG,
+    ) -> Prequest:
+        """
+        Create a persistent request for a receive.
+
+        Call `Prequest.start` to initiate the communication. The
+        received object is returned on completion. The receive buffer
+        grows as needed to hold larger messages.
+        """
+        cdef MPI_Comm comm = self.ob_mpi
+        cdef Prequest request = <Prequest>New(Prequest)
+        request.ob_buf = PyMPI_recv_init(source, tag, comm, &request.ob_mpi)
+        return request
+
     def probe(
         self,
         int source: int = ANY_SOURCE,
@@ -2147,6 +2182,23 @@ cdef class Comm:
         cdef MPI_Comm comm = self.ob_mpi
         return PyMPI_gather(sendobj, root, comm)
 
+    def gather_iter(
+        self,
+        sendobj: Any,
+        int root: int = 0,
+    ) -> Iterator[Any] | None:
+        """
+        Gather with lazy deserialization at root.
+
+        At the root process, return an iterator yielding the objects
+        sent by each process in rank order. Objects are received in
+        windows of consecutive ranks and deserialized one at a time
+        as the iterator advances. Processes other than the root wait
+        for the root to reach their contribution and return `None`.
+        """
+        cdef MPI_Comm comm = self.ob_mpi
+        return PyMPI_gather_iter(sendobj, root, comm)
+
     def scatter(
         self,
         sendobj: Sequence[Any] | None,
@@ -2191,6 +2243,59 @@ cdef class Comm:
         cdef MPI_Comm comm = self.ob_mpi
         return PyMPI_allreduce(sendobj, op, comm)
 
+    def ibcast(
+        self,
+        obj: Any,
+        int root: int = 0,
+    ) -> Request:
+        """Nonblocking Broadcast."""
+        cdef MPI_Comm comm = self.ob_mpi
+        cdef Request request = <Request>New(Request)
+        request.ob_buf = PyMPI_ibcast(obj, root, comm, &request.ob_mpi)
+        return request
+
+    def igather(
+        self,
+        sendobj: Any,
+        int root: int = 0,
+    ) -> Request:
+        """Nonblocking Gather."""
+        cdef MPI_Comm comm = self.ob_mpi
+        cdef Request request = <Request>New(Request)
+        request.ob_buf = PyMPI_igather(sendobj, root, comm, &request.ob_mpi)
+        return request
+
+    def iscatter(
+        self,
+        sendobj: Sequence[Any] | None,
+        int root: int = 0,
+    ) -> Request:
+        """Nonblocking Scatter."""
+        cdef MPI_Comm comm = self.ob_mpi
+        cdef Request request = <Request>New(Request)
+        request.ob_buf = PyMPI_iscatter(sendobj, root, comm, &request.ob_mpi)
+        return request
+
+    def iallgather(
+        self,
+        sendobj: Any,
+    ) -> Request:
+        """Nonblocking Gather to All."""
+        cdef MPI_Comm comm = self.ob_mpi
+        cdef Request request = <Request>New(Request)
+        request.ob_buf = PyMPI_iallgather(sendobj, comm, &request.ob_mpi)
+        return request
+
+    def ialltoall(
+        self,
+        sendobj: Sequence[Any],
+    ) -> Request:
+        """Nonblocking All to All Scatter/Gather."""
+        cdef MPI_Comm comm = self.ob_mpi
+        cdef Request request = <Request>New(Request)
+        request.ob_buf = PyMPI_ialltoall(sendobj, comm, &request.ob_mpi)
+        return request
+
 
 cdef class Intracomm(Comm):
     """
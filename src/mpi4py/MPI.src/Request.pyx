@@ -503,6 +503,12 @@ cdef class Prequest(Request):
         finally:
             rs.release()
 
+    def start(self, obj: Any = None) -> None:
+        """
+        Initiate a communication with a persistent request.
+        """
+        PyMPI_start(self.ob_buf, obj, &self.ob_mpi)
+
     # Partitioned completion
     # ----------------------
 
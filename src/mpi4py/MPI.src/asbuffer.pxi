@@ -30,6 +30,7 @@ cdef extern from "Python.h":
     int  PyObject_CheckBuffer(object)
     int  PyObject_GetBuffer(object, Py_buffer *, int) except -1
     void PyBuffer_Release(Py_buffer *)
+    int  PyBuffer_IsContiguous(Py_buffer *, char)
     int  PyBuffer_FillInfo(Py_buffer *, object,
                            void *, Py_ssize_t,
                            bint, int) except -1
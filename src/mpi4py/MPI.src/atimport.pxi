@@ -68,8 +68,13 @@ ctypedef struct Options:
     int       thread_level
     bint      finalize
     bint      fast_reduce
+    bint      buffer_reduce
     bint      recv_mprobe
     MPI_Count irecv_bufsz
+    bint      irecv_adapt
+    MPI_Count recv_arena
+    MPI_Count bcast_segsz
+    bint      pickle_oob
     int       errors
 
 cdef Options options
@@ -78,8 +83,13 @@ options.threads = 1
 options.thread_level = MPI_THREAD_MULTIPLE
 options.finalize = 1
 options.fast_reduce = 1
+options.buffer_reduce = 0
 options.recv_mprobe = 1
 options.irecv_bufsz = 32768
+options.irecv_adapt = 0
+options.recv_arena = 0
+options.bcast_segsz = 0
+options.pickle_oob = 0
 options.errors = 1
 
 cdef object getOpt(object rc, const char name[], object value):
@@ -115,8 +125,13 @@ cdef int getOptions(Options* opts) except -1:
     opts.thread_level = MPI_THREAD_MULTIPLE
     opts.finalize = 1
     opts.fast_reduce = 1
+    opts.buffer_reduce = 0
     opts.recv_mprobe = USE_MATCHED_RECV
     opts.irecv_bufsz = 32768
+    opts.irecv_adapt = 0
+    opts.recv_arena = 0
+    opts.bcast_segsz = 0
+    opts.pickle_oob = 0
     opts.errors = 1
     #
     cdef object rc
@@ -130,8 +145,13 @@ cdef int getOptions(Options* opts) except -1:
     cdef object thread_level = getOpt(rc, b"thread_level" , 'multiple'  )
     cdef object finalize     = getOpt(rc, b"finalize"     , None        )
     cdef object fast_reduce  = getOpt(rc, b"fast_reduce"  , True        )
+    cdef object buffer_reduce = getOpt(rc, b"buffer_reduce", False      )
     cdef object recv_mprobe  = getOpt(rc, b"recv_mprobe"  , True        )
     cdef object irecv_bufsz  = getOpt(rc, b"irecv_bufsz"  , 32768       )
+    cdef object irecv_adapt  = getOpt(rc, b"irecv_adapt"  , False       )
+    cdef object recv_arena   = getOpt(rc, b"recv_arena"   , 0           )
+    cdef object bcast_segsz  = getOpt(rc, b"bcast_segsz"  , 0           )
+    cdef object pickle_oob   = getOpt(rc, b"pickle_oob"   , False       )
     cdef object errors       = getOpt(rc, b"errors"       , 'exception' )
     #
     if initialize in (True, 'yes'):
@@ -175,6 +195,13 @@ cdef int getOptions(Options* opts) except -1:
     else:
         warnOpt(b"fast_reduce", fast_reduce)
     #
+    if buffer_reduce in (True, 'yes'):
+        opts.buffer_reduce = 1
+    elif buffer_reduce in (False, 'no'):
+        opts.buffer_reduce = 0
+    else:
+        warnOpt(b"buffer_reduce", buffer_reduce)
+    #
     if recv_mprobe in (True, 'yes'):
         opts.recv_mprobe = 1 and USE_MATCHED_RECV
     elif recv_mprobe in (False, 'no'):
@@ -187,6 +214,30 @@ cdef int getOptions(Options* opts) except -1:
     else:
         warnOpt(b"irecv_bufsz", irecv_bufsz)
     #
+    if irecv_adapt in (True, 'yes'):
+        opts.irecv_adapt = 1
+    elif irecv_adapt in (False, 'no'):
+        opts.irecv_adapt = 0
+    else:
+        warnOpt(b"irecv_adapt", irecv_adapt)
+    #
+    if type(recv_arena) is int and recv_arena >= 0:
+        opts.recv_arena = recv_arena
+    else:
+        warnOpt(b"recv_arena", recv_arena)
+    #
+    if type(bcast_segsz) is int and bcast_segsz >= 0:
+        opts.bcast_segsz = bcast_segsz
+    else:
+        warnOpt(b"bcast_segsz", bcast_segsz)
+    #
+    if pickle_oob in (True, 'yes'):
+        opts.pickle_oob = 1
+    elif pickle_oob in (False, 'no'):
+        opts.pickle_oob = 0
+    else:
+        warnOpt(b"pickle_oob", pickle_oob)
+    #
     if errors == 'default':
         opts.errors = 0
     elif errors == 'exception':
@@ -12,10 +12,16 @@ cdef object PyPickle_dumps = None
 cdef object PyPickle_loads = None
 cdef object PyPickle_PROTOCOL = None
 cdef object PyPickle_THRESHOLD = 1024**2 // 4  # 0.25 MiB
+cdef object PyPickle_COMPRESS = None
+cdef object PyPickle_COMPRESS_THRESHOLD = 1024**2 // 4  # 0.25 MiB
 
 from pickle import dumps as PyPickle_dumps
 from pickle import loads as PyPickle_loads
 from pickle import HIGHEST_PROTOCOL as PyPickle_PROTOCOL
+cdef object PyPickle_Pickler
+cdef object PyPickle_Unpickler
+from pickle import Pickler as PyPickle_Pickler
+from pickle import Unpickler as PyPickle_Unpickler
 
 if Py_GETENV(b"MPI4PY_PICKLE_PROTOCOL") != NULL:
     PyPickle_PROTOCOL = int(Py_GETENV(b"MPI4PY_PICKLE_PROTOCOL"))
@@ -23,6 +29,54 @@ if Py_GETENV(b"MPI4PY_PICKLE_PROTOCOL") != NULL:
 if Py_GETENV(b"MPI4PY_PICKLE_THRESHOLD") != NULL:
     PyPickle_THRESHOLD = int(Py_GETENV(b"MPI4PY_PICKLE_THRESHOLD"))
 
+# -----------------------------------------------------------------------------
+
+# Compressed pickle data streams start with a two-byte magic header
+# (the PROTO opcode followed by an invalid protocol version, thus not
+# a valid pickle data stream) followed by a one-byte codec identifier.
+
+cdef enum:
+    PICKLE_COMPRESS_HEADER = 3
+
+cdef bytes PyPickle_MAGIC = b"\x80\xff"
+
+cdef dict PyPickle_CODECS = {
+    'zlib': b'z',
+    'bz2':  b'b',
+    'lzma': b'x',
+}
+
+cdef dict PyPickle_CODEC_NAMES = {
+    ident[0]: name for name, ident in PyPickle_CODECS.items()
+}
+
+cdef dict PyPickle_CODEC_MODULES = {}
+
+cdef object pickle_codec_check(object codec):
+    if codec is None:
+        return None
+    if codec not in PyPickle_CODECS:
+        raise ValueError(f"unsupported compression codec {codec!r}")
+    return codec
+
+cdef object pickle_codec_module(object codec):
+    cdef object module = PyPickle_CODEC_MODULES.get(codec)
+    if module is None:
+        module = __import__(codec)
+        PyPickle_CODEC_MODULES[codec] = module
+    return module
+
+if Py_GETENV(b"MPI4PY_PICKLE_COMPRESS") != NULL:
+    PyPickle_COMPRESS = pystr(Py_GETENV(b"MPI4PY_PICKLE_COMPRESS")).lower()
+    if PyPickle_COMPRESS in ('', 'none'): PyPickle_COMPRESS = None
+    PyPickle_COMPRESS = pickle_codec_check(PyPickle_COMPRESS)
+
+if Py_GETENV(b"MPI4PY_PICKLE_COMPRESS_THRESHOLD") != NULL:
+    PyPickle_COMPRESS_THRESHOLD = int(
+        Py_GETENV(b"MPI4PY_PICKLE_COMPRESS_THRESHOLD"))
+
+# -----------------------------------------------------------------------------
+
 cdef class Pickle:
     """
     Pickle/unpickle Python objects.
@@ -32,6 +86,8 @@ cdef class Pickle:
     cdef object ob_loads
     cdef object ob_PROTO
     cdef object ob_THRES
+    cdef object ob_CODEC
+    cdef object ob_CTHRES
 
     def __cinit__(self, *args, **kwargs):
         <void> args    # unused
@@ -40,6 +96,8 @@ cdef class Pickle:
         self.ob_loads = PyPickle_loads
         self.ob_PROTO = PyPickle_PROTOCOL
         self.ob_THRES = PyPickle_THRESHOLD
+        self.ob_CODEC = PyPickle_COMPRESS
+        self.ob_CTHRES = PyPickle_COMPRESS_THRESHOLD
 
     def __init__(
         self,
@@ -47,6 +105,9 @@ cdef class Pickle:
         loads: Callable[[Buffer], Any] | None = None,
         protocol: int | None = None,
         threshold: int | None = None,
+        *,
+        compress: str | None = None,
+        compress_threshold: int | None = None,
     ) -> None:
         if dumps is None:
             dumps = PyPickle_dumps
@@ -57,10 +118,17 @@ cdef class Pickle:
                 protocol = PyPickle_PROTOCOL
         if threshold is None:
             threshold = PyPickle_THRESHOLD
+        if compress is None:
+            compress = PyPickle_COMPRESS
+        if compress_threshold is None:
+            compress_threshold = PyPickle_COMPRESS_THRESHOLD
+        compress = pickle_codec_check(compress)
         self.ob_dumps = dumps
         self.ob_loads = loads
         self.ob_PROTO = protocol
         self.ob_THRES = threshold
+        self.ob_CODEC = compress
+        self.ob_CTHRES = compress_threshold
 
     def dumps(
         self,
@@ -78,16 +146,20 @@ cdef class Pickle:
         """
         Deserialize object from pickle data stream.
         """
-        return cloads(self, data)
+        return cloads_data(self, data)
 
     def dumps_oob(
         self,
         obj: Any,
+        buffer_callback: Callable[[buffer], Any] | None = None,
     ) -> tuple[bytes, list[buffer]]:
         """
         Serialize object to pickle data stream and out-of-band buffers.
+
+        If *buffer_callback* is not `None`, it is called with each
+        out-of-band buffer as soon as it is produced by the pickler.
         """
-        return cdumps_oob(self, obj)
+        return cdumps_oob(self, obj, buffer_callback)
 
     def loads_oob(
         self,
@@ -120,23 +192,47 @@ cdef class Pickle:
                 threshold = PyPickle_THRESHOLD
             self.ob_THRES = threshold
 
+    property COMPRESS:
+        """Compression codec."""
+        def __get__(self) -> str | None:
+            return self.ob_CODEC
+
+        def __set__(self, compress: str | None):
+            self.ob_CODEC = pickle_codec_check(compress)
+
+    property COMPRESS_THRESHOLD:
+        """Compression threshold."""
+        def __get__(self) -> int:
+            return self.ob_CTHRES
+
+        def __set__(self, threshold: int | None):
+            if threshold is None:
+                threshold = PyPickle_COMPRESS_THRESHOLD
+            self.ob_CTHRES = threshold
+
 
 cdef Pickle PyMPI_PICKLE = Pickle()
 pickle = PyMPI_PICKLE
 
 # -----------------------------------------------------------------------------
 
-cdef object get_buffer_callback(list buffers, Py_ssize_t threshold):
+cdef object get_buffer_callback(
+    list buffers,
+    Py_ssize_t threshold,
+    object callback=None,
+):
     def buffer_callback(ob):
         cdef buffer buf = getbuffer(ob, 1, 0)
         if buf.view.len >= threshold:
             buffers.append(buf)
+            if callback is not None:
+                callback(buf)
             return False
         else:
             return True
     return buffer_callback
 
-cdef object cdumps_oob(Pickle pkl, object obj):
+cdef object cdumps_oob(Pickle pkl, object obj, object callback=None):
     cdef object pkl_dumps = pkl.ob_dumps
     cdef object protocol = pkl.ob_PROTO
     if protocol is None:
@@ -144,7 +240,7 @@ cdef object cdumps_oob(Pickle pkl, object obj):
     protocol = max(protocol, 5)
     cdef list buffers = []
     cdef Py_ssize_t threshold = pkl.ob_THRES
-    cdef object buf_cb = get_buffer_callback(buffers, threshold)
+    cdef object buf_cb = get_buffer_callback(buffers, threshold, callback)
     cdef object data = pkl_dumps(obj, protocol, buffer_callback=buf_cb)
     return data, buffers
 
@@ -154,15 +250,50 @@ cdef object cloads_oob(Pickle pkl, object data, object buffers):
 
 # -----------------------------------------------------------------------------
 
+cdef object ccompress(Pickle pkl, object data):
+    cdef Py_ssize_t n = PyBytes_Size(data)
+    if n < pkl.ob_CTHRES: return data
+    cdef object codec = pkl.ob_CODEC
+    cdef object cdata = pickle_codec_module(codec).compress(data)
+    if PyBytes_Size(cdata) + PICKLE_COMPRESS_HEADER >= n: return data
+    return b''.join((PyPickle_MAGIC, PyPickle_CODECS[codec], cdata))
+
+cdef inline bint is_compressed(void *p, MPI_Aint n) noexcept nogil:
+    cdef unsigned char *q = <unsigned char*>p
+    if n < PICKLE_COMPRESS_HEADER: return 0
+    return q[0] == 0x80 and q[1] == 0xff
+
+cdef object cdecompress(void *p, MPI_Aint n):
+    cdef char ident = (<char*>p)[2]
+    cdef object codec = PyPickle_CODEC_NAMES.get(ident)
+    if codec is None:
+        raise ValueError(f"unknown compression codec identifier {ident!r}")
+    cdef object cdata = mpibuf(<char*>p + PICKLE_COMPRESS_HEADER,
+                               n - PICKLE_COMPRESS_HEADER)
+    return pickle_codec_module(codec).decompress(cdata)
+
 cdef object cdumps(Pickle pkl, object obj):
+    cdef object data
     if pkl.ob_PROTO is not None:
-        return pkl.ob_dumps(obj, pkl.ob_PROTO)
+        data = pkl.ob_dumps(obj, pkl.ob_PROTO)
     else:
-        return pkl.ob_dumps(obj)
+        data = pkl.ob_dumps(obj)
+    if pkl.ob_CODEC is not None:
+        data = ccompress(pkl, data)
+    return data
 
 cdef object cloads(Pickle pkl, object buf):
     return pkl.ob_loads(buf)
 
+cdef object cloads_data(Pickle pkl, object data):
+    cdef void *p = NULL
+    cdef MPI_Aint n = 0
+    cdef object buf = asbuffer_r(data, &p, &n)
+    if is_compressed(p, n):
+        data = cdecompress(p, n)
+    <void> buf
+    return cloads(pkl, data)
+
 
 cdef object pickle_dump(Pickle pkl, object obj, void **p, MPI_Count *n):
     cdef object buf = cdumps(pkl, obj)
@@ -170,10 +301,162 @@ cdef object pickle_dump(Pickle pkl, object obj, void **p, MPI_Count *n):
     n[0] = PyBytes_Size(buf)
     return buf
 
-cdef object pickle_load(Pickle pkl, void *p, MPI_Count n):
+cdef object pickle_load(Pickle pkl, void *p, MPI_Count n,
+                        object owner=None):
     if p == NULL or n == 0: return None
+    if is_oob(p, <MPI_Aint>n):
+        return pickle_load_oob(pkl, p, n, pickle_detach(owner))
+    if is_compressed(p, <MPI_Aint>n):
+        return cloads(pkl, cdecompress(p, <MPI_Aint>n))
     return cloads(pkl, mpibuf(p, n))
 
+# -----------------------------------------------------------------------------
+
+# Out-of-band pickle data streams start with the magic header followed
+# by a one-byte identifier and padding up to eight bytes, the number of
+# out-of-band buffers, the size of the in-band pickle data, the sizes of
+# the out-of-band buffers, the in-band pickle data, and the out-of-band
+# buffers at aligned offsets. Senders describe the stream with a derived
+# datatype addressing the memory of the pickled objects, the stream is
+# transferred in a single message without copying the buffers.
+
+cdef enum:
+    PICKLE_OOB_HEADER = 8
+    PICKLE_OOB_ALIGN = 16
+
+cdef bytes PyPickle_OOB = PyPickle_MAGIC + b"+" + bytes(5)
+cdef bytes PyPickle_OOB_PAD = bytes(PICKLE_OOB_ALIGN)
+
+cdef inline bint is_oob(void *p, MPI_Aint n) noexcept nogil:
+    cdef unsigned char *q = <unsigned char*>p
+    if n < PICKLE_OOB_HEADER: return 0
+    return q[0] == 0x80 and q[1] == 0xff and q[2] == 0x2b
+
+cdef inline MPI_Count oob_pad(MPI_Count n) noexcept nogil:
+    return (-n) & (PICKLE_OOB_ALIGN - 1)
+
+cdef inline bint pickle_use_oob(Pickle pkl) noexcept:
+    return options.pickle_oob and pkl.ob_dumps is PyPickle_dumps
+
+
+@cython.final
+@cython.internal
+cdef class _p_oob:
+
+    cdef object data
+    cdef list   buffers
+    cdef MPI_Datatype datatype
+
+    def __cinit__(self):
+        self.datatype = MPI_DATATYPE_NULL
+
+    def __dealloc__(self):
+        if self.datatype == MPI_DATATYPE_NULL: return
+        if not mpi_active(): return
+        <void>MPI_Type_free(&self.datatype)
+
+    cdef int setup(self, object data, list buffers) except -1:
+        cdef Py_ssize_t i, m = len(buffers)
+        cdef MPI_Count *sizes = NULL
+        cdef object mem = allocate(m + 2, sizeof(MPI_Count), &sizes)
+        sizes[0] = m
+        sizes[1] = PyBytes_Size(data)
+        for i in range(m):
+            sizes[i + 2] = (<buffer>buffers[i]).view.len
+        cdef MPI_Count head = PICKLE_OOB_HEADER
+        head += (m + 2) * <MPI_Count>sizeof(MPI_Count) + sizes[1]
+        self.data = b''.join((
+            PyPickle_OOB, mem, data,
+            PyPickle_OOB_PAD[:oob_pad(head)],
+        ))
+        self.buffers = buffers
+        #
+        cdef char *pad = PyBytes_AsString(PyPickle_OOB_PAD)
+        cdef MPI_Count *blocks = NULL
+        cdef MPI_Count *displs = NULL
+        cdef MPI_Aint addr = 0
+        cdef object mem1 = allocate(2 * m + 1, sizeof(MPI_Count), &blocks)
+        cdef object mem2 = allocate(2 * m + 1, sizeof(MPI_Count), &displs)
+        cdef MPI_Count k = 0
+        blocks[k] = PyBytes_Size(self.data)
+        CHKERR( MPI_Get_address(PyBytes_AsString(self.data), &addr) )
+        displs[k] = addr; k += 1
+        for i in range(m):
+            blocks[k] = sizes[i + 2]
+            CHKERR( MPI_Get_address((<buffer>buffers[i]).view.buf, &addr) )
+            displs[k] = addr; k += 1
+            if i + 1 < m and oob_pad(sizes[i + 2]) > 0:
+                blocks[k] = oob_pad(sizes[i + 2])
+                CHKERR( MPI_Get_address(pad, &addr) )
+                displs[k] = addr; k += 1
+        CHKERR( MPI_Type_create_hindexed_c(
+            k, blocks, displs, MPI_BYTE, &self.datatype) )
+        CHKERR( MPI_Type_commit(&self.datatype) )
+        return 0
+
+
+cdef object pickle_dump_oob(Pickle pkl, object obj,
+                            void **p, MPI_Count *n, MPI_Datatype *t):
+    if not pickle_use_oob(pkl):
+        return pickle_dump(pkl, obj, p, n)
+    cdef object data, buffers
+    data, buffers = cdumps_oob(pkl, obj)
+    if not buffers:
+        if pkl.ob_CODEC is not None:
+            data = ccompress(pkl, data)
+        p[0] = PyBytes_AsString(data)
+        n[0] = PyBytes_Size(data)
+        return data
+    cdef _p_oob ob = _p_oob.__new__(_p_oob)
+    ob.setup(data, buffers)
+    p[0] = MPI_BOTTOM
+    n[0] = 1
+    t[0] = ob.datatype
+    return ob
+
+cdef inline MPI_Count pickle_size(MPI_Count n, MPI_Datatype t) except -1:
+    if t == MPI_BYTE: return n
+    cdef MPI_Count size = 0
+    CHKERR( MPI_Type_size_c(t, &size) )
+    return n * size
+
+cdef object pickle_detach(object owner):
+    # take over the memory of arena blocks, which are
+    # not returned to the arena once emptied
+    if type(owner) is not _PyMem: return owner
+    cdef _PyMem mem = <_PyMem> owner
+    cdef _PyMem ob = <_PyMem> New(_PyMem)
+    ob.buf, ob.len, ob.free = mem.buf, mem.len, mem.free
+    mem.buf, mem.len, mem.free = NULL, 0, NULL
+    return tobuffer(ob, ob.buf, ob.len, 0)
+
+cdef object pickle_load_oob(Pickle pkl, void *p, MPI_Count n,
+                            object owner=None):
+    cdef char *q = <char*>p + PICKLE_OOB_HEADER
+    cdef MPI_Count i, m = 0, size = 0
+    if n >= PICKLE_OOB_HEADER + 2 * <MPI_Count>sizeof(MPI_Count):
+        <void>memcpy(&m, q, sizeof(MPI_Count))
+        <void>memcpy(&size, q + sizeof(MPI_Count), sizeof(MPI_Count))
+    cdef MPI_Count offset = PICKLE_OOB_HEADER
+    offset += (m + 2) * <MPI_Count>sizeof(MPI_Count)
+    if m <= 0 or size < 0 or offset + size > n:
+        raise ValueError("invalid out-of-band pickle data")
+    cdef object data = mpibuf(<char*>p + offset, size)
+    offset += size
+    cdef list buffers = []
+    for i in range(m):
+        offset += oob_pad(offset)
+        <void>memcpy(&size, q + (i + 2) * sizeof(MPI_Count), sizeof(MPI_Count))
+        if size < 0 or offset + size > n:
+            raise ValueError("invalid out-of-band pickle data")
+        if owner is None:
+            buffers.append(bytearray(mpibuf(<char*>p + offset, size)))
+        else:
+            buffers.append(tobuffer(owner, <char*>p + offset, size, 0))
+        offset += size
+    return cloads_oob(pkl, data, buffers)
+
+# -----------------------------------------------------------------------------
 
 cdef object pickle_dumpv(
     Pickle pkl, object obj,
@@ -200,26 +483,39 @@ cdef object pickle_dumpv(
 cdef object pickle_loadv(
     Pickle pkl,
     void *p, int n, MPI_Count cnt[], MPI_Aint dsp[],
+    object owner=None,
 ):
     cdef Py_ssize_t m = n
     cdef object items = [None] * m
     if p == NULL: return items
     for i in range(m):
-        items[i] = pickle_load(pkl, <char*>p + dsp[i], cnt[i])
+        if is_oob(<char*>p + dsp[i], <MPI_Aint>cnt[i]):
+            owner = pickle_detach(owner)
+            break
+    for i in range(m):
+        items[i] = pickle_load(pkl, <char*>p + dsp[i], cnt[i], owner)
     return items
 
 
-cdef object pickle_alloc(void **p, MPI_Count n):
+cdef object pickle_alloc(void **p, MPI_Count n, object arena=None):
+    if arena is not None:
+        return (<_p_arena>arena).acquire(p, n)
     cdef object buf = PyBytes_FromStringAndSize(NULL, <MPI_Aint>n)
     p[0] = PyBytes_AsString(buf)
     return buf
 
-cdef object pickle_allocv(void **p, int n, MPI_Count cnt[], MPI_Aint dsp[]):
+cdef object pickle_allocv(void **p, int n, MPI_Count cnt[], MPI_Aint dsp[],
+                          object arena=None):
     cdef MPI_Count d=0
     for i in range(n):
         dsp[i] = <MPI_Aint> d
         d += cnt[i]
-    return pickle_alloc(p, d)
+    return pickle_alloc(p, d, arena)
+
+cdef int pickle_release(object arena, object buf) except -1:
+    if arena is not None:
+        (<_p_arena>arena).release(buf)
+    return 0
 
 
 cdef object allocate_count_displ(int n, MPI_Count **p, MPI_Aint **q):
@@ -229,6 +525,233 @@ cdef object allocate_count_displ(int n, MPI_Count **p, MPI_Aint **q):
 
 # -----------------------------------------------------------------------------
 
+cdef enum:
+    ARENA_MIN_BLOCK = 4096
+
+
+@cython.final
+@cython.internal
+cdef class _p_arena:
+
+    cdef object lock
+    cdef dict   pool
+    cdef MPI_Count size
+    cdef MPI_Count limit
+
+    def __cinit__(self, MPI_Count limit):
+        self.lock  = Lock()
+        self.pool  = {}
+        self.size  = 0
+        self.limit = limit
+
+    cdef object acquire(self, void **p, MPI_Count n):
+        if n > self.limit:
+            return pickle_alloc(p, n)
+        cdef MPI_Count block = ARENA_MIN_BLOCK
+        while block < n: block <<= 1
+        cdef list blocks
+        cdef _PyMem mem = None
+        with self.lock:
+            blocks = self.pool.get(block)
+            if blocks:
+                mem = <_PyMem> blocks.pop()
+                self.size -= block
+        if mem is None:
+            mem = allocate(<Py_ssize_t>block, 1, NULL)
+        p[0] = mem.buf
+        return mem
+
+    cdef int release(self, object buf) except -1:
+        if type(buf) is not _PyMem: return 0
+        cdef _PyMem mem = <_PyMem> buf
+        if mem.buf == NULL: return 0
+        cdef MPI_Count block = mem.len
+        cdef list blocks
+        if block > self.limit: return 0
+        with self.lock:
+            for blocks in self.pool.values():
+                while blocks and self.size + block > self.limit:
+                    self.size -= (<_PyMem> blocks.pop(0)).len
+            self.pool.setdefault(block, []).append(mem)
+            self.size += block
+        return 0
+
+
+cdef int    commarena_keyval   = MPI_KEYVAL_INVALID
+cdef object commarena_lock     = Lock()
+cdef dict   commarena_registry = {}
+
+
+cdef inline int commarena_free_cb(
+    MPI_Comm comm,
+) except MPI_ERR_UNKNOWN with gil:
+    cdef object key = <Py_uintptr_t>comm
+    with commarena_lock:
+        if key in commarena_registry:
+            del commarena_registry[key]
+    return MPI_SUCCESS
+
+
+@cython.linetrace(False)
+@cython.callspec("MPIAPI")
+cdef int commarena_free_fn(
+    MPI_Comm comm,
+    int keyval,
+    void *attrval,
+    void *xstate,
+) noexcept nogil:
+    <void> keyval   # unused
+    <void> attrval  # unused
+    <void> xstate   # unused
+    if comm == MPI_COMM_SELF:  <void>MPI_Comm_free_keyval(&commarena_keyval)
+    if not Py_IsInitialized(): return MPI_SUCCESS
+    if not py_module_alive():  return MPI_SUCCESS
+    return commarena_free_cb(comm)
+
+
+cdef inline _p_arena commarena_lookup(MPI_Comm comm):
+    cdef int found = 0
+    cdef void *attrval = NULL
+    cdef _p_arena arena
+    if commarena_keyval == MPI_KEYVAL_INVALID:
+        CHKERR( MPI_Comm_create_keyval(
+            MPI_COMM_NULL_COPY_FN,
+            commarena_free_fn,
+            &commarena_keyval, NULL) )
+        arena = _p_arena.__new__(_p_arena, options.recv_arena)
+        CHKERR( MPI_Comm_set_attr(
+            MPI_COMM_SELF, commarena_keyval, <void*> arena) )
+        commarena_registry[<Py_uintptr_t>MPI_COMM_SELF] = arena
+    CHKERR( MPI_Comm_get_attr(
+        comm, commarena_keyval, &attrval, &found) )
+    if not found:
+        arena = _p_arena.__new__(_p_arena, options.recv_arena)
+        CHKERR( MPI_Comm_set_attr(
+            comm, commarena_keyval, <void*> arena) )
+        commarena_registry[<Py_uintptr_t>comm] = arena
+    elif PYPY:
+        arena = commarena_registry[<Py_uintptr_t>comm]  # ~> pypy
+    else:
+        arena = <_p_arena> attrval
+    return arena
+
+
+cdef inline object PyMPI_Arena(MPI_Comm comm):
+    if options.recv_arena <= 0: return None
+    with commarena_lock:
+        return commarena_lookup(comm)
+
+# -----------------------------------------------------------------------------
+
+cdef enum:
+    HIST_MIN_BLOCK = 64
+    HIST_MAX_COUNT = 32
+
+
+@cython.final
+@cython.internal
+cdef class _p_hist:
+
+    cdef object lock
+    cdef dict   bins
+    cdef MPI_Count count
+
+    def __cinit__(self):
+        self.lock  = Lock()
+        self.bins  = {}
+        self.count = 0
+
+    cdef MPI_Count estimate(self, MPI_Count default):
+        with self.lock:
+            if not self.bins: return default
+            return max(default, max(self.bins))
+
+    cdef int observe(self, MPI_Count n) except -1:
+        cdef MPI_Count block = HIST_MIN_BLOCK
+        while block < n: block <<= 1
+        cdef dict bins = self.bins
+        with self.lock:
+            bins[block] = bins.get(block, 0) + 1
+            self.count += 1
+            if self.count < HIST_MAX_COUNT: return 0
+            self.count = 0
+            for block, n in list(bins.items()):
+                if n > 1: bins[block] = n // 2
+                else: del bins[block]
+        return 0
+
+
+cdef int    commhist_keyval   = MPI_KEYVAL_INVALID
+cdef object commhist_lock     = Lock()
+cdef dict   commhist_registry = {}
+
+
+cdef inline int commhist_free_cb(
+    MPI_Comm comm,
+) except MPI_ERR_UNKNOWN with gil:
+    cdef object key = <Py_uintptr_t>comm
+    with commhist_lock:
+        if key in commhist_registry:
+            del commhist_registry[key]
+    return MPI_SUCCESS
+
+
+@cython.linetrace(False)
+@cython.callspec("MPIAPI")
+cdef int commhist_free_fn(
+    MPI_Comm comm,
+    int keyval,
+    void *attrval,
+    void *xstate,
+) noexcept nogil:
+    <void> keyval   # unused
+    <void> attrval  # unused
+    <void> xstate   # unused
+    if comm == MPI_COMM_SELF:  <void>MPI_Comm_free_keyval(&commhist_keyval)
+    if not Py_IsInitialized(): return MPI_SUCCESS
+    if not py_module_alive():  return MPI_SUCCESS
+    return commhist_free_cb(comm)
+
+
+cdef inline dict commhist_lookup(MPI_Comm comm):
+    cdef int found = 0
+    cdef void *attrval = NULL
+    cdef dict table
+    if commhist_keyval == MPI_KEYVAL_INVALID:
+        CHKERR( MPI_Comm_create_keyval(
+            MPI_COMM_NULL_COPY_FN,
+            commhist_free_fn,
+            &commhist_keyval, NULL) )
+        table = {}
+        CHKERR( MPI_Comm_set_attr(
+            MPI_COMM_SELF, commhist_keyval, <void*> table) )
+        commhist_registry[<Py_uintptr_t>MPI_COMM_SELF] = table
+    CHKERR( MPI_Comm_get_attr(
+        comm, commhist_keyval, &attrval, &found) )
+    if not found:
+        table = {}
+        CHKERR( MPI_Comm_set_attr(
+            comm, commhist_keyval, <void*> table) )
+        commhist_registry[<Py_uintptr_t>comm] = table
+    elif PYPY:
+        table = commhist_registry[<Py_uintptr_t>comm]  # ~> pypy
+    else:
+        table = <dict> attrval
+    return table
+
+
+cdef inline object PyMPI_Hist(MPI_Comm comm, int source, int tag):
+    if not options.irecv_adapt: return None
+    cdef dict table
+    cdef object key = (source, tag)
+    cdef _p_hist hist
+    with commhist_lock:
+        table = commhist_lookup(comm)
+        hist = table.get(key)
+        if hist is None:
+            hist = table[key] = _p_hist.__new__(_p_hist)
+    return hist
+
 cdef MPI_Status PyMPI_STATUS_INITIALIZER
 
 # -----------------------------------------------------------------------------
@@ -243,7 +766,7 @@ cdef object PyMPI_send(object obj, int dest, int tag,
     #
     cdef object unuseds = None
     if dest != MPI_PROC_NULL:
-        unuseds = pickle_dump(pickle, obj, &sbuf, &scount)
+        unuseds = pickle_dump_oob(pickle, obj, &sbuf, &scount, &stype)
     with nogil: CHKERR( MPI_Send_c(
         sbuf, scount, stype,
         dest, tag, comm) )
@@ -260,7 +783,7 @@ cdef object PyMPI_bsend(object obj, int dest, int tag,
     #
     cdef object unuseds = None
     if dest != MPI_PROC_NULL:
-        unuseds = pickle_dump(pickle, obj, &sbuf, &scount)
+        unuseds = pickle_dump_oob(pickle, obj, &sbuf, &scount, &stype)
     with nogil: CHKERR( MPI_Bsend_c(
         sbuf, scount, stype,
         dest, tag, comm) )
@@ -277,9 +800,10 @@ cdef object PyMPI_ssend(object obj, int dest, int tag,
     #
     cdef object unuseds = None
     if dest != MPI_PROC_NULL:
-        unuseds = pickle_dump(pickle, obj, &sbuf, &scount)
+        unuseds = pickle_dump_oob(pickle, obj, &sbuf, &scount, &stype)
     with nogil: CHKERR( MPI_Ssend_c(
-        sbuf, scount, stype, dest, tag, comm) )
+        sbuf, scount, stype,
+        dest, tag, comm) )
     return None
 
 # -----------------------------------------------------------------------------
@@ -293,6 +817,7 @@ cdef object PyMPI_recv_obarg(object obj, int source, int tag,
     cdef MPI_Datatype rtype = MPI_BYTE
     cdef MPI_Status rsts = PyMPI_STATUS_INITIALIZER
     cdef object   rmsg = None
+    cdef object   owner = None
     cdef MPI_Aint rlen = 0
     #
     PyErr_WarnFormat(
@@ -303,7 +828,7 @@ cdef object PyMPI_recv_obarg(object obj, int source, int tag,
     if source != MPI_PROC_NULL:
         if is_integral(obj):
             rcount = <MPI_Count> PyNumber_Index(obj)
-            rmsg = pickle_alloc(&rbuf, rcount)
+            rmsg = owner = pickle_alloc(&rbuf, rcount)
         else:
             rmsg = asbuffer_w(obj, &rbuf, &rlen)
             rcount = <MPI_Count> rlen
@@ -318,7 +843,7 @@ cdef object PyMPI_recv_obarg(object obj, int source, int tag,
             CHKERR( MPI_Get_count_c(status, rtype, &rcount) )
     #
     if rcount <= 0: return None
-    return pickle_load(pickle, rbuf, rcount)
+    return pickle_load(pickle, rbuf, rcount, owner)
 
 
 cdef object PyMPI_recv_match(object obj, int source, int tag,
@@ -331,18 +856,21 @@ cdef object PyMPI_recv_match(object obj, int source, int tag,
     #
     cdef MPI_Message match = MPI_MESSAGE_NULL
     cdef MPI_Status rsts = PyMPI_STATUS_INITIALIZER
+    cdef object arena = PyMPI_Arena(comm)
+    cdef object rmsg = None
     <void> obj  # unused
     #
     with nogil:
         CHKERR( MPI_Mprobe(source, tag, comm, &match, &rsts) )
         CHKERR( MPI_Get_count_c(&rsts, rtype, &rcount) )
-    cdef object unusedr = pickle_alloc(&rbuf, rcount)
+    cdef object unusedr = pickle_alloc(&rbuf, rcount, arena)
     with nogil:
         CHKERR( MPI_Mrecv_c(
             rbuf, rcount, rtype, &match, status) )
     #
-    if rcount <= 0: return None
-    return pickle_load(pickle, rbuf, rcount)
+    if rcount > 0: rmsg = pickle_load(pickle, rbuf, rcount, unusedr)
+    pickle_release(arena, unusedr)
+    return rmsg
 
 
 cdef object PyMPI_recv_probe(object obj, int source, int tag,
@@ -354,6 +882,8 @@ cdef object PyMPI_recv_probe(object obj, int source, int tag,
     cdef MPI_Datatype rtype = MPI_BYTE
     #
     cdef MPI_Status rsts = PyMPI_STATUS_INITIALIZER
+    cdef object arena = PyMPI_Arena(comm)
+    cdef object rmsg = None
     cdef object unusedr
     <void> obj  # unused
     #
@@ -363,14 +893,15 @@ cdef object PyMPI_recv_probe(object obj, int source, int tag,
             CHKERR( MPI_Get_count_c(&rsts, rtype, &rcount) )
             CHKERR( MPI_Status_get_source(&rsts, &source) )
             CHKERR( MPI_Status_get_tag(&rsts, &tag) )
-        unusedr = pickle_alloc(&rbuf, rcount)
+        unusedr = pickle_alloc(&rbuf, rcount, arena)
         with nogil:
             CHKERR( MPI_Recv_c(
                 rbuf, rcount, rtype,
                 source, tag, comm, status) )
     #
-    if rcount <= 0: return None
-    return pickle_load(pickle, rbuf, rcount)
+    if rcount > 0: rmsg = pickle_load(pickle, rbuf, rcount, unusedr)
+    pickle_release(arena, unusedr)
+    return rmsg
 
 
 cdef object PyMPI_recv(object obj, int source, int tag,
@@ -394,7 +925,7 @@ cdef object PyMPI_isend(object obj, int dest, int tag,
     #
     cdef object smsg = None
     if dest != MPI_PROC_NULL:
-        smsg = pickle_dump(pickle, obj, &sbuf, &scount)
+        smsg = pickle_dump_oob(pickle, obj, &sbuf, &scount, &stype)
     with nogil: CHKERR( MPI_Isend_c(
         sbuf, scount, stype,
         dest, tag, comm, request) )
@@ -411,7 +942,7 @@ cdef object PyMPI_ibsend(object obj, int dest, int tag,
     #
     cdef object smsg = None
     if dest != MPI_PROC_NULL:
-        smsg = pickle_dump(pickle, obj, &sbuf, &scount)
+        smsg = pickle_dump_oob(pickle, obj, &sbuf, &scount, &stype)
     with nogil: CHKERR( MPI_Ibsend_c(
         sbuf, scount, stype,
         dest, tag, comm, request) )
@@ -428,7 +959,7 @@ cdef object PyMPI_issend(object obj, int dest, int tag,
     #
     cdef object smsg = None
     if dest != MPI_PROC_NULL:
-        smsg = pickle_dump(pickle, obj, &sbuf, &scount)
+        smsg = pickle_dump_oob(pickle, obj, &sbuf, &scount, &stype)
     with nogil: CHKERR( MPI_Issend_c(
         sbuf, scount, stype,
         dest, tag, comm, request) )
@@ -443,10 +974,25 @@ cdef object PyMPI_irecv(object obj, int source, int tag,
     cdef MPI_Count rcount = 0
     cdef MPI_Datatype rtype = MPI_BYTE
     #
+    cdef int flag = 0
+    cdef MPI_Message match = MPI_MESSAGE_NULL
+    cdef MPI_Status rsts = PyMPI_STATUS_INITIALIZER
+    cdef object hist = None
+    cdef bint owned = 1
+    #
     cdef object rmsg = None
     if source != MPI_PROC_NULL:
         if obj is None:
             rcount = options.irecv_bufsz
+            hist = PyMPI_Hist(comm, source, tag)
+            if hist is not None and options.recv_mprobe:
+                with nogil:
+                    CHKERR( MPI_Improbe(
+                        source, tag, comm, &flag, &match, &rsts) )
+                    if flag:
+                        CHKERR( MPI_Get_count_c(&rsts, rtype, &rcount) )
+            if hist is not None and not flag:
+                rcount = (<_p_hist>hist).estimate(rcount)
             obj = pickle_alloc(&rbuf, rcount)
             rmsg = asbuffer_r(obj, NULL, NULL)
         elif is_integral(obj):
@@ -456,10 +1002,17 @@ cdef object PyMPI_irecv(object obj, int source, int tag,
         else:
             rmsg = asbuffer_w(obj, &rbuf, &rlen)
             rcount = <MPI_Count> rlen
-        rmsg = PyMPI_wrap_buffer(<buffer>rmsg)
-    with nogil: CHKERR( MPI_Irecv_c(
-        rbuf, rcount, rtype,
-        source, tag, comm, request) )
+            owned = 0
+        rmsg = PyMPI_wrap_buffer(<buffer>rmsg, owned)
+        (<_p_req_buf>rmsg).hist = hist
+    if flag:
+        with nogil: CHKERR( MPI_Imrecv_c(
+            rbuf, rcount, rtype,
+            &match, request) )
+    else:
+        with nogil: CHKERR( MPI_Irecv_c(
+            rbuf, rcount, rtype,
+            source, tag, comm, request) )
     return rmsg
 
 # -----------------------------------------------------------------------------
@@ -475,15 +1028,210 @@ cdef object PyMPI_sendrecv(object sobj, int dest,   int sendtag,
 
 # -----------------------------------------------------------------------------
 
+# Persistent requests always transfer a full buffer, whose capacity is
+# tracked identically at both ends. The buffer starts with the size of
+# the pickle data stream, followed by the data as long as it fits. The
+# data is pickled directly into the buffer. Larger data streams follow
+# in a separate message, and both ends grow the capacity for subsequent
+# messages. These messages can only be received by persistent requests.
+
+cdef enum:
+    PREQ_MIN_CAPACITY = 4096
+    PREQ_PREFIX = sizeof(MPI_Count)
+
+cdef inline MPI_Count preq_capacity(MPI_Count n) noexcept nogil:
+    cdef MPI_Count block = PREQ_MIN_CAPACITY
+    while block < n: block <<= 1
+    return block
+
+
+@cython.final
+@cython.internal
+cdef class _p_preq_send:
+
+    cdef MPI_Comm  comm
+    cdef int       dest
+    cdef int       tag
+    cdef _PyMem    buf
+    cdef MPI_Count capacity
+    cdef MPI_Count count
+    cdef list      chunks
+    cdef object    data
+    cdef MPI_Request request
+
+    def __cinit__(self):
+        self.comm = MPI_COMM_NULL
+        self.dest = MPI_PROC_NULL
+        self.tag  = MPI_ANY_TAG
+        self.buf  = None
+        self.capacity = PREQ_MIN_CAPACITY
+        self.count = 0
+        self.chunks = None
+        self.data = None
+        self.request = MPI_REQUEST_NULL
+
+    cdef int init(self, MPI_Request *request) except -1:
+        if request[0] != MPI_REQUEST_NULL:
+            CHKERR( MPI_Request_free(request) )
+        self.buf = allocate(<Py_ssize_t>self.capacity, 1, NULL)
+        with nogil: CHKERR( MPI_Send_init_c(
+            self.buf.buf, self.capacity, MPI_BYTE,
+            self.dest, self.tag, self.comm, request) )
+        return 0
+
+    def write(self, data):
+        cdef buffer buf = getbuffer(data, 1, 0)
+        cdef MPI_Count count = buf.view.len
+        cdef char *p = <char*>self.buf.buf
+        if self.chunks is None:
+            if self.count + count <= self.capacity:
+                <void>memcpy(p + self.count, buf.view.buf, <size_t>count)
+                self.count += count
+                return count
+            self.chunks = [PyBytes_FromStringAndSize(
+                p + PREQ_PREFIX, <Py_ssize_t>(self.count - PREQ_PREFIX))]
+        self.chunks.append(bytes(buf))
+        self.count += count
+        return count
+
+    cdef int dump(self, object obj) except -1:
+        cdef Pickle pkl = PyMPI_PICKLE
+        cdef object protocol = pkl.ob_PROTO
+        if protocol is None:
+            protocol = PyPickle_PROTOCOL
+        self.count = PREQ_PREFIX
+        self.chunks = None
+        if pkl.ob_dumps is PyPickle_dumps and pkl.ob_CODEC is None:
+            PyPickle_Pickler(self, protocol).dump(obj)
+        else:
+            self.write(cdumps(pkl, obj))
+        return 0
+
+    cdef int start(self, object obj, MPI_Request *request) except -1:
+        if self.dest == MPI_PROC_NULL:
+            with nogil: CHKERR( MPI_Start(request) )
+            return 0
+        if self.buf.len < self.capacity:
+            self.init(request)
+        self.dump(obj)
+        cdef MPI_Count size = self.count - PREQ_PREFIX
+        <void>memcpy(self.buf.buf, &size, sizeof(MPI_Count))
+        with nogil: CHKERR( MPI_Start(request) )
+        cdef void *sbuf = NULL
+        if self.chunks is not None:
+            self.data = b''.join(self.chunks)
+            self.chunks = None
+            self.capacity = preq_capacity(self.count)
+            sbuf = PyBytes_AsString(self.data)
+            with nogil: CHKERR( MPI_Isend_c(
+                sbuf, size, MPI_BYTE,
+                self.dest, self.tag, self.comm, &self.request) )
+        return 0
+
+    cdef object load(self):
+        if self.request != MPI_REQUEST_NULL:
+            with nogil: CHKERR( MPI_Wait(&self.request, MPI_STATUS_IGNORE) )
+        self.data = None
+        return None
+
+
+@cython.final
+@cython.internal
+cdef class _p_preq_recv:
+
+    cdef MPI_Comm  comm
+    cdef int       source
+    cdef int       tag
+    cdef _PyMem    buf
+    cdef MPI_Count capacity
+
+    def __cinit__(self):
+        self.comm = MPI_COMM_NULL
+        self.source = MPI_PROC_NULL
+        self.tag = MPI_ANY_TAG
+        self.buf = None
+        self.capacity = PREQ_MIN_CAPACITY
+
+    cdef int init(self, MPI_Request *request) except -1:
+        if request[0] != MPI_REQUEST_NULL:
+            CHKERR( MPI_Request_free(request) )
+        self.buf = allocate(<Py_ssize_t>self.capacity, 1, NULL)
+        with nogil: CHKERR( MPI_Recv_init_c(
+            self.buf.buf, self.capacity, MPI_BYTE,
+            self.source, self.tag, self.comm, request) )
+        return 0
+
+    cdef int start(self, MPI_Request *request) except -1:
+        if self.buf.len < self.capacity:
+            self.init(request)
+        with nogil: CHKERR( MPI_Start(request) )
+        return 0
+
+    cdef object load(self, MPI_Status *status):
+        cdef Pickle pickle = PyMPI_PICKLE
+        cdef MPI_Count rcount = 0, size = 0
+        CHKERR( MPI_Get_count_c(status, MPI_BYTE, &rcount) )
+        if rcount <= 0: return None
+        if rcount < PREQ_PREFIX:
+            raise ValueError("invalid persistent request message")
+        <void>memcpy(&size, self.buf.buf, sizeof(MPI_Count))
+        if PREQ_PREFIX + size <= rcount:
+            return pickle_load(pickle, <char*>self.buf.buf + PREQ_PREFIX, size)
+        cdef int source = MPI_ANY_SOURCE, tag = MPI_ANY_TAG
+        CHKERR( MPI_Status_get_source(status, &source) )
+        CHKERR( MPI_Status_get_tag(status, &tag) )
+        self.capacity = preq_capacity(PREQ_PREFIX + size)
+        cdef void *rbuf = NULL
+        cdef object unusedr = pickle_alloc(&rbuf, size)
+        with nogil: CHKERR( MPI_Recv_c(
+            rbuf, size, MPI_BYTE,
+            source, tag, self.comm, MPI_STATUS_IGNORE) )
+        return pickle_load(pickle, rbuf, size, unusedr)
+
+
+cdef object PyMPI_send_init(int dest, int tag,
+                            MPI_Comm comm, MPI_Request *request):
+    cdef _p_preq_send state = _p_preq_send.__new__(_p_preq_send)
+    state.comm = comm
+    state.dest = dest
+    state.tag  = tag
+    state.init(request)
+    return state
+
+
+cdef object PyMPI_recv_init(int source, int tag,
+                            MPI_Comm comm, MPI_Request *request):
+    cdef _p_preq_recv state = _p_preq_recv.__new__(_p_preq_recv)
+    state.comm = comm
+    state.source = source
+    state.tag = tag
+    state.init(request)
+    return state
+
+
+cdef int PyMPI_start(object ob, object obj,
+                     MPI_Request *request) except -1:
+    if type(ob) is _p_preq_send:
+        return (<_p_preq_send>ob).start(obj, request)
+    if type(ob) is _p_preq_recv:
+        return (<_p_preq_recv>ob).start(request)
+    with nogil: CHKERR( MPI_Start(request) )
+    return 0
+
+# -----------------------------------------------------------------------------
+
 
 @cython.final
 @cython.internal
 cdef class _p_req_buf:
     cdef buffer buf
+    cdef object hist
+    cdef bint   owned
 
-cdef inline object PyMPI_wrap_buffer(buffer buf):
+cdef inline object PyMPI_wrap_buffer(buffer buf, bint owned=0):
     cdef _p_req_buf ob = _p_req_buf.__new__(_p_req_buf)
     ob.buf = buf
+    ob.owned = owned
     return ob
 
 cdef inline object PyMPI_load_buffer(_p_req_buf ob, MPI_Status *status):
@@ -491,9 +1239,12 @@ cdef inline object PyMPI_load_buffer(_p_req_buf ob, MPI_Status *status):
     cdef MPI_Datatype rtype = MPI_BYTE
     CHKERR( MPI_Get_count_c(status, rtype, &rcount) )
     if rcount <= 0: return None
+    if ob.hist is not None:
+        (<_p_hist>ob.hist).observe(rcount)
     cdef Pickle pickle = PyMPI_PICKLE
     cdef void *rbuf = ob.buf.view.buf
-    return pickle_load(pickle, rbuf, rcount)
+    cdef object owner = ob.buf if ob.owned else None
+    return pickle_load(pickle, rbuf, rcount, owner)
 
 
 @cython.final
@@ -515,6 +1266,12 @@ cdef inline object PyMPI_load(object ob, MPI_Status *status):
         return PyMPI_load_buffer(<_p_req_buf>ob, status)
     if type(ob) is _p_req_obj:
         return PyMPI_load_object(<_p_req_obj>ob)
+    if type(ob) is _p_req_coll:
+        return PyMPI_load_coll(<_p_req_coll>ob)
+    if type(ob) is _p_preq_recv:
+        return (<_p_preq_recv>ob).load(status)
+    if type(ob) is _p_preq_send:
+        return (<_p_preq_send>ob).load()
     return None
 
 # -----------------------------------------------------------------------------
@@ -523,6 +1280,7 @@ cdef object PyMPI_wait(Request request, Status status):
     cdef _p_rs rs = _p_rs.__new__(_p_rs)
     rs.set_request(request)
     rs.set_status(status)
+    PyMPI_progress(request.ob_buf, 1)
     with nogil: CHKERR( MPI_Wait(&request.ob_mpi, rs.status) )
     return rs.get_result()
 
@@ -530,6 +1288,7 @@ cdef object PyMPI_test(Request request, int *flag, Status status):
     cdef _p_rs rs = _p_rs.__new__(_p_rs)
     rs.set_request(request)
     rs.set_status(status)
+    PyMPI_progress(request.ob_buf, 0)
     with nogil: CHKERR( MPI_Test(&request.ob_mpi, flag, rs.status) )
     if not flag[0]:
         return None
@@ -540,9 +1299,15 @@ cdef object PyMPI_waitany(requests, int *index, Status status):
     rs.acquire(requests)
     rs.set_status(status)
     cdef object obj = None
+    cdef int flag = 0
     try:
-        with nogil: CHKERR( MPI_Waitany(
-            rs.count, rs.requests, index, rs.status) )
+        while PyMPI_progress_all(requests, 0):
+            with nogil: CHKERR( MPI_Testany(
+                rs.count, rs.requests, index, &flag, rs.status) )
+            if flag: break
+        else:
+            with nogil: CHKERR( MPI_Waitany(
+                rs.count, rs.requests, index, rs.status) )
         if index[0] != MPI_UNDEFINED:
             obj = rs.get_object(index[0])
     finally:
@@ -555,6 +1320,7 @@ cdef object PyMPI_testany(requests, int *index, int *flag, Status status):
     rs.set_status(status)
     cdef object obj = None
     try:
+        PyMPI_progress_all(requests, 0)
         with nogil: CHKERR( MPI_Testany(
             rs.count, rs.requests, index, flag, rs.status) )
         if index[0] != MPI_UNDEFINED and flag[0]:
@@ -569,6 +1335,7 @@ cdef object PyMPI_waitall(requests, statuses):
     rs.add_statuses()
     cdef object objects = None
     try:
+        PyMPI_progress_all(requests, 1)
         with nogil: CHKERR( MPI_Waitall(
             rs.count, rs.requests, rs.statuses) )
         objects = rs.get_objects()
@@ -582,6 +1349,7 @@ cdef object PyMPI_testall(requests, int *flag, statuses):
     rs.add_statuses()
     cdef object objects = None
     try:
+        PyMPI_progress_all(requests, 0)
         with nogil: CHKERR( MPI_Testall(
             rs.count, rs.requests, flag, rs.statuses) )
         if flag[0]:
@@ -598,8 +1366,13 @@ cdef object PyMPI_waitsome(requests, statuses):
     cdef object indices = None
     cdef object objects = None
     try:
-        with nogil: CHKERR( MPI_Waitsome(
-            rs.count, rs.requests, &rs.outcount, rs.indices, rs.statuses) )
+        while PyMPI_progress_all(requests, 0):
+            with nogil: CHKERR( MPI_Testsome(
+                rs.count, rs.requests, &rs.outcount, rs.indices, rs.statuses) )
+            if rs.outcount != 0: break
+        else:
+            with nogil: CHKERR( MPI_Waitsome(
+                rs.count, rs.requests, &rs.outcount, rs.indices, rs.statuses) )
         indices = rs.get_indices()
         objects = rs.get_objects()
     finally:
@@ -614,6 +1387,7 @@ cdef object PyMPI_testsome(requests, statuses):
     cdef object indices = None
     cdef object objects = None
     try:
+        PyMPI_progress_all(requests, 0)
         with nogil: CHKERR( MPI_Testsome(
             rs.count, rs.requests, &rs.outcount, rs.indices, rs.statuses) )
         indices = rs.get_indices()
@@ -678,7 +1452,7 @@ cdef object PyMPI_mrecv(object rmsg,
     cdef MPI_Count rcount = <MPI_Count> rlen
     with nogil: CHKERR( MPI_Mrecv_c(
         rbuf, rcount, rtype, message, status) )
-    rmsg = pickle_load(pickle, rbuf, rcount)
+    rmsg = pickle_load(pickle, rbuf, rcount, rmsg)
     return rmsg
 
 cdef object PyMPI_imrecv(object rmsg,
@@ -695,7 +1469,7 @@ cdef object PyMPI_imrecv(object rmsg,
     else:
         rmsg = asbuffer_w(rmsg, &rbuf, &rlen)  # ~> unreachable
     if rmsg is not None:
-        rmsg = PyMPI_wrap_buffer(<buffer>rmsg)
+        rmsg = PyMPI_wrap_buffer(<buffer>rmsg, 1)
     cdef MPI_Count rcount = <MPI_Count> rlen
     with nogil: CHKERR( MPI_Imrecv_c(
         rbuf, rcount, rtype, message, request) )
@@ -708,12 +1482,330 @@ cdef object PyMPI_barrier(MPI_Comm comm):
     return None
 
 
+# Broadcasts of objects proceed in units, each one announced by a
+# header holding the unit kind, its size, and the segment size. The
+# root either sends the complete pickle data stream in a single raw
+# unit, or streams the in-band data and the out-of-band buffers in
+# units as the pickler produces them, followed by an end (or abort)
+# unit. Unit payloads are broadcast in segments through a small window
+# of in-flight requests, bounding the memory held at any time.
+
+cdef enum:
+    BCAST_WINDOW = 4
+    BCAST_RAW    = 0
+    BCAST_DATA   = 1
+    BCAST_OOB    = 2
+    BCAST_END    = 3
+    BCAST_ABORT  = 4
+
+
+@cython.final
+@cython.internal
+cdef class _p_bcast:
+
+    cdef MPI_Comm  comm
+    cdef int       root
+    cdef MPI_Count segsz
+    cdef MPI_Count head
+    cdef MPI_Count tail
+    cdef MPI_Request requests[BCAST_WINDOW]
+    cdef list      pinned
+    cdef bytearray pending
+    cdef list      chunks
+    cdef list      bufs
+    cdef list      units
+    cdef list      stash
+    cdef bint      done
+    cdef object    data
+    cdef Py_ssize_t pos
+
+    def __cinit__(self):
+        self.comm = MPI_COMM_NULL
+        self.root = MPI_PROC_NULL
+        self.segsz = 0
+        self.head = 0
+        self.tail = 0
+        for i in range(BCAST_WINDOW):
+            self.requests[i] = MPI_REQUEST_NULL
+        self.pinned = [None] * BCAST_WINDOW
+        self.pending = bytearray()
+        self.chunks = []
+        self.bufs = []
+        self.units = []
+        self.stash = []
+        self.done = 0
+        self.data = b''
+        self.pos = 0
+
+    cdef int header(self, MPI_Count *kind, MPI_Count *count) except -1:
+        cdef MPI_Count header[3]
+        header[0] = kind[0]
+        header[1] = count[0]
+        header[2] = self.segsz
+        with nogil: CHKERR( MPI_Bcast_c(
+            header, 3, MPI_COUNT,
+            self.root, self.comm) )
+        kind[0] = header[0]
+        count[0] = header[1]
+        self.segsz = header[2]
+        return 0
+
+    cdef int waitone(self) except -1:
+        cdef int slot = <int>(self.head % BCAST_WINDOW)
+        with nogil: CHKERR( MPI_Wait(
+            &self.requests[slot], MPI_STATUS_IGNORE) )
+        self.pinned[slot] = None
+        self.head += 1
+        return 0
+
+    cdef int waitall(self) except -1:
+        while self.head < self.tail:
+            self.waitone()
+        return 0
+
+    cdef MPI_Count post(self, void *buf, MPI_Count count,
+                        object ref) except -1:
+        cdef MPI_Count segsz = self.segsz if self.segsz > 0 else count
+        cdef MPI_Count offset = 0, n = 0
+        cdef int slot = 0
+        while offset < count:
+            if self.tail - self.head >= BCAST_WINDOW:
+                self.waitone()
+            slot = <int>(self.tail % BCAST_WINDOW)
+            n = min(segsz, count - offset)
+            with nogil: CHKERR( MPI_Ibcast_c(
+                <char*>buf + offset, n, MPI_BYTE,
+                self.root, self.comm, &self.requests[slot]) )
+            self.pinned[slot] = ref
+            self.tail += 1
+            offset += n
+        return self.tail
+
+    # root process
+
+    cdef int unit(self, MPI_Count kind, void *buf, MPI_Count count,
+                  object ref) except -1:
+        self.header(&kind, &count)
+        self.post(buf, count, ref)
+        return 0
+
+    cdef int flush(self) except -1:
+        cdef bytearray chunk = self.pending
+        if not chunk: return 0
+        self.pending = bytearray()
+        self.chunks.append(chunk)
+        cdef buffer buf = getbuffer(chunk, 1, 0)
+        self.unit(BCAST_DATA, buf.view.buf, buf.view.len, buf)
+        return 0
+
+    def write(self, data):
+        cdef buffer buf = getbuffer(data, 1, 0)
+        cdef MPI_Count count = buf.view.len
+        if self.segsz <= 0 or count >= self.segsz:
+            self.flush()
+            self.chunks.append(data)
+            self.unit(BCAST_DATA, buf.view.buf, count, buf)
+        else:
+            self.pending += buf
+            if len(self.pending) >= self.segsz:
+                self.flush()
+        return count
+
+    cdef object send(self, Pickle pkl, object obj):
+        cdef object protocol = pkl.ob_PROTO
+        if protocol is None:
+            protocol = PyPickle_PROTOCOL
+        protocol = max(protocol, 5)
+        cdef Py_ssize_t threshold = pkl.ob_THRES
+        cdef list bufs = self.bufs
+        #
+        def buffer_callback(ob):
+            cdef buffer buf = getbuffer(ob, 1, 0)
+            if buf.view.len < threshold:
+                return True
+            bufs.append(buf)
+            self.unit(BCAST_OOB, buf.view.buf, buf.view.len, buf)
+            return False
+        #
+        cdef MPI_Count kind = BCAST_END, count = 0
+        cdef object pickler = PyPickle_Pickler(
+            self, protocol, buffer_callback=buffer_callback)
+        try:
+            pickler.dump(obj)
+            self.flush()
+        except BaseException:
+            kind = BCAST_ABORT
+            raise
+        finally:
+            try:
+                self.header(&kind, &count)
+            finally:
+                self.waitall()
+        return b''.join(self.chunks)
+
+    cdef int send_raw(self, void *buf, MPI_Count count,
+                      object ref) except -1:
+        try:
+            self.unit(BCAST_RAW, buf, count, ref)
+        finally:
+            self.waitall()
+        return 0
+
+    # receiver processes
+
+    cdef int fetch(self) except -1:
+        cdef MPI_Count kind = BCAST_END, count = 0
+        self.header(&kind, &count)
+        self.push(kind, count)
+        return 0
+
+    cdef int push(self, MPI_Count kind, MPI_Count count) except -1:
+        cdef void *buf = NULL
+        cdef object mem = None
+        if kind == BCAST_DATA:
+            mem = PyBytes_FromStringAndSize(NULL, <Py_ssize_t>count)
+            buf = PyBytes_AsString(mem)
+        elif kind == BCAST_OOB:
+            mem = allocate(<Py_ssize_t>count, 1, &buf)
+            mem = tobuffer(mem, buf, <Py_ssize_t>count, 0)
+        else:
+            self.done = 1
+        cdef MPI_Count seq = self.post(buf, count, mem)
+        self.units.append((kind, mem, seq))
+        return 0
+
+    cdef object next_unit(self):
+        if not self.units:
+            self.fetch()
+        while not self.done and len(self.units) < BCAST_WINDOW:
+            self.fetch()
+        cdef MPI_Count kind, seq
+        cdef object mem
+        kind, mem, seq = self.units.pop(0)
+        while self.head < seq:
+            self.waitone()
+        if kind == BCAST_ABORT:
+            raise RuntimeError("bcast() aborted at the root process")
+        return (kind, mem)
+
+    cdef bint advance(self) except -1:
+        cdef MPI_Count kind
+        cdef object mem
+        if self.stash:
+            self.data = self.stash.pop(0)
+            self.pos = 0
+            return 1
+        while True:
+            if not self.units and self.done:
+                return 0
+            kind, mem = self.next_unit()
+            if kind == BCAST_OOB:
+                self.bufs.append(mem)
+            elif kind == BCAST_DATA:
+                self.data = mem
+                self.pos = 0
+                return 1
+            else:
+                return 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        cdef MPI_Count kind
+        cdef object mem
+        while not self.bufs:
+            if not self.units and self.done:
+                raise StopIteration
+            kind, mem = self.next_unit()
+            if kind == BCAST_OOB:
+                self.bufs.append(mem)
+            elif kind == BCAST_DATA:
+                self.stash.append(mem)
+        return self.bufs.pop(0)
+
+    def read(self, Py_ssize_t n=-1):
+        cdef list parts = []
+        cdef Py_ssize_t avail, k
+        while n != 0:
+            avail = len(self.data) - self.pos
+            if avail == 0:
+                if not self.advance(): break
+                continue
+            k = avail if n < 0 else min(n, avail)
+            if k == len(self.data):
+                parts.append(self.data)
+            else:
+                parts.append(self.data[self.pos:self.pos + k])
+            self.pos += k
+            if n > 0: n -= k
+        if len(parts) == 1:
+            return parts[0]
+        return b''.join(parts)
+
+    def readinto(self, b):
+        cdef object view = memoryview(b).cast('B')
+        cdef Py_ssize_t n = len(view), m = 0, avail, k
+        while m < n:
+            avail = len(self.data) - self.pos
+            if avail == 0:
+                if not self.advance(): break
+                continue
+            k = min(n - m, avail)
+            view[m:m + k] = self.data[self.pos:self.pos + k]
+            self.pos += k
+            m += k
+        return m
+
+    def readline(self):
+        cdef list parts = []
+        cdef object c
+        while True:
+            c = self.read(1)
+            parts.append(c)
+            if not c or c == b'\n': break
+        return b''.join(parts)
+
+    cdef object recv(self, Pickle pkl, object arena):
+        cdef MPI_Count kind = BCAST_END, count = 0
+        cdef void *buf = NULL
+        cdef object rmsg = None
+        self.header(&kind, &count)
+        if kind == BCAST_RAW:
+            rmsg = pickle_alloc(&buf, count, arena)
+            try:
+                self.post(buf, count, rmsg)
+            finally:
+                self.waitall()
+            try:
+                return pickle_load(pkl, buf, count, rmsg)
+            finally:
+                pickle_release(arena, rmsg)
+        try:
+            self.push(kind, count)
+            if pkl.ob_loads is PyPickle_loads:
+                rmsg = PyPickle_Unpickler(self, buffers=self).load()
+            else:
+                rmsg = self.read(-1)
+                rmsg = cloads_oob(pkl, rmsg, self.bufs)
+        finally:
+            self.drain()
+        return rmsg
+
+    cdef int drain(self) except -1:
+        try:
+            while not self.done:
+                self.fetch()
+        finally:
+            self.waitall()
+        return 0
+
+
 cdef object PyMPI_bcast(object obj, int root, MPI_Comm comm):
     cdef Pickle pickle = PyMPI_PICKLE
     #
     cdef void *buf = NULL
     cdef MPI_Count count = 0
-    cdef MPI_Datatype dtype = MPI_BYTE
     #
     cdef int dosend=0, dorecv=0
     cdef int inter=0, rank=0
@@ -734,19 +1826,39 @@ cdef object PyMPI_bcast(object obj, int root, MPI_Comm comm):
     #
     cdef object smsg = None
     cdef object rmsg = None
+    cdef object arena = None
+    cdef MPI_Count kind = BCAST_RAW
+    cdef _p_bcast bcast = _p_bcast.__new__(_p_bcast)
+    bcast.comm = comm
+    bcast.root = root
+    cdef bint stream = (
+        dosend and not inter and
+        (options.bcast_segsz > 0 or options.pickle_oob) and
+        pickle.ob_dumps is PyPickle_dumps
+    )
     #
-    if dosend: smsg = pickle_dump(pickle, obj, &buf, &count)
-    if dosend and dorecv: rmsg = smsg
+    if dosend and not stream:
+        smsg = pickle_dump(pickle, obj, &buf, &count)
+    if dorecv and not dosend:
+        arena = PyMPI_Arena(comm)
     with PyMPI_Lock(comm, "bcast"):
-        with nogil: CHKERR( MPI_Bcast_c(
-            &count, 1, MPI_COUNT,
-            root, comm) )
-        if dorecv and not dosend:
-            rmsg = pickle_alloc(&buf, count)
-        with nogil: CHKERR( MPI_Bcast_c(
-            buf, count, dtype,
-            root, comm) )
-    if dorecv: rmsg = pickle_load(pickle, buf, count)
+        if stream:
+            bcast.segsz = options.bcast_segsz
+            smsg = bcast.send(pickle, obj)
+        elif dosend:
+            bcast.segsz = options.bcast_segsz if not inter else 0
+            bcast.send_raw(buf, count, smsg)
+        elif dorecv:
+            rmsg = bcast.recv(pickle, arena)
+        else:
+            bcast.header(&kind, &count)
+            bcast.post(NULL, 1, None)
+            bcast.waitall()
+    if dosend and dorecv:
+        if stream:
+            rmsg = cloads_oob(pickle, smsg, [bytearray(b) for b in bcast.bufs])
+        else:
+            rmsg = pickle_load(pickle, buf, count)
     #
     return rmsg
 
@@ -755,7 +1867,7 @@ cdef object PyMPI_gather(object sendobj, int root, MPI_Comm comm):
     cdef Pickle pickle = PyMPI_PICKLE
     #
     cdef void *sbuf = NULL
-    cdef MPI_Count scount = 0
+    cdef MPI_Count scount = 0, ssize = 0
     cdef MPI_Datatype stype = MPI_BYTE
     cdef void *rbuf = NULL
     cdef MPI_Count *rcounts = NULL
@@ -782,22 +1894,29 @@ cdef object PyMPI_gather(object sendobj, int root, MPI_Comm comm):
             dosend, dorecv = 1, 0
     #
     cdef object unuseds = None
+    cdef object unusedr = None
     cdef object rmsg = None
+    cdef object arena = None
     cdef object unused1
     #
     if dorecv: unused1 = allocate_count_displ(size, &rcounts, &rdispls)
-    if dosend: unuseds = pickle_dump(pickle, sendobj, &sbuf, &scount)
+    if dorecv: arena = PyMPI_Arena(comm)
+    if dosend: unuseds = pickle_dump_oob(
+        pickle, sendobj, &sbuf, &scount, &stype)
+    if dosend: ssize = pickle_size(scount, stype)
     with PyMPI_Lock(comm, "gather"):
         with nogil: CHKERR( MPI_Gather_c(
-            &scount, 1, MPI_COUNT,
+            &ssize,  1, MPI_COUNT,
             rcounts, 1, MPI_COUNT,
             root, comm) )
-        if dorecv: rmsg = pickle_allocv(&rbuf, size, rcounts, rdispls)
+        if dorecv: unusedr = pickle_allocv(&rbuf, size, rcounts, rdispls, arena)
         with nogil: CHKERR( MPI_Gatherv_c(
             sbuf, scount,           stype,
             rbuf, rcounts, rdispls, rtype,
             root, comm) )
-    if dorecv: rmsg = pickle_loadv(pickle, rbuf, size, rcounts, rdispls)
+    if dorecv: rmsg = pickle_loadv(
+        pickle, rbuf, size, rcounts, rdispls, unusedr)
+    pickle_release(arena, unusedr)
     #
     return rmsg
 
@@ -833,22 +1952,26 @@ cdef object PyMPI_scatter(object sendobj, int root, MPI_Comm comm):
             dosend, dorecv = 0, 1
     #
     cdef object unuseds = None
+    cdef object unusedr = None
     cdef object rmsg = None
+    cdef object arena = None
     cdef object unused1
     #
     if dosend: unused1 = allocate_count_displ(size, &scounts, &sdispls)
     if dosend: unuseds = pickle_dumpv(pickle, sendobj, &sbuf, size, scounts, sdispls)
+    if dorecv: arena = PyMPI_Arena(comm)
     with PyMPI_Lock(comm, "scatter"):
         with nogil: CHKERR( MPI_Scatter_c(
             scounts, 1, MPI_COUNT,
             &rcount, 1, MPI_COUNT,
             root, comm) )
-        if dorecv: rmsg = pickle_alloc(&rbuf, rcount)
+        if dorecv: unusedr = pickle_alloc(&rbuf, rcount, arena)
         with nogil: CHKERR( MPI_Scatterv_c(
             sbuf, scounts, sdispls, stype,
             rbuf, rcount,           rtype,
             root, comm) )
-    if dorecv: rmsg = pickle_load(pickle, rbuf, rcount)
+    if dorecv: rmsg = pickle_load(pickle, rbuf, rcount, unusedr)
+    pickle_release(arena, unusedr)
     #
     return rmsg
 
@@ -857,7 +1980,7 @@ cdef object PyMPI_allgather(object sendobj, MPI_Comm comm):
     cdef Pickle pickle = PyMPI_PICKLE
     #
     cdef void *sbuf = NULL
-    cdef MPI_Count scount = 0
+    cdef MPI_Count scount = 0, ssize = 0
     cdef MPI_Datatype stype = MPI_BYTE
     cdef void *rbuf = NULL
     cdef MPI_Count *rcounts = NULL
@@ -873,21 +1996,25 @@ cdef object PyMPI_allgather(object sendobj, MPI_Comm comm):
     #
     cdef object unuseds = None
     cdef object rmsg = None
+    cdef object arena = PyMPI_Arena(comm)
+    cdef object unusedr = None
     cdef object unused1
     #
     unused1 = allocate_count_displ(size, &rcounts, &rdispls)
-    unuseds = pickle_dump(pickle, sendobj, &sbuf, &scount)
+    unuseds = pickle_dump_oob(pickle, sendobj, &sbuf, &scount, &stype)
+    ssize = pickle_size(scount, stype)
     with PyMPI_Lock(comm, "allgather"):
         with nogil: CHKERR( MPI_Allgather_c(
-            &scount, 1, MPI_COUNT,
+            &ssize,  1, MPI_COUNT,
             rcounts, 1, MPI_COUNT,
             comm) )
-        rmsg = pickle_allocv(&rbuf, size, rcounts, rdispls)
+        unusedr = pickle_allocv(&rbuf, size, rcounts, rdispls, arena)
         with nogil: CHKERR( MPI_Allgatherv_c(
             sbuf, scount,           stype,
             rbuf, rcounts, rdispls, rtype,
             comm) )
-    rmsg = pickle_loadv(pickle, rbuf, size, rcounts, rdispls)
+    rmsg = pickle_loadv(pickle, rbuf, size, rcounts, rdispls, unusedr)
+    pickle_release(arena, unusedr)
     #
     return rmsg
 
@@ -913,6 +2040,8 @@ cdef object PyMPI_alltoall(object sendobj, MPI_Comm comm):
     #
     cdef object unuseds = None
     cdef object rmsg = None
+    cdef object arena = PyMPI_Arena(comm)
+    cdef object unusedr = None
     cdef object unused1, unused2
     #
     unused1 = allocate_count_displ(size, &scounts, &sdispls)
@@ -923,12 +2052,13 @@ cdef object PyMPI_alltoall(object sendobj, MPI_Comm comm):
             scounts, 1, MPI_COUNT,
             rcounts, 1, MPI_COUNT,
             comm) )
-        rmsg = pickle_allocv(&rbuf, size, rcounts, rdispls)
+        unusedr = pickle_allocv(&rbuf, size, rcounts, rdispls, arena)
         with nogil: CHKERR( MPI_Alltoallv_c(
             sbuf, scounts, sdispls, stype,
             rbuf, rcounts, rdispls, rtype,
             comm) )
-    rmsg = pickle_loadv(pickle, rbuf, size, rcounts, rdispls)
+    rmsg = pickle_loadv(pickle, rbuf, size, rcounts, rdispls, unusedr)
+    pickle_release(arena, unusedr)
     #
     return rmsg
 
@@ -949,6 +2079,8 @@ cdef object PyMPI_neighbor_allgather(object sendobj, MPI_Comm comm):
     #
     cdef object unuseds = None
     cdef object rmsg = None
+    cdef object arena = PyMPI_Arena(comm)
+    cdef object unusedr = None
     cdef object unused1
     #
     unused1 = allocate_count_displ(rsize, &rcounts, &rdispls)
@@ -959,12 +2091,13 @@ cdef object PyMPI_neighbor_allgather(object sendobj, MPI_Comm comm):
             &scount, 1, MPI_COUNT,
             rcounts, 1, MPI_COUNT,
             comm) )
-        rmsg = pickle_allocv(&rbuf, rsize, rcounts, rdispls)
+        unusedr = pickle_allocv(&rbuf, rsize, rcounts, rdispls, arena)
         with nogil: CHKERR( MPI_Neighbor_allgatherv_c(
             sbuf, scount,           stype,
             rbuf, rcounts, rdispls, rtype,
             comm) )
-    rmsg = pickle_loadv(pickle, rbuf, rsize, rcounts, rdispls)
+    rmsg = pickle_loadv(pickle, rbuf, rsize, rcounts, rdispls, unusedr)
+    pickle_release(arena, unusedr)
     #
     return rmsg
 
@@ -986,6 +2119,8 @@ cdef object PyMPI_neighbor_alltoall(object sendobj, MPI_Comm comm):
     #
     cdef object unuseds = None
     cdef object rmsg = None
+    cdef object arena = PyMPI_Arena(comm)
+    cdef object unusedr = None
     cdef object unused1, unused2
     #
     unused1 = allocate_count_displ(ssize, &scounts, &sdispls)
@@ -997,17 +2132,512 @@ cdef object PyMPI_neighbor_alltoall(object sendobj, MPI_Comm comm):
             scounts, 1, MPI_COUNT,
             rcounts, 1, MPI_COUNT,
             comm) )
-        rmsg = pickle_allocv(&rbuf, rsize, rcounts, rdispls)
+        unusedr = pickle_allocv(&rbuf, rsize, rcounts, rdispls, arena)
         with nogil: CHKERR( MPI_Neighbor_alltoallv_c(
             sbuf, scounts, sdispls, stype,
             rbuf, rcounts, rdispls, rtype,
             comm) )
-    rmsg = pickle_loadv(pickle, rbuf, rsize, rcounts, rdispls)
+    rmsg = pickle_loadv(pickle, rbuf, rsize, rcounts, rdispls, unusedr)
+    pickle_release(arena, unusedr)
     #
     return rmsg
 
 # -----------------------------------------------------------------------------
 
+
+# Nonblocking collectives of objects proceed in two phases. The sizes
+# of the pickled messages are exchanged with a nonblocking collective
+# posted on the communicator at initiation. The payload is exchanged
+# with a nonblocking collective posted on a private duplicate of the
+# communicator once the sizes are known, from the completion calls.
+# Payload collectives are posted in initiation order, thus matching
+# at all processes. Users get a generalized request, completed once
+# the payload has been transferred.
+
+@cython.final
+@cython.internal
+cdef class _p_coll_ctx:
+
+    cdef MPI_Comm    comm
+    cdef MPI_Request request
+    cdef list        queue
+    cdef object      lock
+
+    def __cinit__(self):
+        self.comm = MPI_COMM_NULL
+        self.request = MPI_REQUEST_NULL
+        self.queue = []
+        self.lock = Lock()
+
+    cdef int start(self, MPI_Comm comm) except -1:
+        with nogil: CHKERR( MPI_Comm_idup(
+            comm, &self.comm, &self.request) )
+        return 0
+
+    cdef bint ready(self, bint block) except -1:
+        cdef int flag = 1
+        if self.request == MPI_REQUEST_NULL:
+            return 1
+        if block:
+            with nogil: CHKERR( MPI_Wait(
+                &self.request, MPI_STATUS_IGNORE) )
+        else:
+            with nogil: CHKERR( MPI_Test(
+                &self.request, &flag, MPI_STATUS_IGNORE) )
+        return <bint>flag
+
+    cdef int free(self) except -1:
+        if self.request != MPI_REQUEST_NULL:
+            with nogil: CHKERR( MPI_Wait(
+                &self.request, MPI_STATUS_IGNORE) )
+        if self.comm != MPI_COMM_NULL:
+            with nogil: CHKERR( MPI_Comm_free(&self.comm) )
+        return 0
+
+
+cdef int    commcoll_keyval   = MPI_KEYVAL_INVALID
+cdef object commcoll_lock     = Lock()
+cdef dict   commcoll_registry = {}
+
+
+cdef inline int commcoll_free_cb(
+    MPI_Comm comm,
+) except MPI_ERR_UNKNOWN with gil:
+    cdef object key = <Py_uintptr_t>comm
+    cdef _p_coll_ctx ctx
+    with commcoll_lock:
+        ctx = commcoll_registry.pop(key, None)
+    if ctx is not None:
+        ctx.free()
+    return MPI_SUCCESS
+
+
+@cython.linetrace(False)
+@cython.callspec("MPIAPI")
+cdef int commcoll_free_fn(
+    MPI_Comm comm,
+    int keyval,
+    void *attrval,
+    void *xstate,
+) noexcept nogil:
+    <void> keyval   # unused
+    <void> attrval  # unused
+    <void> xstate   # unused
+    if comm == MPI_COMM_SELF:  <void>MPI_Comm_free_keyval(&commcoll_keyval)
+    if not Py_IsInitialized(): return MPI_SUCCESS
+    if not py_module_alive():  return MPI_SUCCESS
+    return commcoll_free_cb(comm)
+
+
+cdef inline _p_coll_ctx commcoll_new(MPI_Comm comm):
+    cdef _p_coll_ctx ctx = _p_coll_ctx.__new__(_p_coll_ctx)
+    ctx.start(comm)
+    CHKERR( MPI_Comm_set_attr(
+        comm, commcoll_keyval, <void*> ctx) )
+    commcoll_registry[<Py_uintptr_t>comm] = ctx
+    return ctx
+
+
+cdef inline _p_coll_ctx commcoll_lookup(MPI_Comm comm):
+    cdef int found = 0
+    cdef void *attrval = NULL
+    cdef _p_coll_ctx ctx
+    if commcoll_keyval == MPI_KEYVAL_INVALID:
+        CHKERR( MPI_Comm_create_keyval(
+            MPI_COMM_NULL_COPY_FN,
+            commcoll_free_fn,
+            &commcoll_keyval, NULL) )
+        commcoll_new(MPI_COMM_SELF)
+    CHKERR( MPI_Comm_get_attr(
+        comm, commcoll_keyval, &attrval, &found) )
+    if not found:
+        ctx = commcoll_new(comm)
+    elif PYPY:
+        ctx = commcoll_registry[<Py_uintptr_t>comm]  # ~> pypy
+    else:
+        ctx = <_p_coll_ctx> attrval
+    return ctx
+
+
+cdef inline _p_coll_ctx PyMPI_Collctx(MPI_Comm comm):
+    with commcoll_lock:
+        return commcoll_lookup(comm)
+
+
+cdef enum:
+    COLL_BCAST     = 0
+    COLL_GATHER    = 1
+    COLL_SCATTER   = 2
+    COLL_ALLGATHER = 3
+    COLL_ALLTOALL  = 4
+
+
+@cython.final
+@cython.internal
+cdef class _p_req_coll:
+    cdef _p_coll_ctx ctx
+    cdef int  kind
+    cdef int  phase
+    cdef int  root
+    cdef bint send
+    cdef bint recv
+    cdef int  size
+    cdef MPI_Request request
+    cdef MPI_Request greq
+    cdef object smsg
+    cdef object rmsg
+    cdef object args
+    cdef object vecs
+    cdef void *sbuf
+    cdef MPI_Count scount
+    cdef MPI_Count ssize
+    cdef MPI_Datatype stype
+    cdef MPI_Count *scounts
+    cdef MPI_Aint  *sdispls
+    cdef MPI_Count *rcounts
+    cdef MPI_Aint  *rdispls
+    cdef void *buf
+    cdef MPI_Count count
+    cdef MPI_Count *counts
+    cdef MPI_Aint  *displs
+
+    def __cinit__(self):
+        self.ctx = None
+        self.kind = COLL_BCAST
+        self.phase = 0
+        self.root = MPI_PROC_NULL
+        self.send = 0
+        self.recv = 0
+        self.size = -1
+        self.request = MPI_REQUEST_NULL
+        self.greq = MPI_REQUEST_NULL
+        self.sbuf = NULL
+        self.scount = 0
+        self.ssize = 0
+        self.stype = MPI_BYTE
+        self.scounts = NULL
+        self.sdispls = NULL
+        self.rcounts = NULL
+        self.rdispls = NULL
+        self.buf = NULL
+        self.count = 0
+        self.counts = NULL
+        self.displs = NULL
+
+    cdef int setv(self, int n, MPI_Count cnt[], MPI_Aint dsp[]) except -1:
+        # the large count fallback may overwrite the arrays passed
+        # to nonblocking vector collectives, keep a copy for loading
+        self.vecs = allocate_count_displ(n, &self.counts, &self.displs)
+        self.size = n
+        for i in range(n):
+            self.counts[i] = cnt[i]
+            self.displs[i] = dsp[i]
+        return 0
+
+    cdef int start(self, MPI_Comm comm, MPI_Request *request) except -1:
+        cdef int root = self.root
+        cdef _p_greq state = _p_greq(None, None, None, None, None)
+        self.ctx = PyMPI_Collctx(comm)
+        if self.kind == COLL_BCAST:
+            with nogil: CHKERR( MPI_Ibcast_c(
+                &self.count, 1, MPI_COUNT,
+                root, comm, &self.request) )
+        elif self.kind == COLL_GATHER:
+            with nogil: CHKERR( MPI_Igather_c(
+                &self.ssize,  1, MPI_COUNT,
+                self.rcounts, 1, MPI_COUNT,
+                root, comm, &self.request) )
+        elif self.kind == COLL_SCATTER:
+            with nogil: CHKERR( MPI_Iscatter_c(
+                self.scounts, 1, MPI_COUNT,
+                &self.count,  1, MPI_COUNT,
+                root, comm, &self.request) )
+        elif self.kind == COLL_ALLGATHER:
+            with nogil: CHKERR( MPI_Iallgather_c(
+                &self.ssize,  1, MPI_COUNT,
+                self.rcounts, 1, MPI_COUNT,
+                comm, &self.request) )
+        elif self.kind == COLL_ALLTOALL:
+            with nogil: CHKERR( MPI_Ialltoall_c(
+                self.scounts, 1, MPI_COUNT,
+                self.rcounts, 1, MPI_COUNT,
+                comm, &self.request) )
+        with nogil: CHKERR( MPI_Grequest_start(
+            greq_query_fn, greq_free_fn, greq_cancel_fn,
+            <void*>state, request) )
+        Py_INCREF(state)
+        self.greq = request[0]
+        with self.ctx.lock:
+            self.ctx.queue.append(self)
+        return 0
+
+    cdef int post(self) except -1:
+        cdef MPI_Comm comm = self.ctx.comm
+        cdef int root = self.root
+        cdef int size = self.size
+        if self.kind == COLL_BCAST:
+            if self.recv and not self.send:
+                self.rmsg = pickle_alloc(&self.buf, self.count)
+            with nogil: CHKERR( MPI_Ibcast_c(
+                self.buf, self.count, MPI_BYTE,
+                root, comm, &self.request) )
+        elif self.kind == COLL_GATHER:
+            self.size = -1
+            if self.recv:
+                self.rmsg = pickle_allocv(
+                    &self.buf, size, self.rcounts, self.rdispls)
+                self.setv(size, self.rcounts, self.rdispls)
+            with nogil: CHKERR( MPI_Igatherv_c(
+                self.sbuf, self.scount,                 self.stype,
+                self.buf,  self.rcounts, self.rdispls,  MPI_BYTE,
+                root, comm, &self.request) )
+        elif self.kind == COLL_SCATTER:
+            if self.recv:
+                self.rmsg = pickle_alloc(&self.buf, self.count)
+            with nogil: CHKERR( MPI_Iscatterv_c(
+                self.sbuf, self.scounts, self.sdispls, MPI_BYTE,
+                self.buf,  self.count,                 MPI_BYTE,
+                root, comm, &self.request) )
+        elif self.kind == COLL_ALLGATHER:
+            self.rmsg = pickle_allocv(
+                &self.buf, size, self.rcounts, self.rdispls)
+            self.setv(size, self.rcounts, self.rdispls)
+            with nogil: CHKERR( MPI_Iallgatherv_c(
+                self.sbuf, self.scount,                 self.stype,
+                self.buf,  self.rcounts, self.rdispls,  MPI_BYTE,
+                comm, &self.request) )
+        elif self.kind == COLL_ALLTOALL:
+            self.rmsg = pickle_allocv(
+                &self.buf, size, self.rcounts, self.rdispls)
+            self.setv(size, self.rcounts, self.rdispls)
+            with nogil: CHKERR( MPI_Ialltoallv_c(
+                self.sbuf, self.scounts, self.sdispls, MPI_BYTE,
+                self.buf,  self.rcounts, self.rdispls, MPI_BYTE,
+                comm, &self.request) )
+        return 0
+
+    cdef bint wait(self, bint block) except -1:
+        cdef int flag = 1
+        if block:
+            with nogil: CHKERR( MPI_Wait(
+                &self.request, MPI_STATUS_IGNORE) )
+        else:
+            with nogil: CHKERR( MPI_Test(
+                &self.request, &flag, MPI_STATUS_IGNORE) )
+        return <bint>flag
+
+    cdef bint advance(self, bint block) except -1:
+        if self.phase == 0:
+            if not self.wait(block): return 0
+            self.phase = 1
+        if self.phase == 1:
+            if not self.ctx.ready(block): return 0
+            self.post()
+            self.phase = 2
+        return 1
+
+    cdef bint progress(self, bint block) except -1:
+        cdef _p_coll_ctx ctx = self.ctx
+        cdef _p_req_coll ob
+        if self.phase < 2:
+            with ctx.lock:
+                while self.phase < 2:
+                    ob = <_p_req_coll> ctx.queue[0]
+                    if not ob.advance(block): return 1
+                    del ctx.queue[0]
+        if self.phase == 2:
+            if not self.wait(block): return 1
+            self.phase = 3
+            with nogil: CHKERR( MPI_Grequest_complete(self.greq) )
+        return 0
+
+
+cdef inline bint PyMPI_progress(object ob, bint block) except -1:
+    if type(ob) is _p_req_coll:
+        return (<_p_req_coll>ob).progress(block)
+    return 0
+
+cdef bint PyMPI_progress_all(object requests, bint block) except -1:
+    cdef bint pending = 0
+    cdef Request request
+    for request in requests:
+        if PyMPI_progress(request.ob_buf, block):
+            pending = 1
+    return pending
+
+cdef inline object PyMPI_load_coll(_p_req_coll ob):
+    if not ob.recv: return None
+    cdef Pickle pickle = PyMPI_PICKLE
+    if ob.size < 0:
+        return pickle_load(pickle, ob.buf, ob.count, ob.rmsg)
+    return pickle_loadv(
+        pickle, ob.buf, ob.size, ob.counts, ob.displs, ob.rmsg)
+
+
+cdef object PyMPI_ibcast(object obj, int root,
+                         MPI_Comm comm, MPI_Request *request):
+    cdef Pickle pickle = PyMPI_PICKLE
+    cdef _p_req_coll ob = _p_req_coll.__new__(_p_req_coll)
+    #
+    cdef int dosend=0, dorecv=0
+    cdef int inter=0, rank=0
+    CHKERR( MPI_Comm_test_inter(comm, &inter) )
+    if inter:
+        if root == MPI_PROC_NULL:
+            dosend, dorecv = 0, 0
+        elif root == MPI_ROOT:
+            dosend, dorecv = 1, 0
+        else:
+            dosend, dorecv = 0, 1
+    else:
+        CHKERR( MPI_Comm_rank(comm, &rank) )
+        if root == rank:
+            dosend, dorecv = 1, 1
+        else:
+            dosend, dorecv = 0, 1
+    #
+    ob.kind = COLL_BCAST
+    ob.root = root
+    ob.send = dosend
+    ob.recv = dorecv
+    if dosend: ob.smsg = pickle_dump(pickle, obj, &ob.buf, &ob.count)
+    with PyMPI_Lock(comm, "ibcast"):
+        ob.start(comm, request)
+    #
+    return ob
+
+
+cdef object PyMPI_igather(object sendobj, int root,
+                          MPI_Comm comm, MPI_Request *request):
+    cdef Pickle pickle = PyMPI_PICKLE
+    cdef _p_req_coll ob = _p_req_coll.__new__(_p_req_coll)
+    #
+    cdef int dosend=0, dorecv=0
+    cdef int inter=0, size=0, rank=0
+    CHKERR( MPI_Comm_test_inter(comm, &inter) )
+    if inter:
+        CHKERR( MPI_Comm_remote_size(comm, &size) )
+        if root == MPI_PROC_NULL:
+            dosend, dorecv = 0, 0
+        elif root == MPI_ROOT:
+            dosend, dorecv = 0, 1
+        else:
+            dosend, dorecv = 1, 0
+    else:
+        CHKERR( MPI_Comm_size(comm, &size) )
+        CHKERR( MPI_Comm_rank(comm, &rank) )
+        if root == rank:
+            dosend, dorecv = 1, 1
+        else:
+            dosend, dorecv = 1, 0
+    #
+    ob.kind = COLL_GATHER
+    ob.root = root
+    ob.send = dosend
+    ob.recv = dorecv
+    ob.size = size
+    if dorecv: ob.args = allocate_count_displ(size, &ob.rcounts, &ob.rdispls)
+    if dosend: ob.smsg = pickle_dump_oob(
+        pickle, sendobj, &ob.sbuf, &ob.scount, &ob.stype)
+    if dosend: ob.ssize = pickle_size(ob.scount, ob.stype)
+    with PyMPI_Lock(comm, "igather"):
+        ob.start(comm, request)
+    #
+    return ob
+
+
+cdef object PyMPI_iscatter(object sendobj, int root,
+                           MPI_Comm comm, MPI_Request *request):
+    cdef Pickle pickle = PyMPI_PICKLE
+    cdef _p_req_coll ob = _p_req_coll.__new__(_p_req_coll)
+    #
+    cdef int dosend=0, dorecv=0
+    cdef int inter=0, size=0, rank=0
+    CHKERR( MPI_Comm_test_inter(comm, &inter) )
+    if inter:
+        CHKERR( MPI_Comm_remote_size(comm, &size) )
+        if root == MPI_PROC_NULL:
+            dosend, dorecv = 0, 0
+        elif root == MPI_ROOT:
+            dosend, dorecv = 1, 0
+        else:
+            dosend, dorecv = 0, 1
+    else:
+        CHKERR( MPI_Comm_size(comm, &size) )
+        CHKERR( MPI_Comm_rank(comm, &rank) )
+        if root == rank:
+            dosend, dorecv = 1, 1
+        else:
+            dosend, dorecv = 0, 1
+    #
+    ob.kind = COLL_SCATTER
+    ob.root = root
+    ob.send = dosend
+    ob.recv = dorecv
+    if dosend: ob.args = allocate_count_displ(size, &ob.scounts, &ob.sdispls)
+    if dosend: ob.smsg = pickle_dumpv(pickle, sendobj, &ob.sbuf,
+                                      size, ob.scounts, ob.sdispls)
+    with PyMPI_Lock(comm, "iscatter"):
+        ob.start(comm, request)
+    #
+    return ob
+
+
+cdef object PyMPI_iallgather(object sendobj,
+                             MPI_Comm comm, MPI_Request *request):
+    cdef Pickle pickle = PyMPI_PICKLE
+    cdef _p_req_coll ob = _p_req_coll.__new__(_p_req_coll)
+    #
+    cdef int inter=0, size=0
+    CHKERR( MPI_Comm_test_inter(comm, &inter) )
+    if inter:
+        CHKERR( MPI_Comm_remote_size(comm, &size) )
+    else:
+        CHKERR( MPI_Comm_size(comm, &size) )
+    #
+    ob.kind = COLL_ALLGATHER
+    ob.send = 1
+    ob.recv = 1
+    ob.size = size
+    ob.args = allocate_count_displ(size, &ob.rcounts, &ob.rdispls)
+    ob.smsg = pickle_dump_oob(
+        pickle, sendobj, &ob.sbuf, &ob.scount, &ob.stype)
+    ob.ssize = pickle_size(ob.scount, ob.stype)
+    with PyMPI_Lock(comm, "iallgather"):
+        ob.start(comm, request)
+    #
+    return ob
+
+
+cdef object PyMPI_ialltoall(object sendobj,
+                            MPI_Comm comm, MPI_Request *request):
+    cdef Pickle pickle = PyMPI_PICKLE
+    cdef _p_req_coll ob = _p_req_coll.__new__(_p_req_coll)
+    #
+    cdef int inter=0, size=0
+    CHKERR( MPI_Comm_test_inter(comm, &inter) )
+    if inter:
+        CHKERR( MPI_Comm_remote_size(comm, &size) )
+    else:
+        CHKERR( MPI_Comm_size(comm, &size) )
+    #
+    ob.kind = COLL_ALLTOALL
+    ob.send = 1
+    ob.recv = 1
+    ob.size = size
+    ob.args = (
+        allocate_count_displ(size, &ob.scounts, &ob.sdispls),
+        allocate_count_displ(size, &ob.rcounts, &ob.rdispls),
+    )
+    ob.smsg = pickle_dumpv(pickle, sendobj, &ob.sbuf,
+                           size, ob.scounts, ob.sdispls)
+    with PyMPI_Lock(comm, "ialltoall"):
+        ob.start(comm, request)
+    #
+    return ob
+
+# -----------------------------------------------------------------------------
+
 cdef inline object _py_reduce(object seq, object op):
     if seq is None: return None
     cdef Py_ssize_t i, n = len(seq)
@@ -1074,10 +2704,13 @@ cdef object PyMPI_recv_p2p(int src, int tag, MPI_Comm comm):
     cdef MPI_Count rcount = 0
     cdef MPI_Datatype rtype = MPI_BYTE
     cdef MPI_Status *status = MPI_STATUS_IGNORE
+    cdef object arena = PyMPI_Arena(comm)
     with nogil: CHKERR( MPI_Recv_c(&rcount, 1, MPI_COUNT, src, tag, comm, status) )
-    cdef object unusedr = pickle_alloc(&rbuf, rcount)
+    cdef object unusedr = pickle_alloc(&rbuf, rcount, arena)
     with nogil: CHKERR( MPI_Recv_c(rbuf, rcount, rtype, src, tag, comm, status) )
-    return pickle_load(pickle, rbuf, rcount)
+    cdef object rmsg = pickle_load(pickle, rbuf, rcount, unusedr)
+    pickle_release(arena, unusedr)
+    return rmsg
 
 cdef object PyMPI_sendrecv_p2p(object obj,
                                int dst, int stag,
@@ -1087,17 +2720,20 @@ cdef object PyMPI_sendrecv_p2p(object obj,
     cdef void *sbuf = NULL, *rbuf = NULL
     cdef MPI_Count scount = 0, rcount = 0
     cdef MPI_Datatype dtype = MPI_BYTE
+    cdef object arena = PyMPI_Arena(comm)
     cdef object unuseds = pickle_dump(pickle, obj, &sbuf, &scount)
     with nogil: CHKERR( MPI_Sendrecv_c(
             &scount, 1, MPI_COUNT, dst, stag,
             &rcount, 1, MPI_COUNT, src, rtag,
             comm, MPI_STATUS_IGNORE) )
-    cdef object unusedr = pickle_alloc(&rbuf, rcount)
+    cdef object unusedr = pickle_alloc(&rbuf, rcount, arena)
     with nogil: CHKERR( MPI_Sendrecv_c(
             sbuf, scount, dtype, dst, stag,
             rbuf, rcount, dtype, src, rtag,
             comm, MPI_STATUS_IGNORE) )
-    return pickle_load(pickle, rbuf, rcount)
+    cdef object rmsg = pickle_load(pickle, rbuf, rcount, unusedr)
+    pickle_release(arena, unusedr)
+    return rmsg
 
 cdef object PyMPI_bcast_p2p(object obj, int root, MPI_Comm comm):
     cdef Pickle pickle = PyMPI_PICKLE
@@ -1105,13 +2741,17 @@ cdef object PyMPI_bcast_p2p(object obj, int root, MPI_Comm comm):
     cdef MPI_Count count = 0
     cdef MPI_Datatype dtype = MPI_BYTE
     cdef int rank = MPI_PROC_NULL
+    cdef object arena = None
     CHKERR( MPI_Comm_rank(comm, &rank) )
     if root == rank: obj = pickle_dump(pickle, obj, &buf, &count)
+    if root != rank: arena = PyMPI_Arena(comm)
     with PyMPI_Lock(comm, "@bcast_p2p@"):
         with nogil: CHKERR( MPI_Bcast_c(&count, 1, MPI_COUNT, root, comm) )
-        if root != rank: obj = pickle_alloc(&buf, count)
+        if root != rank: obj = pickle_alloc(&buf, count, arena)
         with nogil: CHKERR( MPI_Bcast_c(buf, count, dtype, root, comm) )
-    return pickle_load(pickle, buf, count)
+    cdef object rmsg = pickle_load(pickle, buf, count, obj)
+    pickle_release(arena, obj)
+    return rmsg
 
 cdef object PyMPI_reduce_p2p(object sendobj, object op, int root,
                              MPI_Comm comm, int tag):
@@ -1337,15 +2977,306 @@ cdef object PyMPI_exscan_intra(object sendobj, object op, MPI_Comm comm):
 
 # ---
 
+cdef enum:
+    GATHER_WINDOW = 16
+
+
+@cython.final
+@cython.internal
+cdef class _p_gather_iter:
+
+    cdef MPI_Comm comm
+    cdef int tag
+    cdef int size
+    cdef int rank
+    cdef int head
+    cdef int tail
+    cdef object data
+    cdef MPI_Count counts[GATHER_WINDOW]
+    cdef MPI_Request requests[GATHER_WINDOW]
+
+    def __cinit__(self):
+        self.comm = MPI_COMM_NULL
+        self.tag  = MPI_UNDEFINED
+        self.size = 0
+        self.rank = MPI_PROC_NULL
+        self.head = 0
+        self.tail = 0
+        self.data = None
+        for i in range(GATHER_WINDOW):
+            self.counts[i] = 0
+            self.requests[i] = MPI_REQUEST_NULL
+
+    def __dealloc__(self):
+        if not mpi_active(): return
+        self.drain()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.head >= self.size: raise StopIteration
+        cdef Pickle pickle = PyMPI_PICKLE
+        cdef int source = self.head
+        cdef MPI_Request *request = &self.requests[source % GATHER_WINDOW]
+        cdef MPI_Count count = 0
+        if source != self.rank:
+            with nogil: CHKERR( MPI_Wait(request, MPI_STATUS_IGNORE) )
+            count = self.counts[source % GATHER_WINDOW]
+        self.head += 1
+        self.post()
+        if source == self.rank:
+            return cloads_data(pickle, self.data)
+        cdef void *buf = NULL
+        cdef object arena = PyMPI_Arena(self.comm)
+        cdef object unusedr = pickle_alloc(&buf, count, arena)
+        with nogil: CHKERR( MPI_Recv_c(
+            buf, count, MPI_BYTE,
+            source, self.tag, self.comm, MPI_STATUS_IGNORE) )
+        cdef object rmsg = pickle_load(pickle, buf, count, unusedr)
+        pickle_release(arena, unusedr)
+        return rmsg
+
+    cdef int post(self) except -1:
+        cdef int source
+        cdef MPI_Count *count = NULL
+        cdef MPI_Request *request = NULL
+        while self.tail < self.size and self.tail < self.head + GATHER_WINDOW:
+            source = self.tail
+            self.tail += 1
+            if source == self.rank: continue
+            count = &self.counts[source % GATHER_WINDOW]
+            request = &self.requests[source % GATHER_WINDOW]
+            with nogil: CHKERR( MPI_Irecv_c(
+                count, 1, MPI_COUNT,
+                source, self.tag, self.comm, request) )
+        return 0
+
+    cdef int drain(self) noexcept:
+        cdef int ierr = MPI_SUCCESS
+        cdef int source
+        cdef MPI_Count count = 0
+        cdef void *buf = NULL
+        while self.head < self.size and ierr == MPI_SUCCESS:
+            source = self.head
+            self.head += 1
+            if source == self.rank: continue
+            if source < self.tail:
+                ierr = MPI_Wait(
+                    &self.requests[source % GATHER_WINDOW],
+                    MPI_STATUS_IGNORE)
+                count = self.counts[source % GATHER_WINDOW]
+            else:
+                ierr = MPI_Recv_c(
+                    &count, 1, MPI_COUNT,
+                    source, self.tag, self.comm, MPI_STATUS_IGNORE)
+            if ierr != MPI_SUCCESS: break
+            buf = PyMem_RawMalloc(<size_t>max(count, 1))
+            if buf == NULL: break
+            ierr = MPI_Recv_c(
+                buf, count, MPI_BYTE,
+                source, self.tag, self.comm, MPI_STATUS_IGNORE)
+            PyMem_RawFree(buf)
+        return 0
+
+
+cdef object PyMPI_gather_iter(object sendobj, int root, MPI_Comm comm):
+    cdef Pickle pickle = PyMPI_PICKLE
+    cdef int tag = MPI_UNDEFINED
+    cdef int inter = 0, size = 0, rank = MPI_PROC_NULL
+    CHKERR( MPI_Comm_test_inter(comm, &inter) )
+    if inter:
+        CHKERR( MPI_Comm_remote_size(comm, &size) )
+    else:
+        CHKERR( MPI_Comm_size(comm, &size) )
+        CHKERR( MPI_Comm_rank(comm, &rank) )
+    if not ((0 <= root < size) or
+            (inter and (root == MPI_ROOT or root == MPI_PROC_NULL))):
+        <void>MPI_Comm_call_errhandler(comm, MPI_ERR_ROOT)
+        raise MPIException(MPI_ERR_ROOT)
+    if inter:
+        PyMPI_Commctx_INTER(comm, &comm, &tag, NULL, NULL)
+        if root == MPI_PROC_NULL:
+            return None
+        if root != MPI_ROOT:
+            PyMPI_send_p2p(sendobj, root, tag, comm)
+            return None
+    else:
+        PyMPI_Commctx_INTRA(comm, &comm, &tag)
+        if root != rank:
+            PyMPI_send_p2p(sendobj, root, tag, comm)
+            return None
+    cdef _p_gather_iter items = _p_gather_iter.__new__(_p_gather_iter)
+    items.comm = comm
+    items.tag  = tag
+    items.size = size
+    items.rank = rank
+    if not inter:
+        items.data = cdumps(pickle, sendobj)
+    items.post()
+    return items
+
+# ---
+
 cdef inline bint comm_is_intra(MPI_Comm comm) except -1 nogil:
     cdef int inter = 0
     CHKERR( MPI_Comm_test_inter(comm, &inter) )
     if inter: return 0
     else:     return 1
 
+# ---
+
+cdef inline bint op_is_arith(MPI_Op op) noexcept nogil:
+    return op == MPI_MAX or op == MPI_MIN or op == MPI_SUM or op == MPI_PROD
+
+cdef inline bint op_is_logic(MPI_Op op) noexcept nogil:
+    return op == MPI_LAND or op == MPI_LOR or op == MPI_LXOR
+
+cdef inline bint op_is_bitwise(MPI_Op op) noexcept nogil:
+    return op == MPI_BAND or op == MPI_BOR or op == MPI_BXOR
+
+cdef inline bint op_is_valid(MPI_Op op, str fmt):
+    if fmt not in TypeDict:
+        return 0
+    if fmt in ('b', 'B', 'h', 'H', 'i', 'I', 'l', 'L', 'q', 'Q', 'n', 'N'):
+        return op_is_arith(op) or op_is_logic(op) or op_is_bitwise(op)
+    if fmt in ('e', 'f', 'd', 'g'):
+        return op_is_arith(op)
+    if fmt in ('Ze', 'Zf', 'Zd', 'Zg', 'E', 'F', 'D', 'G'):
+        return op == MPI_SUM or op == MPI_PROD
+    if fmt == '?':
+        return op_is_logic(op)
+    return 0
+
+
+cdef tuple reduce_buffer_fmts = (
+    '?', 'b', 'B', 'h', 'H', 'i', 'I', 'l', 'L', 'q', 'Q', 'n', 'N',
+    'e', 'f', 'd', 'g', 'Ze', 'Zf', 'Zd', 'Zg', 'E', 'F', 'D', 'G',
+)
+
+
+cdef object reduce_buffer_local(object obj, object op,
+                                MPI_Count sig[], bint *contig):
+    # local message for buffer-based reductions of CPU arrays
+    cdef type cls = type(obj)
+    if hasattr(cls, '__array_interface__'):
+        pass
+    elif hasattr(cls, '__dlpack_device__'):
+        if obj.__dlpack_device__()[0] != kDLCPU: return None
+    else:
+        return None
+    if getattr(obj, 'ndim', 0) < 1: return None
+    # validate the original object, copying is deferred to callers
+    cdef Py_buffer view
+    cdef int kind = 0
+    cdef str fmt
+    try:
+        kind = PyMPI_GetBuffer(obj, &view, PyBUF_STRIDES | PyBUF_FORMAT)
+    except (BufferError, ValueError):
+        return None
+    try:
+        fmt = pystr(getformat(view.format))
+        contig[0] = PyBuffer_IsContiguous(&view, c'A')
+        sig[2] = view.len // view.itemsize
+    except (BufferError, ValueError):
+        return None
+    finally:
+        PyMPI_ReleaseBuffer(kind, &view)
+    if not op_is_valid((<Op>op).ob_mpi, fmt):
+        return None
+    if fmt not in reduce_buffer_fmts:
+        return None
+    sig[0] = 1
+    sig[1] = reduce_buffer_fmts.index(fmt) + 1
+    return [obj, TypeDict[fmt]]
+
+
+cdef object reduce_buffer_recv(object msg, object obj):
+    # results are received in place, never into the caller's array
+    if msg[0] is obj:
+        from copy import copy
+        msg[0] = copy(obj)
+    return msg
+
+
+cdef object reduce_buffer_msg(object obj, object op, MPI_Comm comm):
+    # message for buffer-based reductions of CPU arrays, None otherwise
+    if not options.buffer_reduce: return None
+    if type(op) is not Op: return None
+    if not comm_is_intra(comm): return None
+    # all processes must agree on the datatype and count
+    cdef MPI_Count sig[5]
+    sig[0] = sig[1] = sig[2] = 0
+    cdef bint contig = 0
+    cdef object msg = reduce_buffer_local(obj, op, sig, &contig)
+    sig[3] = -sig[1]
+    sig[4] = -sig[2]
+    with nogil: CHKERR( MPI_Allreduce(
+        MPI_IN_PLACE, sig, 5, MPI_COUNT, MPI_MIN, comm) )
+    if sig[0] != 1: return None
+    if sig[1] != -sig[3]: return None
+    if sig[2] != -sig[4]: return None
+    if not contig:
+        from copy import copy
+        msg[0] = copy(obj)
+    return msg
+
+
+cdef object PyMPI_reduce_buffer(object msg, object obj, object op,
+                                int root, MPI_Comm comm):
+    cdef int rank = MPI_PROC_NULL
+    CHKERR( MPI_Comm_rank(comm, &rank) )
+    cdef MPI_Op cop = (<Op>op).ob_mpi
+    if rank == root:
+        msg = reduce_buffer_recv(msg, obj)
+    cdef _p_msg_cco m = message_cco()
+    m.for_reduce(msg, msg, root, comm)
+    with nogil: CHKERR( MPI_Reduce_c(
+        m.sbuf, m.rbuf, m.rcount, m.rtype,
+        cop, root, comm) )
+    return msg[0] if rank == root else None
+
+cdef object PyMPI_allreduce_buffer(object msg, object obj,
+                                   object op, MPI_Comm comm):
+    cdef MPI_Op cop = (<Op>op).ob_mpi
+    msg = reduce_buffer_recv(msg, obj)
+    cdef _p_msg_cco m = message_cco()
+    m.for_allreduce(msg, msg, comm)
+    with nogil: CHKERR( MPI_Allreduce_c(
+        m.sbuf, m.rbuf, m.rcount, m.rtype,
+        cop, comm) )
+    return msg[0]
+
+cdef object PyMPI_scan_buffer(object msg, object obj,
+                              object op, MPI_Comm comm):
+    cdef MPI_Op cop = (<Op>op).ob_mpi
+    msg = reduce_buffer_recv(msg, obj)
+    cdef _p_msg_cco m = message_cco()
+    m.for_scan(msg, msg, comm)
+    with nogil: CHKERR( MPI_Scan_c(
+        m.sbuf, m.rbuf, m.rcount, m.rtype,
+        cop, comm) )
+    return msg[0]
+
+cdef object PyMPI_exscan_buffer(object msg, object obj,
+                                object op, MPI_Comm comm):
+    cdef int rank = MPI_PROC_NULL
+    CHKERR( MPI_Comm_rank(comm, &rank) )
+    cdef MPI_Op cop = (<Op>op).ob_mpi
+    msg = reduce_buffer_recv(msg, obj)
+    cdef _p_msg_cco m = message_cco()
+    m.for_exscan(msg, msg, comm)
+    with nogil: CHKERR( MPI_Exscan_c(
+        m.sbuf, m.rbuf, m.rcount, m.rtype,
+        cop, comm) )
+    return msg[0] if rank != 0 else None
+
 
 cdef object PyMPI_reduce(object sendobj, object op, int root, MPI_Comm comm):
-    if not options.fast_reduce:
+    cdef object msg = reduce_buffer_msg(sendobj, op, comm)
+    if msg is not None:
+        return PyMPI_reduce_buffer(msg, sendobj, op, root, comm)
+    elif not options.fast_reduce:
         return PyMPI_reduce_naive(sendobj, op, root, comm)
     elif comm_is_intra(comm):
         return PyMPI_reduce_intra(sendobj, op, root, comm)
@@ -1354,7 +3285,10 @@ cdef object PyMPI_reduce(object sendobj, object op, int root, MPI_Comm comm):
 
 
 cdef object PyMPI_allreduce(object sendobj, object op, MPI_Comm comm):
-    if not options.fast_reduce:
+    cdef object msg = reduce_buffer_msg(sendobj, op, comm)
+    if msg is not None:
+        return PyMPI_allreduce_buffer(msg, sendobj, op, comm)
+    elif not options.fast_reduce:
         return PyMPI_allreduce_naive(sendobj, op, comm)
     elif comm_is_intra(comm):
         return PyMPI_allreduce_intra(sendobj, op, comm)
@@ -1363,14 +3297,20 @@ cdef object PyMPI_allreduce(object sendobj, object op, MPI_Comm comm):
 
 
 cdef object PyMPI_scan(object sendobj, object op, MPI_Comm comm):
-    if not options.fast_reduce:
+    cdef object msg = reduce_buffer_msg(sendobj, op, comm)
+    if msg is not None:
+        return PyMPI_scan_buffer(msg, sendobj, op, comm)
+    elif not options.fast_reduce:
         return PyMPI_scan_naive(sendobj, op, comm)
     else:
         return PyMPI_scan_intra(sendobj, op, comm)
 
 
 cdef object PyMPI_exscan(object sendobj, object op, MPI_Comm comm):
-    if not options.fast_reduce:
+    cdef object msg = reduce_buffer_msg(sendobj, op, comm)
+    if msg is not None:
+        return PyMPI_exscan_buffer(msg, sendobj, op, comm)
+    elif not options.fast_reduce:
         return PyMPI_exscan_naive(sendobj, op, comm)
     else:
         return PyMPI_exscan_intra(sendobj, op, comm)
@@ -40,10 +40,20 @@ class Rc:
         Automatic MPI finalization at exit (default: None).
     fast_reduce : bool
         Use tree-based reductions for objects (default: True).
+    buffer_reduce : bool
+        Use buffer-based reductions for arrays (default: False).
     recv_mprobe : bool
         Use matched probes to receive objects (default: True).
     irecv_bufsz : int
         Default buffer size in bytes for ``irecv()`` (default = 32768).
+    irecv_adapt : bool
+        Adapt buffer size for ``irecv()`` to messages (default: False).
+    recv_arena : int
+        Receive buffer arena size in bytes for objects (default = 0).
+    bcast_segsz : int
+        Segment size in bytes for pipelined ``bcast()`` (default = 0).
+    pickle_oob : bool
+        Send large buffers of objects out-of-band (default: False).
     errors : {"exception", "default", "abort", "fatal"}
         Error handling policy (default: "exception").
 
@@ -54,8 +64,13 @@ class Rc:
     thread_level = "multiple"
     finalize = None
     fast_reduce = True
+    buffer_reduce = False
     recv_mprobe = True
     irecv_bufsz = 32768
+    irecv_adapt = False
+    recv_arena = 0
+    bcast_segsz = 0
+    pickle_oob = False
     errors = "exception"
 
     def __init__(self, **kwargs):
@@ -14,8 +14,13 @@ class Rc:
     thread_level: str = "multiple"
     finalize: bool | None = None
     fast_reduce: bool = True
+    buffer_reduce: bool = False
     recv_mprobe: bool = True
     irecv_bufsz: int = 32768
+    irecv_adapt: bool = False
+    recv_arena: int = 0
+    bcast_segsz: int = 0
+    pickle_oob: bool = False
     errors: str = "exception"
     def __init__(
         self,
@@ -10,6 +10,7 @@
 
 import atexit
 import collections
+import functools
 import itertools
 import os
 import sys
@@ -109,6 +110,14 @@ else:  # pragma: no cover
         return sys.exc_info()[1]
 
 
+def _pickle_error(obj):
+    try:
+        MPI.pickle.dumps(obj)
+    except BaseException:
+        return sys_exception()
+    return None
+
+
 def os_environ_get(name, default=None):
     varname = f"MPI4PY_FUTURES_{name}"
     if varname not in os.environ:
@@ -136,6 +145,67 @@ def _getopt_backoff(options):
     return float(backoff)
 
 
+MAX_INFLIGHT = 1
+
+
+def _getopt_max_inflight(options):
+    max_inflight = options.get("max_inflight")
+    if max_inflight is None:
+        max_inflight = os_environ_get("MAX_INFLIGHT", MAX_INFLIGHT)
+    return max(int(max_inflight), 1)
+
+
+PROGRESS = "poll"
+
+
+def _getopt_progress(options):
+    return options.get("progress", PROGRESS)
+
+
+def _setopt_progress(options):
+    progress = options.get("progress")
+    if progress is None:
+        progress = os_environ_get("PROGRESS", PROGRESS)
+    if progress not in ("poll", "wakeup"):
+        warnings.warn(
+            f"environment variable MPI4PY_FUTURES_PROGRESS: "
+            f"unexpected value {progress!r}",
+            RuntimeWarning,
+            stacklevel=1,
+        )
+        progress = PROGRESS
+    options["progress"] = progress
+    return progress
+
+
+BATCH_SIZE = 1
+BATCH_DELAY = 0.0
+
+
+def _getopt_batch_size(options):
+    batch_size = options.get("batch_size")
+    if batch_size is None:
+        batch_size = os_environ_get("BATCH_SIZE", BATCH_SIZE)
+    return max(int(batch_size), 1)
+
+
+def _getopt_batch_delay(options):
+    batch_delay = options.get("batch_delay")
+    if batch_delay is None:
+        batch_delay = os_environ_get("BATCH_DELAY", BATCH_DELAY)
+    return max(float(batch_delay), 0.0)
+
+
+FUNC_CACHE = 0
+
+
+def _getopt_func_cache(options):
+    func_cache = options.get("func_cache")
+    if func_cache is None:
+        func_cache = os_environ_get("FUNC_CACHE", FUNC_CACHE)
+    return max(int(func_cache), 0)
+
+
 class Backoff:
     #
     def __init__(self, seconds=BACKOFF):
@@ -146,8 +216,11 @@ class Backoff:
     def reset(self):
         self.tval = 0.0
 
-    def sleep(self):
-        time.sleep(self.tval)
+    def sleep(self, event=None):
+        if event is None:
+            time.sleep(self.tval)
+        else:
+            event.wait(self.tval)
         self.tval = min(self.tmax, max(self.tmin, self.tval * 2))
 
 
@@ -155,6 +228,18 @@ class TaskQueue(collections.deque):
     put = collections.deque.append
     pop = collections.deque.popleft
     add = collections.deque.appendleft
+    wakeup = None
+
+
+class WakeupTaskQueue(TaskQueue):
+    def __init__(self):
+        super().__init__()
+        self.wakeup = threading.Event()
+
+    def put(self, item):
+        self.append(item)
+        if not self.wakeup.is_set():
+            self.wakeup.set()
 
 
 class WorkerSet(collections.deque):
@@ -183,8 +268,12 @@ class Pool:
     #
     def __init__(self, executor, manager, *args):
         self.size = None
+        self.local = False
         self.event = threading.Event()
-        self.queue = queue = TaskQueue()
+        if _setopt_progress(executor._options) == "wakeup":
+            self.queue = queue = WakeupTaskQueue()
+        else:
+            self.queue = queue = TaskQueue()
         self.exref = weakref.ref(executor, lambda _, q=queue: q.put(None))
 
         args = (self, executor._options, *args)
@@ -208,8 +297,9 @@ class Pool:
     def join(self):
         self.thread.join()
 
-    def setup(self, size):
+    def setup(self, size, local=False):
         self.size = size
+        self.local = local
         self.event.set()
         return self.queue
 
@@ -270,7 +360,7 @@ def initialize(options):
 
 def _manager_thread(pool, options):
     size = options.pop("max_workers", 1)
-    queue = pool.setup(size)
+    queue = pool.setup(size, local=True)
     threads = collections.deque()
     max_threads = size - 1
 
@@ -422,10 +512,11 @@ class SharedPoolCtx:
         if options.get("initializer") is None:
             return True
         task = (self._initialize_remote, (), {})
-        reqs = isendtoall(self.comm, task, tag)
-        waitall(self.comm, reqs, poll=True)
-        success = client_init(self.comm, options)
-        recvfromall(self.comm, tag)
+        with _store_lock:
+            reqs = isendtoall(self.comm, task, tag)
+            waitall(self.comm, reqs, poll=True)
+            success = client_init(self.comm, options)
+            recvfromall(self.comm, tag)
         return success
 
     def _manager(self, pool, options):
@@ -643,6 +734,27 @@ def bcast_recv(comm):
     return data
 
 
+def bcast_send_bytes(comm, data):
+    if MPI.VERSION >= 2:
+        size = memoryview(bytearray(8)).cast("q")
+        size[0] = len(data)
+        comm.Bcast([size, MPI.INT64_T], MPI.ROOT)
+        comm.Bcast([data, MPI.BYTE], MPI.ROOT)
+    else:  # pragma: no cover
+        bcast_send(comm, data)
+
+
+def bcast_recv_bytes(comm):
+    if MPI.VERSION >= 2:
+        size = memoryview(bytearray(8)).cast("q")
+        comm.Bcast([size, MPI.INT64_T], 0)
+        data = bytearray(size[0])
+        comm.Bcast([data, MPI.BYTE], 0)
+    else:  # pragma: no cover
+        data = bcast_recv(comm)
+    return data
+
+
 def isendtoall(comm, data, tag=0):
     size = comm.Get_remote_size()
     return [comm.issend(data, pid, tag) for pid in range(size)]
@@ -682,6 +794,231 @@ def disconnect(comm):
 # ---
 
 
+STORE_SIZE = 16
+
+_store = collections.OrderedDict()  # type: collections.OrderedDict
+_store_keys = itertools.count(1)
+_store_lock = threading.Lock()
+
+
+class Store:
+    __slots__ = ("key", "data", "size")
+
+    def __init__(self, key, data=None, size=STORE_SIZE):
+        self.key = key
+        self.data = data
+        self.size = size
+
+    def __reduce__(self):
+        return (Store, (self.key, None, self.size))
+
+
+class Handle:
+    __slots__ = ("key", "future")
+
+    def __init__(self, key, future=None):
+        self.key = key
+        self.future = future
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.key}>"
+
+    def __reduce__(self):
+        future = self.future
+        if future is not None and future.done() and not future.cancelled():
+            exception = future.exception()
+            if exception is not None:
+                message = f"object {self.key} failed to store in workers"
+                raise RuntimeError(message) from exception
+        return (_store_get, (self.key,))
+
+
+def store_task(obj, options, future=None):
+    data = MPI.pickle.dumps(obj)
+    size = options.get("store_size", STORE_SIZE)
+    with _store_lock:
+        key = next(_store_keys)
+    return Store(key, data, size), Handle(key, future)
+
+
+def _store_put(key, obj, exc, size):
+    _store[key] = (obj, exc)
+    while len(_store) > size:
+        _store.popitem(last=False)
+
+
+def _store_get(key):
+    try:
+        obj, exc = _store[key]
+    except KeyError:
+        message = f"object {key} not found in worker store"
+        raise LookupError(message) from None
+    _store.move_to_end(key)
+    if exc is not None:
+        raise exc
+    return obj
+
+
+_partials = {}  # type: dict
+_partials_keys = itertools.count(1)
+
+
+class Reduce:
+    __slots__ = ("key", "data", "reducer")
+
+    def __init__(self, key, data, reducer=None):
+        self.key = key
+        self.data = data
+        self.reducer = reducer
+
+    def __reduce__(self):
+        return (Reduce, (self.key, self.data))
+
+
+def reduce_task(reducer):
+    data = MPI.pickle.dumps(reducer)
+    with _store_lock:
+        key = next(_partials_keys)
+    return Reduce(key, data, reducer)
+
+
+def _reduce_pair(reducer, a, b):
+    if isinstance(a, BaseException):
+        return a
+    if isinstance(b, BaseException):
+        return b
+    if not a:
+        return b
+    if not b:
+        return a
+    try:
+        return (reducer(a[0], b[0]),)
+    except BaseException:
+        exc = sys_exception()
+        tb = _format_exc(exc, MPI.COMM_WORLD)
+        return _wrap_exc(exc, tb)
+
+
+def _reduce_chunk(key, function, reducer, chunk):
+    value = functools.reduce(reducer, map(function, chunk))
+    if key in _partials:
+        value = reducer(_partials[key], value)
+    _partials[key] = value
+
+
+def _reduce_local(function, reducer, chunk):
+    return (functools.reduce(reducer, map(function, chunk)),)
+
+
+_funcs = {}  # type: dict
+_funcs_keys = itertools.count(1)
+
+
+class FuncRef:
+    __slots__ = ("key", "func", "drop")
+
+    def __init__(self, key, func=None, drop=()):
+        self.key = key
+        self.func = func
+        self.drop = drop
+
+    def __reduce__(self):
+        if self.func is None:
+            return (_funcs_get, (self.key, self.drop))
+        return (_funcs_put, (self.key, self.func, self.drop))
+
+
+def _funcs_drop(keys):
+    for key in keys:
+        _funcs.pop(key, None)
+
+
+def _funcs_put(key, func, drop):
+    _funcs_drop(drop)
+    _funcs[key] = func
+    return func
+
+
+def _funcs_get(key, drop):
+    _funcs_drop(drop)
+    try:
+        return _funcs[key]
+    except KeyError:
+        message = f"callable {key} not found in worker cache"
+        raise LookupError(message) from None
+
+
+class FuncCache:
+    #
+    def __init__(self, size):
+        self.size = size
+        self.funcs = collections.OrderedDict()
+        self.holders = {}
+        self.stale = {}
+
+    def lookup(self, func):
+        funcs = self.funcs
+        try:
+            _, key = funcs[id(func)]
+        except KeyError:
+            key = next(_funcs_keys)
+            funcs[id(func)] = (func, key)
+            self.holders[key] = set()
+            if len(funcs) > self.size:
+                _, (_, old) = funcs.popitem(last=False)
+                for pid in self.holders.pop(old):
+                    self.stale.setdefault(pid, []).append(old)
+        else:
+            funcs.move_to_end(id(func))
+        return key
+
+    def encode(self, pid, tasks):
+        defs, drop = [], self.stale.pop(pid, [])
+        message = []
+        for func, args, kwargs in tasks:
+            key = self.lookup(func)
+            if pid in self.holders[key] or key in defs:
+                ref = FuncRef(key, None, drop)
+            else:
+                ref = FuncRef(key, func, drop)
+                defs.append(key)
+            message.append((ref, args, kwargs))
+            drop = ()
+        return message, defs
+
+    def commit(self, pid, defs):
+        for key in defs:
+            if key in self.holders:
+                self.holders[key].add(pid)
+            else:
+                self.stale.setdefault(pid, []).append(key)
+
+    def revert(self, pid, message):
+        ref = message[0][0]
+        if ref.drop:
+            self.stale.setdefault(pid, []).extend(ref.drop)
+
+    def forget(self, pid, defs):
+        for key in defs:
+            if key in self.holders:
+                self.holders[key].discard(pid)
+
+    def clear(self):
+        keys = {}
+        for key, pids in self.holders.items():
+            for pid in pids:
+                keys.setdefault(pid, []).append(key)
+        for pid, drop in self.stale.items():
+            keys.setdefault(pid, []).extend(drop)
+        self.funcs.clear()
+        self.holders.clear()
+        self.stale.clear()
+        return {pid: keys[pid] for pid in keys if keys[pid]}
+
+
+# ---
+
+
 def client_sync(comm, options, sync=True):
     serialized(barrier)(comm)
     _setopt_use_pkl5(options)
@@ -705,14 +1042,41 @@ def client_exec(comm, options, tag, worker_set, task_queue):
     # pylint: disable=too-many-locals
     # pylint: disable=too-many-statements
     backoff = Backoff(_getopt_backoff(options))
+    max_inflight = _getopt_max_inflight(options)
+    func_cache = _getopt_func_cache(options)
+    batch_size = _getopt_batch_size(options)
+    batch_delay = _getopt_batch_delay(options)
+    timer = time.monotonic
+    since = None
+    wakeup = task_queue.wakeup
+    if _getopt_progress(options) != "wakeup":
+        wakeup = None
 
     status = MPI.Status()
     comm_recv = serialized(comm.recv)
     comm_isend = serialized(comm.issend)
     comm_iprobe = serialized(comm.iprobe)
+    comm_bcast = serialized(bcast_send_bytes)
+    comm_reduce = serialized(comm.reduce)
+    comm_isendtoall = serialized(isendtoall)
+    comm_recvfromall = serialized(recvfromall)
     request_free = serialized(_get_request(comm).Free)
+    request_testall = serialized(_get_request(comm).testall)
 
     pending = {}
+    slots = WorkerSet()
+    cache = FuncCache(func_cache) if func_cache > 0 else None
+
+    def acquire():
+        if worker_set:
+            return worker_set.pop()
+        return slots.pop()
+
+    def release(pid):
+        if pid in pending:
+            slots.add(pid)
+        else:
+            worker_set.add(pid)
 
     def iprobe():
         pid = MPI.ANY_SOURCE
@@ -724,6 +1088,18 @@ def client_exec(comm, options, tag, worker_set, task_queue):
         while not comm_iprobe(pid, tag, status):
             backoff.sleep()
 
+    def idle():
+        if wakeup is None:
+            backoff.sleep()
+            return
+        wakeup.clear()
+        if task_queue and not (worker_set or slots):
+            backoff.sleep()
+        elif task_queue or pending:
+            backoff.sleep(wakeup)
+        else:
+            wakeup.wait()
+
     def recv():
         pid = MPI.ANY_SOURCE
         try:
@@ -731,52 +1107,174 @@ def client_exec(comm, options, tag, worker_set, task_queue):
         except BaseException:
             task = (None, sys_exception())
         pid = status.source
-        worker_set.add(pid)
-
-        future, request = pending.pop(pid)
-        request_free(request)
-        result, exception = task
-        if exception is None:
-            future.set_result(result)
+        inflight = pending[pid]
+        futures, request, defs = inflight[0]
+        if isinstance(task, list):
+            count, data = task
+            try:
+                results = MPI.pickle.loads(data)
+            except BaseException:
+                results = itertools.repeat((None, sys_exception()), count)
+            del data
         else:
-            future.set_exception(exception)
-
-        del result, exception
-        del future, task
-
-    def send():
+            count = len(futures)
+            results = itertools.repeat(task, count)
+        if count < len(futures):
+            inflight[0] = (futures[count:], request, defs)
+            futures = futures[:count]
+        else:
+            inflight.popleft()
+            if not inflight:
+                del pending[pid]
+                if pid in slots:
+                    slots.remove(pid)
+                worker_set.add(pid)
+            elif len(inflight) == max_inflight - 1:
+                slots.add(pid)
+            request_free(request)
+
+        failed = False
+        for future, (result, exception) in zip(futures, results):
+            if exception is None:
+                future.set_result(result)
+            else:
+                future.set_exception(exception)
+                failed = True
+            del future, result, exception
+        if failed and defs:
+            cache.forget(pid, defs)
+
+        del futures, task, results
+
+    def dispatch(pid, items):
+        while items:
+            futures = [future for future, _ in items]
+            tasks = [task for _, task in items]
+            defs = ()
+            if cache is not None:
+                tasks, defs = cache.encode(pid, tasks)
+            message = tasks if len(tasks) > 1 else tasks[0]
+            try:
+                request = comm_isend(message, pid, tag)
+            except BaseException:
+                exception = sys_exception()
+                if cache is not None:
+                    cache.revert(pid, tasks)
+                if len(items) > 1:
+                    for future, task in items:
+                        error = _pickle_error(task)
+                        if error is not None:
+                            future.set_exception(error)
+                        del future, task, error
+                    items = [item for item in items if not item[0].done()]
+                if len(items) == len(futures):
+                    for future in futures:
+                        future.set_exception(exception)
+                    items = []
+                del exception
+            else:
+                inflight = pending.setdefault(pid, collections.deque())
+                if cache is not None:
+                    cache.commit(pid, defs)
+                inflight.append((futures, request, defs))
+                if len(inflight) < max_inflight:
+                    slots.add(pid)
+                return
+            finally:
+                del futures, tasks, defs, message
+        release(pid)
+
+    def purge(keys):
+        requests = [
+            comm_isend((_funcs_drop, (keys[pid],), {}), pid, tag)
+            for pid in keys
+        ]
+        for _ in requests:
+            probe()
+            comm_recv(None, status.source, tag, status)
+        for request in requests:
+            request_free(request)
+
+    def collective(future, task):
+        if not future.set_running_or_notify_cancel():
+            return
+        while pending:
+            probe()
+            recv()
         try:
-            pid = worker_set.pop()
-        except LookupError:  # pragma: no cover
-            return False
+            with _store_lock:
+                requests = comm_isendtoall(comm, task, tag)
+                backoff.reset()
+                while not request_testall(requests)[0]:
+                    backoff.sleep()
+                if isinstance(task, Store):
+                    value = comm_bcast(comm, task.data)
+                else:
+                    op = functools.partial(_reduce_pair, task.reducer)
+                    value = comm_reduce(None, op, MPI.ROOT)
+                results = comm_recvfromall(comm, tag)
+        except BaseException:
+            future.set_exception(sys_exception())
+            return
+        for _, exception in results:
+            if exception is not None:
+                future.set_exception(exception)
+                break
+        else:
+            if isinstance(value, BaseException):
+                future.set_exception(value)
+            else:
+                future.set_result(value)
+        del value, results
 
+    def send():
         try:
-            item = task_queue.pop()
+            pid = acquire()
         except LookupError:  # pragma: no cover
-            worker_set.add(pid)
-            return False
-
-        if item is None:
-            worker_set.add(pid)
-            return True
-
-        future, task = item
-        if not future.set_running_or_notify_cancel():
-            worker_set.add(pid)
             return False
 
-        try:
-            request = comm_isend(task, pid, tag)
-            pending[pid] = (future, request)
-        except BaseException:
-            worker_set.add(pid)
-            future.set_exception(sys_exception())
+        # spread the pending tasks over the idle workers
+        limit = -(-len(task_queue) // (len(worker_set) + 1))
+        limit = max(min(limit, batch_size), 1)
+        stop = False
+        items = []
+        while len(items) < limit:
+            try:
+                item = task_queue.pop()
+            except LookupError:
+                break
+            if item is None:
+                stop = True
+                break
+            future, task = item
+            if isinstance(task, (Store, Reduce)):
+                if items:
+                    task_queue.add(item)
+                    break
+                release(pid)
+                collective(future, task)
+                return False
+            if future.set_running_or_notify_cancel():
+                items.append(item)
+            del future, task, item
 
-        del future, task, item
-        return None
+        dispatch(pid, items)
+        del items
+        return stop
+
+    def ready():
+        nonlocal since
+        if batch_delay > 0 and len(task_queue) < batch_size:
+            now = timer()
+            if since is None:
+                since = now
+            if now - since < batch_delay:
+                return False
+        since = None
+        return True
 
     while True:
-        if task_queue and worker_set:
+        if task_queue and (worker_set or slots) and ready():
             backoff.reset()
             stop = send()
             if stop:
@@ -784,10 +1282,12 @@ def client_exec(comm, options, tag, worker_set, task_queue):
         if pending and iprobe():
             backoff.reset()
             recv()
-        backoff.sleep()
+        idle()
     while pending:
         probe()
         recv()
+    if cache is not None:
+        purge(cache.clear())
 
 
 def client_stop(comm):
@@ -815,6 +1315,7 @@ def server_init(comm):
 
 def server_exec(comm, options):
     backoff = Backoff(_getopt_backoff(options))
+    max_inflight = _getopt_max_inflight(options)
 
     status = MPI.Status()
     comm_recv = comm.recv
@@ -822,6 +1323,8 @@ def server_exec(comm, options):
     comm_iprobe = comm.iprobe
     request_test = _get_request(comm).test
 
+    pending = collections.deque()
+
     def exception():
         exc = sys_exception()
         tb = _format_exc(exc, comm)
@@ -842,6 +1345,10 @@ def server_exec(comm, options):
     def call(task):
         if isinstance(task, BaseException):
             return (None, task)
+        if isinstance(task, Store):
+            return store(task)
+        if isinstance(task, Reduce):
+            return reduce(task)
         func, args, kwargs = task
         try:
             result = func(*args, **kwargs)
@@ -850,6 +1357,51 @@ def server_exec(comm, options):
         else:
             return (result, None)
 
+    def store(task):
+        data = bcast_recv_bytes(comm)
+        try:
+            obj = MPI.pickle.loads(data)
+        except BaseException:
+            exc = sys_exception()
+            _store_put(task.key, None, exc, task.size)
+            return (None, exception())
+        _store_put(task.key, obj, None, task.size)
+        return (None, None)
+
+    def reduce(task):
+        partial = ()
+        if task.key in _partials:
+            partial = (_partials.pop(task.key),)
+        try:
+            reducer = MPI.pickle.loads(task.data)
+            MPI.pickle.dumps(partial)
+        except BaseException:
+            reducer, partial = None, exception()
+        op = functools.partial(_reduce_pair, reducer)
+        comm.reduce(partial, op, 0)
+        return (None, None)
+
+    def check(item):
+        try:
+            MPI.pickle.dumps(item)
+        except BaseException:
+            return (None, exception())
+        return item
+
+    def pack(results):
+        # replies to batches carry the number of results they cover
+        try:
+            data = MPI.pickle.dumps(results)
+        except BaseException:
+            data = MPI.pickle.dumps([check(item) for item in results])
+        return [len(results), data]
+
+    def batch(tasks):
+        # completed results never wait on a task that has not started
+        for task in tasks:
+            send(pack([call(task)]))
+            del task
+
     def send(task):
         pid, tag = status.source, status.tag
         try:
@@ -857,16 +1409,29 @@ def server_exec(comm, options):
         except BaseException:
             task = (None, exception())
             request = comm_isend(task, pid, tag)
+        pending.append(request)
+        flush(max_inflight)
+
+    def flush(limit=1):
         backoff.reset()
-        while not request_test(request)[0]:
-            backoff.sleep()
+        while pending:
+            if request_test(pending[0])[0]:
+                pending.popleft()
+                backoff.reset()
+            elif len(pending) < limit:
+                break
+            else:
+                backoff.sleep()
 
     while True:
         task = recv()
         if task is None:
             break
-        task = call(task)
-        send(task)
+        if isinstance(task, list):
+            batch(task)
+        else:
+            send(call(task))
+    flush()
 
 
 def server_stop(comm):
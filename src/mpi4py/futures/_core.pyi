@@ -41,6 +41,11 @@ def sys_exception() -> BaseException: ...
 def os_environ_get(name: str, default: T | None = ...) -> str | T | None: ...
 
 BACKOFF: float = ...
+MAX_INFLIGHT: int = ...
+PROGRESS: str = ...
+BATCH_SIZE: int = ...
+BATCH_DELAY: float = ...
+FUNC_CACHE: int = ...
 
 class Backoff:
     tval: float
@@ -48,13 +53,17 @@ class Backoff:
     tmin: float
     def __init__(self, seconds: float = BACKOFF) -> None: ...
     def reset(self) -> None: ...
-    def sleep(self) -> None: ...
+    def sleep(self, event: threading.Event | None = None) -> None: ...
 
 class TaskQueue(Generic[T]):
+    wakeup: threading.Event | None
     def put(self, x: T, /) -> None: ...
     def pop(self) -> T: ...
     def add(self, x: T, /) -> None: ...
 
+class WakeupTaskQueue(TaskQueue[T]):
+    wakeup: threading.Event
+
 class WorkerSet(Generic[T]):
     def add(self, x: T, /) -> None: ...
     def pop(self) -> T: ...
@@ -69,6 +78,7 @@ def join_threads(threads_queues: _ThreadQueueMap = ...) -> None: ...
 
 class Pool:
     size: int
+    local: bool
     queue: TaskQueue[_Item[Any] | None]
     exref: weakref.ReferenceType[Executor]
     event: threading.Event
@@ -83,7 +93,11 @@ class Pool:
     def push(self, item: _Item[Any]) -> None: ...
     def done(self) -> None: ...
     def join(self) -> None: ...
-    def setup(self, size: int) -> TaskQueue[_Item[Any] | None]: ...
+    def setup(
+        self,
+        size: int,
+        local: bool = False,
+    ) -> TaskQueue[_Item[Any] | None]: ...
     def cancel(
         self,
         handler: Callable[[Future[Any]], None] | None = ...,
@@ -114,10 +128,75 @@ def _comm_executor_world() -> Intracomm: ...
 def _comm_executor_helper(
     executor: Executor | None, comm: Intracomm, root: int
 ) -> None: ...
+STORE_SIZE: int = ...
+
+class Store:
+    key: int
+    data: bytes | None
+    size: int
+    def __init__(
+        self,
+        key: int,
+        data: bytes | None = None,
+        size: int = STORE_SIZE,
+    ) -> None: ...
+
+class Handle:
+    key: int
+    future: Future[None] | None
+    def __init__(
+        self, key: int, future: Future[None] | None = None
+    ) -> None: ...
+
+def store_task(
+    obj: Any,
+    options: Mapping[str, Any],
+    future: Future[None] | None = None,
+) -> tuple[Store, Handle]: ...
+class Reduce:
+    key: int
+    data: bytes
+    reducer: Callable[[Any, Any], Any] | None
+    def __init__(
+        self,
+        key: int,
+        data: bytes,
+        reducer: Callable[[Any, Any], Any] | None = None,
+    ) -> None: ...
+
+def reduce_task(reducer: Callable[[Any, Any], Any]) -> Reduce: ...
+
+class FuncRef:
+    key: int
+    func: Callable[..., Any] | None
+    drop: Sequence[int]
+    def __init__(
+        self,
+        key: int,
+        func: Callable[..., Any] | None = None,
+        drop: Sequence[int] = (),
+    ) -> None: ...
+
+class FuncCache:
+    size: int
+    def __init__(self, size: int) -> None: ...
+    def lookup(self, func: Callable[..., Any]) -> int: ...
+    def encode(
+        self, pid: int, tasks: Sequence[_Task[Any]]
+    ) -> tuple[list[tuple[FuncRef, Any, Any]], list[int]]: ...
+    def commit(self, pid: int, defs: Sequence[int]) -> None: ...
+    def revert(
+        self, pid: int, message: Sequence[tuple[FuncRef, Any, Any]]
+    ) -> None: ...
+    def forget(self, pid: int, defs: Sequence[int]) -> None: ...
+    def clear(self) -> dict[int, list[int]]: ...
+
 def comm_split(comm: Intracomm, root: int) -> tuple[Intercomm, Intracomm]: ...
 def barrier(comm: Intercomm) -> None: ...
 def bcast_send(comm: Intercomm, data: Any) -> None: ...
 def bcast_recv(comm: Intercomm) -> Any: ...
+def bcast_send_bytes(comm: Intercomm, data: bytes) -> None: ...
+def bcast_recv_bytes(comm: Intercomm) -> bytearray: ...
 def isendtoall(comm: Intercomm, data: Any, tag: int = 0) -> list[Request]: ...
 def waitall(
     comm: Intercomm, requests: Sequence[Request], poll: bool = False
@@ -5,6 +5,7 @@
 import collections
 import functools
 import itertools
+import operator
 import sys
 import threading
 import time
@@ -13,6 +14,9 @@ import weakref
 from . import _base, _core
 
 
+_NOVALUE = object()
+
+
 class MPIPoolExecutor(_base.Executor):
     """MPI-based asynchronous executor."""
 
@@ -42,6 +46,12 @@ class MPIPoolExecutor(_base.Executor):
             wdir: Path to set current working directory in workers.
             env: Environment variables to update ``os.environ`` in workers.
             use_pkl5: If ``True``, use out-of-band pickle for communication.
+            max_inflight: Maximum number of tasks queued at each worker.
+            func_cache: Maximum number of callables cached by workers.
+            batch_size: Maximum number of tasks sent in a single message.
+            batch_delay: Maximum seconds to wait for a batch to fill up.
+            progress: Either ``"poll"`` or ``"wakeup"``.
+            store_size: Maximum number of objects kept in worker stores.
 
         """
         if max_workers is not None:
@@ -54,6 +64,29 @@ class MPIPoolExecutor(_base.Executor):
                 raise TypeError("initializer must be a callable")
             kwargs["initializer"] = initializer
             kwargs["initargs"] = tuple(initargs)
+        for key in ("max_inflight", "batch_size", "store_size"):
+            value = kwargs.get(key)
+            if value is not None:
+                value = int(value)
+                if value <= 0:
+                    raise ValueError(f"{key} must be greater than 0")
+                kwargs[key] = value
+        func_cache = kwargs.get("func_cache")
+        if func_cache is not None:
+            func_cache = int(func_cache)
+            if func_cache < 0:
+                raise ValueError("func_cache must be non-negative")
+            kwargs["func_cache"] = func_cache
+        batch_delay = kwargs.get("batch_delay")
+        if batch_delay is not None:
+            batch_delay = float(batch_delay)
+            if batch_delay < 0:
+                raise ValueError("batch_delay must be non-negative")
+            kwargs["batch_delay"] = batch_delay
+        progress = kwargs.get("progress")
+        if progress is not None:
+            if progress not in ("poll", "wakeup"):
+                raise ValueError("progress must be 'poll' or 'wakeup'")
 
         self._options = kwargs
         self._shutdown = False
@@ -121,6 +154,43 @@ class MPIPoolExecutor(_base.Executor):
             pool.push((future, task))
             return future
 
+    def put(self, obj):
+        """Store an object in the memory of worker processes.
+
+        The object is serialized once and broadcast to all workers,
+        which keep it in a bounded store until evicted by newer
+        objects. The returned handle can be passed as argument to
+        `submit()` and `map()`, and it is transparently replaced by
+        the stored object when the task is deserialized in a worker.
+
+        Args:
+            obj: Object to store in worker processes.
+
+        Returns:
+            A handle referring to the stored object, with a ``future``
+            attribute completed once the object is stored in workers.
+
+        Raises:
+            LookupError: When resolved in a worker, if the object
+                was evicted from the store.
+            RuntimeError: When serialized as a task argument, if
+                storing the object in worker processes failed.
+
+        """
+        with self._lock:
+            if self._broken:
+                raise _base.BrokenExecutor(self._broken)
+            if self._shutdown:
+                raise RuntimeError("cannot put after shutdown")
+            pool = self._bootstrap()
+            pool.wait()
+            if pool.local:
+                return obj
+            future = self.Future()
+            task, handle = _core.store_task(obj, self._options, future)
+            pool.push((future, task))
+            return handle
+
     def map(
         self,
         fn,
@@ -140,7 +210,8 @@ class MPIPoolExecutor(_base.Executor):
             timeout: The maximum number of seconds to wait. If ``None``, then
                 there is no limit on the wait time.
             chunksize: The size of the chunks the iterable will be broken into
-                before being passed to a worker process.
+                before being passed to a worker process. If ``"auto"``, adapt
+                the size of chunks to measured task durations.
             buffersize: If not ``None``, limit the number of submitted
                 tasks whose results have not yet been yielded.
             unordered: If ``True``, yield results out-of-order, as completed.
@@ -155,8 +226,12 @@ class MPIPoolExecutor(_base.Executor):
             Exception: If ``fn(*args)`` raises for any values.
 
         """
+        if chunksize == "auto":
+            iterable = _ZipHint(*iterables)
+        else:
+            iterable = zip(*iterables)
         return self.starmap(
-            fn, zip(*iterables), timeout, chunksize, buffersize, unordered
+            fn, iterable, timeout, chunksize, buffersize, unordered
         )
 
     def starmap(
@@ -177,7 +252,8 @@ class MPIPoolExecutor(_base.Executor):
             timeout: The maximum number of seconds to wait. If ``None``, then
                 there is no limit on the wait time.
             chunksize: The size of the chunks the iterable will be broken into
-                before being passed to a worker process.
+                before being passed to a worker process. If ``"auto"``, adapt
+                the size of chunks to measured task durations.
             buffersize: If not ``None``, limit the number of submitted
                 tasks whose results have not yet been yielded.
             unordered: If ``True``, yield results out-of-order, as completed.
@@ -193,15 +269,24 @@ class MPIPoolExecutor(_base.Executor):
 
         """
         # pylint: disable=too-many-arguments,too-many-positional-arguments
-        if chunksize < 1:
+        if chunksize == "auto":
+            pass
+        elif chunksize < 1:
             raise ValueError("chunksize must be >= 1.")
         if buffersize is not None:
             if not isinstance(buffersize, int):
                 raise TypeError("buffersize must be an integer or None")
             if buffersize < 1:
                 raise ValueError("buffersize must be None or > 0")
-            if unordered:
-                raise ValueError("buffersize must be None if unordered")
+        if chunksize == "auto":
+            return _starmap_auto(
+                self,
+                fn,
+                iterable,
+                timeout,
+                buffersize,
+                unordered,
+            )
         if chunksize == 1:
             return _starmap_helper(
                 self,
@@ -222,6 +307,61 @@ class MPIPoolExecutor(_base.Executor):
                 unordered,
             )
 
+    def map_reduce(
+        self,
+        fn,
+        reducer,
+        iterable,
+        *,
+        initial=_NOVALUE,
+        chunksize=1,
+    ):
+        """Return a future for ``functools.reduce(reducer, map(fn, ...))``.
+
+        Args:
+            fn: A callable that will take single items from iterable.
+            reducer: An associative and commutative callable that will
+                take two values and combine them into a single value.
+            iterable: An iterable yielding arguments to call ``fn(item)``.
+            initial: If given, combined with the reduced value.
+            chunksize: The size of the chunks the iterable will be broken into
+                before being passed to a worker process.
+
+        Returns:
+            A `Future` representing the reduced value.
+
+        """
+        # pylint: disable=too-many-arguments
+        if chunksize < 1:
+            raise ValueError("chunksize must be >= 1.")
+        with self._lock:
+            if self._broken:
+                raise _base.BrokenExecutor(self._broken)
+            if self._shutdown:
+                raise RuntimeError("cannot submit after shutdown")
+            pool = self._bootstrap()
+            pool.wait()
+            local = pool.local
+            task = None if local else _core.reduce_task(reducer)
+        reduction = _Reduction(self.Future(), reducer, initial)
+        iterable = iter(iterable)
+        while chunk := tuple(itertools.islice(iterable, chunksize)):
+            if local:
+                args = (_core._reduce_local, fn, reducer, chunk)
+            else:
+                args = (_core._reduce_chunk, task.key, fn, reducer, chunk)
+            reduction.add(self.submit(*args))
+            del args, chunk
+        if not local and reduction.count:
+            with self._lock:
+                if self._shutdown:
+                    raise RuntimeError("cannot submit after shutdown")
+                future = self.Future()
+                pool.push((future, task))
+            reduction.add(future)
+        reduction.close()
+        return reduction.future
+
     def shutdown(self, wait=True, *, cancel_futures=False):
         """Clean-up the resources associated with the executor.
 
@@ -254,7 +394,13 @@ class MPIPoolExecutor(_base.Executor):
 
 
 def _starmap_helper(
-    executor, function, iterable, timeout, buffersize, unordered
+    executor,
+    function,
+    iterable,
+    timeout,
+    buffersize,
+    unordered,
+    callback=None,
 ):
     # pylint: disable=too-many-arguments,too-many-positional-arguments
     timer = time.monotonic
@@ -262,22 +408,35 @@ def _starmap_helper(
     if timeout is not None:
         end_time = timeout + timer()
 
+    def submit(executor, args):
+        future = executor.submit(function, *args)
+        if callback is not None:
+            callback(future, args)
+        return future
+
     if buffersize is not None:
+        iterable = iter(iterable)
         fs = collections.deque(
-            executor.submit(function, *args)
+            submit(executor, args)
             for args in itertools.islice(iterable, buffersize)
         )
-        unordered = False
     else:
-        fs = collections.deque(
-            executor.submit(function, *args) for args in iterable
-        )
-        if unordered:
-            fs = set(fs)
+        fs = collections.deque(submit(executor, args) for args in iterable)
+    if unordered:
+        fs = set(fs)
 
     executor_weakref = weakref.ref(executor)
     del executor
 
+    def refill(push):
+        if buffersize is None:
+            return
+        executor = executor_weakref()
+        if executor is None:
+            return
+        for args in itertools.islice(iterable, 1):
+            push(submit(executor, args))
+
     def resolve(future, timeout=None):
         try:
             try:
@@ -292,7 +451,25 @@ def _starmap_helper(
         future = collections.deque()
         result = collections.deque()
         try:
-            if unordered:
+            if unordered and buffersize is not None:
+                assert type(fs) is set  # noqa: S101
+                while fs:
+                    if timeout is None:
+                        done = _base.wait(fs, None, _base.FIRST_COMPLETED)[0]
+                    else:
+                        done = _base.wait(
+                            fs, end_time - timer(), _base.FIRST_COMPLETED
+                        )[0]
+                    if not done:
+                        message = f"{len(fs)} futures unfinished"
+                        raise _base.TimeoutError(message)
+                    fs.difference_update(done)
+                    future.extend(done)
+                    del done
+                    while future:
+                        refill(fs.add)
+                        yield resolve(future.popleft())
+            elif unordered:
                 assert type(fs) is set  # noqa: S101
                 if timeout is None:
                     iterator = _base.as_completed(fs)
@@ -309,12 +486,7 @@ def _starmap_helper(
                         result.append(resolve(fs.pop()))
                     else:
                         result.append(resolve(fs.pop(), end_time - timer()))
-                    if (
-                        buffersize is not None
-                        and (executor := executor_weakref())
-                        and (args := next(iterable, None))
-                    ):
-                        fs.appendleft(executor.submit(function, *args))
+                    refill(fs.appendleft)
                     yield result.pop()
         finally:
             del future
@@ -357,6 +529,165 @@ def _starmap_chunks(
     return _chain_from_iterable_of_lists(result)
 
 
+class _Reduction:
+    def __init__(self, future, reducer, initial):
+        self.lock = threading.Lock()
+        self.future = future
+        self.reducer = reducer
+        self.value = () if initial is _NOVALUE else (initial,)
+        self.error = None
+        self.count = 0
+        self.pending = 1
+
+    def add(self, future):
+        with self.lock:
+            self.count += 1
+            self.pending += 1
+        future.add_done_callback(self.done)
+
+    def combine(self, future):
+        if future.cancelled():
+            raise _base.CancelledError
+        partial = future.result()
+        if not partial:
+            return
+        if self.value:
+            value = self.reducer(self.value[0], partial[0])
+            self.value = (value,)
+        else:
+            self.value = partial
+
+    def done(self, future):
+        with self.lock:
+            if future is not None and self.error is None:
+                try:
+                    self.combine(future)
+                except BaseException as exc:
+                    self.error = exc
+            self.pending -= 1
+            if self.pending:
+                return
+        if self.error is not None:
+            self.future.set_exception(self.error)
+        elif self.value:
+            self.future.set_result(self.value[0])
+        else:
+            message = "map_reduce() of empty iterable with no initial value"
+            self.future.set_exception(TypeError(message))
+        self.error = None
+
+    def close(self):
+        self.done(None)
+
+
+class _ZipHint:
+    def __init__(self, *iterables):
+        hints = map(operator.length_hint, iterables)
+        self.hint = min(hints, default=0)
+        self.iterator = zip(*iterables)
+
+    def __iter__(self):
+        return self.iterator
+
+    def __length_hint__(self):
+        return self.hint
+
+
+def _apply_chunks_timed(function, chunk):
+    start = time.perf_counter()
+    result = list(itertools.starmap(function, chunk))
+    return result, time.perf_counter() - start
+
+
+class _ChunkSizer:
+    # Chunks are sized to run for a target time, a multiple of the
+    # smallest overhead (round-trip minus service time) observed.
+    # Chunks shrink as the iterable is exhausted, following guided
+    # self-scheduling, to reduce the load imbalance at the tail.
+
+    target_ratio = 25
+    target_min = 0.001
+    size_max = 1 << 16
+
+    def __init__(self, num_workers, remaining=0):
+        self.lock = threading.Lock()
+        self.num_workers = max(num_workers, 1)
+        self.remaining = remaining if remaining > 0 else None
+        self.task_time = None
+        self.overhead = None
+
+    def size(self):
+        with self.lock:
+            size = 1
+            if self.task_time is not None:
+                target = self.overhead * self.target_ratio
+                target = max(target, self.target_min)
+                size = target / max(self.task_time, 1e-9)
+            if self.remaining is not None:
+                tail = self.remaining / (2 * self.num_workers)
+                size = min(size, tail)
+            size = min(size, self.size_max)
+            return max(int(size), 1)
+
+    def consume(self, count):
+        with self.lock:
+            if self.remaining is not None:
+                self.remaining = max(self.remaining - count, 0)
+
+    def submit(self, future, args):
+        count = len(args[0])
+        start = time.monotonic()
+
+        def update(future):
+            if future.cancelled() or future.exception() is not None:
+                return
+            roundtrip = time.monotonic() - start
+            _, service = future.result()
+            overhead = max(roundtrip - service, 0.0)
+            task_time = service / count
+            with self.lock:
+                if self.task_time is None:
+                    self.task_time = task_time
+                    self.overhead = overhead
+                else:
+                    self.task_time = (self.task_time + task_time) / 2
+                    self.overhead = min(self.overhead, overhead)
+
+        future.add_done_callback(update)
+
+    def chunks(self, iterable):
+        iterable = iter(iterable)
+        while True:
+            chunk = tuple(itertools.islice(iterable, self.size()))
+            if not chunk:
+                return
+            self.consume(len(chunk))
+            yield (chunk,)
+
+
+def _starmap_auto(
+    executor, function, iterable, timeout, buffersize, unordered
+):
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    num_workers = executor.num_workers
+    if buffersize is None:
+        buffersize = 2 * max(num_workers, 1)
+    sizer = _ChunkSizer(num_workers, operator.length_hint(iterable))
+    function = functools.partial(_apply_chunks_timed, function)
+    iterable = sizer.chunks(iterable)
+    result = _starmap_helper(
+        executor,
+        function,
+        iterable,
+        timeout,
+        buffersize,
+        unordered,
+        sizer.submit,
+    )
+    result = map(operator.itemgetter(0), result)
+    return _chain_from_iterable_of_lists(result)
+
+
 class MPICommExecutor:
     """Context manager for `MPIPoolExecutor`.
 
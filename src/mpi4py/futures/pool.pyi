@@ -10,6 +10,7 @@ from os import PathLike
 from typing import (
     Any,
     AnyStr,
+    Literal,
     ParamSpec,
     TypeAlias,
 )
@@ -62,12 +63,13 @@ class MPIPoolExecutor(Executor):
         *args: _P.args,
         **kwargs: _P.kwargs,
     ) -> Future[T]: ...
+    def put(self, obj: T) -> T: ...
     def map(
         self,
         fn: Callable[..., T],
         *iterables: Iterable[Any],
         timeout: float | None = None,
-        chunksize: int = 1,
+        chunksize: int | Literal["auto"] = 1,
         buffersize: int | None = None,
         unordered: bool = False,
     ) -> Iterator[T]: ...
@@ -76,10 +78,19 @@ class MPIPoolExecutor(Executor):
         fn: Callable[..., T],
         iterable: Iterable[Any],
         timeout: float | None = None,
-        chunksize: int = 1,
+        chunksize: int | Literal["auto"] = 1,
         buffersize: int | None = None,
         unordered: bool = False,
     ) -> Iterator[T]: ...
+    def map_reduce(
+        self,
+        fn: Callable[[Any], T],
+        reducer: Callable[[T, T], T],
+        iterable: Iterable[Any],
+        *,
+        initial: T = ...,
+        chunksize: int = 1,
+    ) -> Future[T]: ...
     def shutdown(
         self,
         wait: bool = True,
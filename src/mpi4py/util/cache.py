@@ -0,0 +1,97 @@
+# Author:  Lisandro Dalcin
+# Contact: dalcinl@gmail.com
+"""Caching utilities."""
+
+import collections as _collections
+import hashlib as _hashlib
+import struct as _struct
+
+from .. import MPI
+
+__all__ = [
+    "BcastCache",
+]
+
+
+_digest = _hashlib.sha256
+_header = _struct.Struct(f"q{_digest().digest_size}s")
+
+
+class BcastCache:
+    """Content-addressed broadcast cache."""
+
+    def __init__(self, comm, maxsize=16):
+        """Initialize broadcast cache.
+
+        Args:
+            comm: Intracommunicator context.
+            maxsize: Maximum number of cached objects.
+
+        """
+        if maxsize < 1:
+            raise ValueError(f"expecting positive maxsize, got {maxsize}")
+        self.comm = comm
+        self.maxsize = int(maxsize)
+        self._cache = _collections.OrderedDict()
+
+    def __len__(self):
+        """Return number of cached objects."""
+        return len(self._cache)
+
+    def bcast(self, obj, root=0):
+        """Broadcast an object, skipping transfer of cached objects.
+
+        The root process serializes the object and computes its
+        digest. If an object with the same digest is already in the
+        cache, only the digest is broadcast and every process returns
+        its cached object. Otherwise, the serialized object is
+        broadcast, deserialized, and inserted in the cache, evicting
+        the least recently used entry if the cache is full.
+
+        All processes in the group must call this method in the same
+        order with the same root, so the cache contents are kept
+        identical across processes.
+
+        Args:
+            obj: Object to broadcast (significant only at root).
+            root: Rank of the broadcast root process.
+
+        Returns:
+            The broadcast object, shared with the cache.
+
+        """
+        comm = self.comm
+        cache = self._cache
+        header = bytearray(_header.size)
+        if comm.Get_rank() == root:
+            data = MPI.pickle.dumps(obj)
+            digest = _digest(data).digest()
+            size = -1 if digest in cache else len(data)
+            _header.pack_into(header, 0, size, digest)
+            comm.Bcast(header, root)
+            if size >= 0:
+                comm.Bcast(data, root)
+        else:
+            comm.Bcast(header, root)
+            size, digest = _header.unpack(header)
+            if size >= 0:
+                data = MPI.buffer.allocate(size)
+                comm.Bcast(data, root)
+        if size < 0:
+            cache.move_to_end(digest)
+            return cache[digest]
+        obj = MPI.pickle.loads(data)
+        cache[digest] = obj
+        while len(cache) > self.maxsize:
+            cache.popitem(last=False)
+        return obj
+
+    def clear(self):
+        """Clear the cache.
+
+        This method must be called collectively by all processes in
+        the group to keep the cache contents identical across
+        processes.
+
+        """
+        self._cache.clear()
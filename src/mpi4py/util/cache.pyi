@@ -0,0 +1,19 @@
+from typing import Any
+
+from ..MPI import Intracomm
+
+__all__: list[str] = [
+    "BcastCache",
+]
+
+class BcastCache:
+    comm: Intracomm
+    maxsize: int
+    def __init__(
+        self,
+        comm: Intracomm,
+        maxsize: int = 16,
+    ) -> None: ...
+    def __len__(self) -> int: ...
+    def bcast(self, obj: Any, root: int = 0) -> Any: ...
+    def clear(self) -> None: ...
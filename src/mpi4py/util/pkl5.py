@@ -2,7 +2,11 @@
 # Contact: dalcinl@gmail.com
 """Pickle-based communication using protocol 5."""
 
+import collections as _collections
+import ctypes as _ctypes
 import struct as _struct
+import threading as _threading
+import weakref as _weakref
 
 from .. import MPI
 from ..MPI import (
@@ -20,7 +24,9 @@ from ..MPI import (
 pickle = Pickle()
 
 
-def _pickle_dumps(obj):
+def _pickle_dumps(obj, buffer_callback=None):
+    if buffer_callback is not None:
+        return pickle.dumps_oob(obj, buffer_callback)
     return pickle.dumps_oob(obj)
 
 
@@ -95,17 +101,243 @@ def _new_buffer(size):
     return MPI.buffer.allocate(size)
 
 
+class _SharedMemory:
+    """Shared-memory transport for out-of-band buffers."""
+
+    alignment = 64
+
+    def __init__(self, comm, size):
+        nodecomm = comm.Split_type(MPI.COMM_TYPE_SHARED)
+        try:
+            group = comm.Get_group()
+            nodegroup = nodecomm.Get_group()
+            noderanks = range(nodegroup.Get_size())
+            ranks = nodegroup.Translate_ranks(noderanks, group)
+            group.Free()
+            nodegroup.Free()
+            self.win = MPI.Win.Allocate_shared(size, 1, comm=nodecomm)
+        finally:
+            nodecomm.Free()
+        self.rank = comm.Get_rank()
+        self.bases = {
+            rank: self.win.Shared_query(noderank)[0].address
+            for noderank, rank in zip(noderanks, ranks)
+        }
+        self.memory = self.win.tomemory()
+        self.ackcomm = comm.Dup()
+        self.lock = _threading.Lock()
+        self.blocks = [(0, len(self.memory))]
+        self.views = 0
+        self.released = _collections.deque()
+        self.sreqs = []
+        self.nsent = [0] * comm.Get_size()
+        self.nrecv = [0] * comm.Get_size()
+
+    def free(self):
+        """Collectively release the segments."""
+        with self.lock:
+            self.bases = {}
+            while self.released:
+                self.released.popleft()
+                self.views -= 1
+            # drain acks in flight, counts exchanged with alltoall
+            infotype = _info_datatype()
+            nsent = _info_pack(self.nsent)
+            nrecv = _info_alloc(len(self.nsent))
+            self.ackcomm.Alltoall((nsent, infotype), (nrecv, infotype))
+            for source, count in enumerate(_info_unpack(nrecv)):
+                for _ in range(count - self.nrecv[source]):
+                    ack = _info_alloc(2)
+                    self.ackcomm.Recv((ack, infotype), source, 0)
+            MPI.Request.Waitall([sreq for sreq, _ in self.sreqs])
+            self.sreqs.clear()
+            # views into peer segments may still be alive
+            views = _info_pack([self.views])
+            total = _info_alloc(1)
+            self.ackcomm.Allreduce((views, infotype), (total, infotype))
+            self.ackcomm.Free()
+            if _info_unpack(total)[0] == 0:
+                self.win.Free()
+            else:
+                _shm_retired.append(self.win)
+
+    def _alloc(self, size):
+        size = -(-size // self.alignment) * self.alignment
+        for i, (offset, length) in enumerate(self.blocks):
+            if length >= size:
+                if length > size:
+                    self.blocks[i] = (offset + size, length - size)
+                else:
+                    del self.blocks[i]
+                return offset, size
+        return None, size
+
+    def _dealloc(self, offset, size):
+        blocks = self.blocks
+        i = 0
+        while i < len(blocks) and blocks[i][0] < offset:
+            i += 1
+        blocks.insert(i, (offset, size))
+        if i + 1 < len(blocks) and offset + size == blocks[i + 1][0]:
+            blocks[i] = (offset, size + blocks.pop(i + 1)[1])
+        if i > 0 and sum(blocks[i - 1]) == offset:
+            blocks[i - 1] = (blocks[i - 1][0], blocks[i - 1][1] + blocks[i][1])
+            del blocks[i]
+
+    def _flush(self):
+        # called with the lock held by the owning thread
+        infotype = _info_datatype()
+        while self.released:
+            source, offset, size = self.released.popleft()
+            self.views -= 1
+            size = -(-size // self.alignment) * self.alignment
+            if source == self.rank:
+                self._dealloc(offset, size)
+                continue
+            ack = _info_pack([offset, size])
+            sreq = self.ackcomm.Isend((ack, infotype), source, 0)
+            self.sreqs.append((sreq, ack))
+            self.nsent[source] += 1
+        self.sreqs = [item for item in self.sreqs if not item[0].Test()]
+
+    def _progress(self):
+        # called with the lock held by the owning thread
+        self._flush()
+        infotype = _info_datatype()
+        status = Status()
+        while self.ackcomm.Iprobe(ANY_SOURCE, 0, status):
+            source = status.Get_source()
+            ack = _info_alloc(2)
+            self.ackcomm.Recv((ack, infotype), source, 0)
+            self.nrecv[source] += 1
+            self._dealloc(*_info_unpack(ack))
+
+    def put(self, buf):
+        """Copy buffer to the local segment, return its offset."""
+        buf = memoryview(buf).cast("B")
+        if not buf:
+            return None
+        with self.lock:
+            self._flush()
+            offset, size = self._alloc(len(buf))
+            if offset is None:
+                self._progress()
+                offset, size = self._alloc(len(buf))
+                if offset is None:
+                    return None
+        self.memory[offset : offset + len(buf)] = buf
+        return offset
+
+    def get(self, source, offset, size):
+        """Return a read-only view of a buffer in a peer segment."""
+        with self.lock:
+            self._flush()
+            self.views += 1
+        address = self.bases[source] + offset
+        cbuf = (_ctypes.c_char * size).from_address(address)
+        # the finalizer may run at any time in any thread,
+        # releases are queued and processed by the owning thread
+        _weakref.finalize(cbuf, self.released.append, (source, offset, size))
+        return memoryview(cbuf).cast("B").toreadonly()
+
+
+_shm_keyval = MPI.KEYVAL_INVALID
+_shm_retired = []
+
+
+def _shm_delete(comm, keyval, shm):  # noqa: ARG001
+    if not MPI.Is_finalized():
+        shm.free()
+
+
+def _shm_attach(comm, size):
+    global _shm_keyval  # noqa: PLW0603
+    # pylint: disable=global-statement
+    if _shm_keyval == MPI.KEYVAL_INVALID:
+        _shm_keyval = MPI.Comm.Create_keyval(delete_fn=_shm_delete)
+    _shm_detach(comm)
+    shm = _SharedMemory(comm, size)
+    comm.Set_attr(_shm_keyval, shm)
+
+
+def _shm_detach(comm):
+    if _shm_keyval == MPI.KEYVAL_INVALID:
+        return
+    if comm.Get_attr(_shm_keyval) is not None:
+        comm.Delete_attr(_shm_keyval)
+
+
+def _shm_lookup(comm, peer):
+    if _shm_keyval == MPI.KEYVAL_INVALID:
+        return None
+    shm = comm.Get_attr(_shm_keyval)
+    if shm is None or peer not in shm.bases:
+        return None
+    return shm
+
+
+_buf_keyval = MPI.KEYVAL_INVALID
+
+
+def _buf_provider(comm, provider):
+    global _buf_keyval  # noqa: PLW0603
+    # pylint: disable=global-statement
+    if provider is None:
+        if _buf_keyval == MPI.KEYVAL_INVALID:
+            return
+        if comm.Get_attr(_buf_keyval) is not None:
+            comm.Delete_attr(_buf_keyval)
+        return
+    if not callable(provider):
+        raise TypeError("buffer provider must be callable")
+    if _buf_keyval == MPI.KEYVAL_INVALID:
+        _buf_keyval = MPI.Comm.Create_keyval()
+    comm.Set_attr(_buf_keyval, provider)
+
+
+def _buf_lookup(comm):
+    if _buf_keyval == MPI.KEYVAL_INVALID:
+        return None
+    return comm.Get_attr(_buf_keyval)
+
+
+def _oob_buffer(provider, size):
+    if size < 0:
+        # shared-memory buffer, obtained from the segment
+        return None
+    buf = provider(size) if provider is not None else None
+    if buf is not None:
+        buf = memoryview(buf).cast("B")
+        if len(buf) > size:
+            buf = buf[:size]
+        if len(buf) < size or buf.readonly:
+            buf = None
+    return _new_buffer(size) if buf is None else buf
+
+
 def _send_raw(comm, send, data, bufs, dest, tag):
     # pylint: disable=too-many-arguments,too-many-positional-arguments
     info = [len(data)]
     info.extend(len(sbuf) for sbuf in bufs)
     infotype = _info_datatype()
+    shm = _shm_lookup(comm, dest) if bufs else None
+    if shm is not None:
+        # shared-memory buffers: negative size, offset in the message
+        bufs = list(bufs)
+        for i, sbuf in enumerate(bufs, 1):
+            offset = shm.put(sbuf)
+            if offset is not None:
+                info[i] = -info[i]
+                bufs[i - 1] = (_info_pack([offset]), infotype)
     info = _info_pack(info)
     send(comm, (info, infotype), dest, tag)
     with _bigmpi as bigmpi:
         send(comm, bigmpi(data), dest, tag)
         for sbuf in bufs:
-            send(comm, bigmpi(sbuf), dest, tag)
+            if isinstance(sbuf, tuple):
+                send(comm, sbuf, dest, tag)
+            else:
+                send(comm, bigmpi(sbuf), dest, tag)
 
 
 def _send(comm, send, obj, dest, tag):
@@ -146,12 +378,20 @@ def _recv_raw(comm, recv, buf, source, tag, status=None):
         if len(buf) < info[0]:
             buf = None
     data = _new_buffer(info[0]) if buf is None else buf
-    bufs = list(map(_new_buffer, info[1:]))
+    provider = _buf_lookup(comm) if len(info) > 1 else None
+    bufs = [_oob_buffer(provider, size) for size in info[1:]]
     with _bigmpi as bigmpi:
         recv(comm, bigmpi(data), source, tag)
-        for rbuf in bufs:
-            recv(comm, bigmpi(rbuf), source, tag)
-    status.Set_elements(MPI.BYTE, sum(info))
+        for i, rbuf in enumerate(bufs, 1):
+            if info[i] < 0:
+                offset = _info_alloc(1)
+                MPI.Comm.Recv(comm, (offset, infotype), source, tag)
+                shm = _shm_lookup(comm, source)
+                offset = _info_unpack(offset)[0]
+                bufs[i - 1] = shm.get(source, offset, -info[i])
+            else:
+                recv(comm, bigmpi(rbuf), source, tag)
+    status.Set_elements(MPI.BYTE, sum(map(abs, info)))
     return data, bufs
 
 
@@ -187,7 +427,14 @@ def _mprobe(comm, mprobe, source, tag, status):
             message.append(rmsg)
             numbytes += status.Get_elements(MPI.BYTE)
         status.Set_elements(MPI.BYTE, numbytes)
-        return Message(message)
+        message = Message(message)
+        shm = _shm_lookup(comm, source)
+        if shm is not None:
+            setattr(message, "_shm", (shm, source))  # noqa: B010
+        provider = _buf_lookup(comm) if len(message) > 1 else None
+        if provider is not None:
+            setattr(message, "_provider", provider)  # noqa: B010
+        return message
 
 
 def _mrecv_info(rmsg, size, status=None):
@@ -214,14 +461,23 @@ def _mrecv_data(message, mrecv, status=None):
     rmsg = iter(message)
     icnt = len(message) - 1
     info = _mrecv_info(next(rmsg), icnt, status)
+    shm, source = getattr(message, "_shm", (None, None))
+    provider = getattr(message, "_provider", None)
     data = _new_buffer(info[0])
-    bufs = list(map(_new_buffer, info[1:]))
+    bufs = [_oob_buffer(provider, size) for size in info[1:]]
     with _bigmpi as bigmpi:
         mrecv(next(rmsg), bigmpi(data))
-        for rbuf in bufs:
-            mrecv(next(rmsg), bigmpi(rbuf))
+        for i, rbuf in enumerate(bufs, 1):
+            if info[i] < 0:
+                offset = _info_alloc(1)
+                infotype = _info_datatype()
+                MPI.Message.Recv(next(rmsg), (offset, infotype))
+                offset = _info_unpack(offset)[0]
+                bufs[i - 1] = shm.get(source, offset, -info[i])
+            else:
+                mrecv(next(rmsg), bigmpi(rbuf))
     if status is not None:
-        status.Set_elements(MPI.BYTE, sum(info))
+        status.Set_elements(MPI.BYTE, sum(map(abs, info)))
     return (data, bufs)
 
 
@@ -245,17 +501,34 @@ def _imrecv(message):
 
 
 def _req_load(request):
+    nbc = getattr(request, "_nbc_recv", None)
+    if nbc is not None:
+        if request == MPI.REQUEST_NULL:  # pragma: no branch
+            del request._nbc_recv
+        return nbc.load()
     data_bufs = getattr(request, "_data_bufs", None)
     if data_bufs is None:
         return None
     if request == MPI.REQUEST_NULL:  # pragma: no branch
         del request._data_bufs
+    if isinstance(data_bufs, list):
+        return [_pickle_loads(data, bufs) for data, bufs in data_bufs]
     data, bufs = data_bufs
     obj = _pickle_loads(data, bufs)
     return obj
 
 
-def _test(request, test, status):
+def _progress(requests, block=False):
+    pending = False
+    for request in requests:
+        nbc = getattr(request, "_nbc_recv", None)
+        if nbc is not None and nbc.progress(block):
+            pending = True
+    return pending
+
+
+def _test(request, test, status, wait=False):
+    _progress([request], wait)
     statuses = None if status is None else [status]
     flag = test(request, statuses)
     if flag:
@@ -264,7 +537,8 @@ def _test(request, test, status):
     return (flag, None)
 
 
-def _testall(requests, testall, statuses):
+def _testall(requests, testall, statuses, wait=False):
+    _progress(requests, wait)
     if isinstance(statuses, list):
         for _ in range(len(requests) - len(statuses)):
             statuses.append(Status())
@@ -283,26 +557,89 @@ def _testall(requests, testall, statuses):
     return (flag, None)
 
 
-def _bcast_intra_raw(comm, bcast, data, bufs, root):
+def _flatten(requests):
+    reqarray = []
+    owners = []
+    pending = {}
+    for index, request in enumerate(requests):
+        for req in request:
+            if req:
+                reqarray.append(req)
+                owners.append(index)
+                pending[index] = pending.get(index, 0) + 1
+    return reqarray, owners, pending
+
+
+def _testany(requests, testany, status, wait=False):
+    reqarray, owners, pending = _flatten(requests)
+    if not reqarray:
+        return (MPI.UNDEFINED, True, None)
+    while True:
+        if _progress(requests):
+            index, flag = MPI.Request.Testany(reqarray, status)
+            if not flag and wait:
+                continue
+        else:
+            index, flag = testany(reqarray, status)
+        if not flag:
+            return (MPI.UNDEFINED, False, None)
+        owner = owners[index]
+        pending[owner] -= 1
+        if not pending[owner]:
+            obj = _req_load(requests[owner])
+            return (owner, True, obj)
+
+
+def _testsome(requests, testsome, statuses, wait=False):
+    reqarray, owners, pending = _flatten(requests)
+    if not reqarray:
+        return (None, None)
+    indices = []
+    stsarray = None
+    while not indices:
+        if statuses is not None:
+            stsarray = [Status() for _ in reqarray]
+        if _progress(requests):
+            completed = MPI.Request.Testsome(reqarray, stsarray) or []
+        else:
+            completed = testsome(reqarray, stsarray) or []
+        for k, i in enumerate(completed):
+            owner = owners[i]
+            pending[owner] -= 1
+            if not pending[owner]:
+                indices.append(owner)
+                if stsarray is not None:
+                    if len(statuses) < len(indices):
+                        statuses.append(Status())
+                    sts = statuses[len(indices) - 1].tomemory()
+                    sts[:] = stsarray[k].tomemory()
+        if not wait:
+            break
+    objs = [_req_load(requests[index]) for index in indices]
+    return (indices, objs)
+
+
+def _bcast_intra_raw(comm, bcast, data, bufs, root, provider=None):
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
     rank = comm.Get_rank()
     if rank == root:
         info = [len(data)]
         info.extend(len(sbuf) for sbuf in bufs)
         infotype = _info_datatype()
         infosize = _info_pack([len(info)])
-        bcast(comm, (infosize, infotype), root)
+        MPI.Comm.Bcast(comm, (infosize, infotype), root)
         info = _info_pack(info)
-        bcast(comm, (info, infotype), root)
+        MPI.Comm.Bcast(comm, (info, infotype), root)
     else:
         infotype = _info_datatype()
         infosize = _info_alloc(1)
-        bcast(comm, (infosize, infotype), root)
+        MPI.Comm.Bcast(comm, (infosize, infotype), root)
         infosize = _info_unpack(infosize)[0]
         info = _info_alloc(infosize)
-        bcast(comm, (info, infotype), root)
+        MPI.Comm.Bcast(comm, (info, infotype), root)
         info = _info_unpack(info)
         data = _new_buffer(info[0])
-        bufs = list(map(_new_buffer, info[1:]))
+        bufs = [_oob_buffer(provider, size) for size in info[1:]]
     with _bigmpi as bigmpi:
         bcast(comm, bigmpi(data), root)
         for rbuf in bufs:
@@ -310,20 +647,87 @@ def _bcast_intra_raw(comm, bcast, data, bufs, root):
     return data, bufs
 
 
-def _bcast_intra(comm, bcast, obj, root):
+_bcast_chunksize = 1 << 16
+
+
+def _bcast_scatter(comm, buf, root, keep):
+    size = comm.Get_size()
     rank = comm.Get_rank()
+    buf = memoryview(buf).cast("B")
+    count = len(buf)
+    chunk = -(-count // size)
+    displs = [min(i * chunk, count) for i in range(size)]
+    counts = [min(d + chunk, count) - d for d in displs]
     if rank == root:
-        data, bufs = _pickle_dumps(obj)
+        sendbuf = (buf, counts, displs, MPI.BYTE)
+        MPI.Comm.Scatterv(comm, sendbuf, MPI.IN_PLACE, root)
+        if buf.readonly:
+            buf = bytearray(buf)
+            keep.append(buf)
     else:
-        data, bufs = _pickle_dumps(None)
+        offset, length = displs[rank], counts[rank]
+        recvbuf = (buf[offset : offset + length], length, MPI.BYTE)
+        MPI.Comm.Scatterv(comm, None, recvbuf, root)
+    recvbuf = (buf, counts, displs, MPI.BYTE)
+    return MPI.Comm.Iallgatherv(comm, MPI.IN_PLACE, recvbuf)
+
+
+def _bcast_intra_stream(comm, bcast, obj, root):
+    # pylint: disable=too-many-locals
+    size = comm.Get_size()
+    rank = comm.Get_rank()
+    infotype = _info_datatype()
+    reqs, keep = [], []
+
+    def header(count):
+        info = bytearray(_info_pack([count]))
+        bcast(comm, (info, infotype), root)
+        return _info_unpack(info)[0]
+
+    def start(buf, count):
+        chunksize = _bcast_chunksize
+        if size > 2 and chunksize * size <= count <= bigmpi.blocksize:
+            reqs.append(_bcast_scatter(comm, buf, root, keep))
+        else:
+            reqs.append(MPI.Comm.Ibcast(comm, bigmpi(buf), root))
+
+    def buffer_callback(buf):
+        count = len(buf)
+        header(-count - 1)
+        start(buf, count)
+
+    with _bigmpi as bigmpi:
+        try:
+            if rank == root:
+                data, bufs = _pickle_dumps(obj, buffer_callback)
+                header(len(data))
+                start(data, len(data))
+            else:
+                bufs = []
+                provider = _buf_lookup(comm)
+                while True:
+                    count = header(0)
+                    if count >= 0:
+                        break
+                    bufs.append(_oob_buffer(provider, -count - 1))
+                    start(bufs[-1], -count - 1)
+                data = _new_buffer(count)
+                start(data, count)
+        finally:
+            MPI.Request.Waitall(reqs)
+    return data, bufs
+
+
+def _bcast_intra(comm, bcast, obj, root):
     with _comm_lock(comm, "bcast"):
-        data, bufs = _bcast_intra_raw(comm, bcast, data, bufs, root)
+        data, bufs = _bcast_intra_stream(comm, bcast, obj, root)
     return _pickle_loads(data, bufs)
 
 
 def _bcast_inter(comm, bcast, obj, root):
     rank = comm.Get_rank()
     size = comm.Get_remote_size()
+    provider = _buf_lookup(comm)
     comm, tag, localcomm, _ = _commctx_inter(comm)
     if root == PROC_NULL:
         return None
@@ -339,7 +743,9 @@ def _bcast_inter(comm, bcast, obj, root):
         else:
             data, bufs = _pickle_dumps(None)
         with _comm_lock(localcomm, "bcast"):
-            data, bufs = _bcast_intra_raw(localcomm, bcast, data, bufs, 0)
+            data, bufs = _bcast_intra_raw(
+                localcomm, bcast, data, bufs, 0, provider
+            )
         return _pickle_loads(data, bufs)
     comm.Call_errhandler(MPI.ERR_ROOT)
     raise MPI.Exception(MPI.ERR_ROOT)
@@ -364,133 +770,470 @@ def _get_p2p_backend():
     return reqs, send, recv
 
 
-def _gather(comm, obj, root):
-    reqs, send, recv = _get_p2p_backend()
+def _get_nbc_backend():
+    reqs = []
+
+    def send(comm, buf, dest, tag):
+        reqs.append(MPI.Comm.Isend(comm, buf, dest, tag))
+
+    return reqs, send
+
+
+def _commctx_rooted(comm, root):
     if comm.Is_inter():
         comm, tag, *_ = _commctx_inter(comm)
         size = comm.Get_remote_size()
         if root == PROC_NULL:
-            send = recv = None
-        elif root == MPI.ROOT:
-            send = None
+            isroot, isleaf = False, False
+        elif root == ROOT:
+            isroot, isleaf = True, False
         elif 0 <= root < size:
-            recv = None
+            isroot, isleaf = False, True
         else:
             comm.Call_errhandler(MPI.ERR_ROOT)
             raise MPI.Exception(MPI.ERR_ROOT)
     else:
         comm, tag = _commctx_intra(comm)
         size = comm.Get_size()
-        if root != comm.Get_rank():
-            recv = None
         if root < 0 or root >= size:
             comm.Call_errhandler(MPI.ERR_ROOT)
             raise MPI.Exception(MPI.ERR_ROOT)
-
-    if send:
-        data, bufs = _pickle_dumps(obj)
-        _send_raw(comm, send, data, bufs, root, tag)
-    objs = None
-    if recv:
-        objs = []
-        for source in range(size):
-            data, bufs = _recv_raw(comm, recv, None, source, tag)
-            obj = _pickle_loads(data, bufs)
-            objs.append(obj)
-    if send:
-        MPI.Request.Waitall(reqs)
-    return objs
+        isroot, isleaf = root == comm.Get_rank(), True
+    return comm, tag, size, isroot, isleaf
 
 
-def _scatter(comm, objs, root):
-    # pylint: disable=too-many-branches
-    reqs, send, recv = _get_p2p_backend()
+def _commctx_all(comm):
     if comm.Is_inter():
         comm, tag, *_ = _commctx_inter(comm)
         size = comm.Get_remote_size()
-        if root == PROC_NULL:
-            send = recv = None
-        elif root == ROOT:
-            recv = None
-        elif 0 <= root < size:
-            send = None
-        else:
-            comm.Call_errhandler(MPI.ERR_ROOT)
-            raise MPI.Exception(MPI.ERR_ROOT)
     else:
         comm, tag = _commctx_intra(comm)
         size = comm.Get_size()
-        if root != comm.Get_rank():
-            send = None
-        if root < 0 or root >= size:
-            comm.Call_errhandler(MPI.ERR_ROOT)
-            raise MPI.Exception(MPI.ERR_ROOT)
+    return comm, tag, size
+
+
+def _scatter_objs(objs, size):
+    if objs is None:
+        objs = [None] * size
+    elif not isinstance(objs, list):
+        objs = list(objs)
+    if len(objs) != size:
+        raise ValueError(f"expecting {size} items, got {len(objs)}")
+    return objs
+
 
+def _gather_raw(comm, send, recv, obj, root, size, tag):
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
     if send:
-        if objs is None:
-            objs = [None] * size
-        elif not isinstance(objs, list):
-            objs = list(objs)
-        if len(objs) != size:
-            raise ValueError(f"expecting {size} items, got {len(objs)}")
-        for dest, obj in enumerate(objs):
+        data, bufs = _pickle_dumps(obj)
+        _send_raw(comm, send, data, bufs, root, tag)
+    if recv:
+        return [
+            _recv_raw(comm, recv, None, source, tag) for source in range(size)
+        ]
+    return None
+
+
+def _scatter_raw(comm, send, recv, objs, root, size, tag):
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    if send:
+        for dest, obj in enumerate(_scatter_objs(objs, size)):
             data, bufs = _pickle_dumps(obj)
             _send_raw(comm, send, data, bufs, dest, tag)
-    obj = None
     if recv:
-        data, bufs = _recv_raw(comm, recv, None, root, tag)
-        obj = _pickle_loads(data, bufs)
-    if send:
-        MPI.Request.Waitall(reqs)
+        return _recv_raw(comm, recv, None, root, tag)
+    return None
+
+
+def _alltoall_p2p(comm, send, items, tag):
+    for dest, (data, bufs) in enumerate(items):
+        _send_raw(comm, send, data, bufs, dest, tag)
+
+
+class _NBCRecv:
+    """Receives of nonblocking collectives, posted once matched."""
+
+    def __init__(self, comm, tag, sources, single=False, provider=None):
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self.comm = comm
+        self.tag = tag
+        self.sources = list(sources)
+        self.rreqs = [None] * len(self.sources)
+        self.single = single
+        self.provider = provider
+        self.greq = MPI.Grequest.Start()
+        self.done = False
+
+    def progress(self, block=False):
+        """Post receives of matched messages, return whether pending."""
+        if self.done:
+            return False
+        mprobe = MPI.Comm.Mprobe if block else MPI.Comm.Improbe
+        for i, source in enumerate(self.sources):
+            if self.rreqs[i] is None:
+                message = _mprobe(self.comm, mprobe, source, self.tag, None)
+                if message is None:
+                    continue
+                if self.provider is not None:
+                    setattr(message, "_provider", self.provider)  # noqa: B010
+                self.rreqs[i] = _imrecv(message)
+        if any(rreq is None for rreq in self.rreqs):
+            return True
+        reqs = [req for rreq in self.rreqs for req in rreq]
+        testall = MPI.Request.Waitall if block else MPI.Request.Testall
+        if not testall(reqs):
+            return True
+        self.done = True
+        self.greq.Complete()
+        return False
+
+    def load(self):
+        """Return the received objects."""
+        objs = [_req_load(rreq) for rreq in self.rreqs]
+        return objs[0] if self.single else objs
+
+
+def _nbc_request(reqs, data_bufs=None, nbc=None):
+    if nbc is not None:
+        reqs.append(nbc.greq)
+    request = Request(reqs or None)
+    if data_bufs is not None:
+        setattr(request, "_data_bufs", data_bufs)  # noqa: B010
+    if nbc is not None:
+        setattr(request, "_nbc_recv", nbc)  # noqa: B010
+    return request
+
+
+def _ibcast(comm, obj, root):
+    reqs, send = _get_nbc_backend()
+    inter = comm.Is_inter()
+    provider = _buf_lookup(comm)
+    comm, tag, size, isroot, isleaf = _commctx_rooted(comm, root)
+    data_bufs, nbc = None, None
+    if isroot:
+        data, bufs = _pickle_dumps(obj)
+        for dest in range(size):
+            if inter or dest != root:
+                _send_raw(comm, send, data, bufs, dest, tag)
+        if isleaf:
+            data_bufs = (data, bufs)
+    elif isleaf:
+        nbc = _NBCRecv(comm, tag, [root], True, provider)
+    return _nbc_request(reqs, data_bufs, nbc)
+
+
+def _igather(comm, obj, root):
+    reqs, send = _get_nbc_backend()
+    comm, tag, size, isroot, isleaf = _commctx_rooted(comm, root)
+    _gather_raw(comm, isleaf and send, None, obj, root, size, tag)
+    nbc = _NBCRecv(comm, tag, range(size)) if isroot else None
+    return _nbc_request(reqs, None, nbc)
+
+
+def _iscatter(comm, objs, root):
+    reqs, send = _get_nbc_backend()
+    comm, tag, size, isroot, isleaf = _commctx_rooted(comm, root)
+    _scatter_raw(comm, isroot and send, None, objs, root, size, tag)
+    nbc = _NBCRecv(comm, tag, [root], True) if isleaf else None
+    return _nbc_request(reqs, None, nbc)
+
+
+def _iallgather(comm, obj):
+    reqs, send = _get_nbc_backend()
+    comm, tag, size = _commctx_all(comm)
+    items = [_pickle_dumps(obj)] * size
+    _alltoall_p2p(comm, send, items, tag)
+    nbc = _NBCRecv(comm, tag, range(size))
+    return _nbc_request(reqs, None, nbc)
+
+
+def _ialltoall(comm, objs):
+    reqs, send = _get_nbc_backend()
+    comm, tag, size = _commctx_all(comm)
+    items = list(map(_pickle_dumps, _scatter_objs(objs, size)))
+    _alltoall_p2p(comm, send, items, tag)
+    nbc = _NBCRecv(comm, tag, range(size))
+    return _nbc_request(reqs, None, nbc)
+
+
+def _tree_send(comm, send, items, dest, tag):
+    for data, bufs in items:
+        _send_raw(comm, send, data, bufs, dest, tag)
+
+
+def _tree_recv(comm, recv, count, source, tag):
+    return [_recv_raw(comm, recv, None, source, tag) for _ in range(count)]
+
+
+def _gather_intra(comm, obj, root):
+    reqs, send, recv = _get_p2p_backend()
+    comm, tag = _commctx_intra(comm)
+    size = comm.Get_size()
+    rank = comm.Get_rank()
+    if root < 0 or root >= size:
+        comm.Call_errhandler(MPI.ERR_ROOT)
+        raise MPI.Exception(MPI.ERR_ROOT)
+
+    # binomial tree, pickled items are forwarded as received
+    vrank = (rank - root) % size
+    items = [_pickle_dumps(obj)]
+    mask = 1
+    while mask < size:
+        if vrank & mask:
+            parent = (vrank - mask + root) % size
+            _tree_send(comm, send, items, parent, tag)
+            break
+        if vrank + mask < size:
+            child = (vrank + mask + root) % size
+            count = min(mask, size - vrank - mask)
+            items.extend(_tree_recv(comm, recv, count, child, tag))
+        mask <<= 1
+    objs = None
+    if vrank == 0:
+        objs = [None] * size
+        for i, (data, bufs) in enumerate(items):
+            objs[(i + root) % size] = _pickle_loads(data, bufs)
+    MPI.Request.Waitall(reqs)
+    return objs
+
+
+def _gather(comm, obj, root):
+    if not comm.Is_inter():
+        return _gather_intra(comm, obj, root)
+    reqs, send, recv = _get_p2p_backend()
+    comm, tag, size, isroot, isleaf = _commctx_rooted(comm, root)
+    data_bufs = _gather_raw(
+        comm, isleaf and send, isroot and recv, obj, root, size, tag
+    )
+    MPI.Request.Waitall(reqs)
+    if data_bufs is None:
+        return None
+    return [_pickle_loads(data, bufs) for data, bufs in data_bufs]
+
+
+def _scatter_intra(comm, objs, root):
+    reqs, send, recv = _get_p2p_backend()
+    comm, tag = _commctx_intra(comm)
+    size = comm.Get_size()
+    rank = comm.Get_rank()
+    if root < 0 or root >= size:
+        comm.Call_errhandler(MPI.ERR_ROOT)
+        raise MPI.Exception(MPI.ERR_ROOT)
+
+    # binomial tree, pickled items are forwarded as received
+    vrank = (rank - root) % size
+    mask = 1
+    if vrank == 0:
+        objs = _scatter_objs(objs, size)
+        items = [_pickle_dumps(objs[(i + root) % size]) for i in range(size)]
+        while mask < size:
+            mask <<= 1
+    else:
+        while not vrank & mask:
+            mask <<= 1
+        parent = (vrank - mask + root) % size
+        count = min(mask, size - vrank)
+        items = _tree_recv(comm, recv, count, parent, tag)
+    mask >>= 1
+    while mask > 0:
+        if vrank + mask < size:
+            child = (vrank + mask + root) % size
+            count = min(mask, size - vrank - mask)
+            _tree_send(comm, send, items[mask : mask + count], child, tag)
+        mask >>= 1
+    data, bufs = items[0]
+    obj = _pickle_loads(data, bufs)
+    MPI.Request.Waitall(reqs)
     return obj
 
 
-def _allgather(comm, obj):
+def _scatter(comm, objs, root):
+    if not comm.Is_inter():
+        return _scatter_intra(comm, objs, root)
     reqs, send, recv = _get_p2p_backend()
+    comm, tag, size, isroot, isleaf = _commctx_rooted(comm, root)
+    data_bufs = _scatter_raw(
+        comm, isroot and send, isleaf and recv, objs, root, size, tag
+    )
+    MPI.Request.Waitall(reqs)
+    if data_bufs is None:
+        return None
+    return _pickle_loads(*data_bufs)
+
+
+def _vcoll_displs(counts):
+    displs, total = [], 0
+    for count in counts:
+        displs.append(total)
+        total += count
+    return displs
+
+
+def _vcoll_chunk(counts, offset, chunk):
+    return [min(max(count - offset, 0), chunk) for count in counts]
+
+
+def _vcoll_bounds(comm, scounts, rcounts, agreed):
+    bounds = [
+        max(sum(scounts), sum(rcounts)),
+        max(*scounts, *rcounts, 0),
+    ]
+    if not agreed:
+        infotype = _info_datatype()
+        # on intercommunicators, the first round yields the remote
+        # group maxima, and the second one the local group maxima
+        rounds = 2 if comm.Is_inter() else 1
+        for _ in range(rounds):
+            sbounds = _info_pack(bounds)
+            rbounds = _info_alloc(len(bounds))
+            MPI.Comm.Allreduce(
+                comm, (sbounds, infotype), (rbounds, infotype), MPI.MAX
+            )
+            bounds = list(map(max, bounds, _info_unpack(rbounds)))
+    return bounds
+
+
+def _vcoll_raw(comm, vcoll, sbuf, scounts, rcounts, agreed=False):
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    # pylint: disable=too-many-locals
+    sdispls = _vcoll_displs(scounts)
+    rdispls = _vcoll_displs(rcounts)
+    rbuf = _new_buffer(sum(rcounts))
+    total, largest = _vcoll_bounds(comm, scounts, rcounts, agreed)
+    blocksize = _bigmpi.blocksize
+    if total <= blocksize:
+        smsg = (sbuf, scounts, sdispls, MPI.BYTE)
+        rmsg = (rbuf, rcounts, rdispls, MPI.BYTE)
+        vcoll(comm, smsg, rmsg)
+        return rbuf, rdispls
+    # exchange in rounds, with counts and displacements within blocksize
+    size = comm.Get_size()
+    if comm.Is_inter():
+        size = max(size, comm.Get_remote_size())
+    chunk = max(blocksize // size, 1)
+    sview = memoryview(sbuf).cast("B")
+    rview = memoryview(rbuf).cast("B")
+    for offset in range(0, largest, chunk):
+        scnts = _vcoll_chunk(scounts, offset, chunk)
+        rcnts = _vcoll_chunk(rcounts, offset, chunk)
+        sdsps = _vcoll_displs(scnts)
+        rdsps = _vcoll_displs(rcnts)
+        stmp = b"".join(
+            sview[disp + offset : disp + offset + count]
+            for disp, count in zip(sdispls, scnts)
+        )
+        rtmp = _new_buffer(sum(rcnts))
+        smsg = (stmp, scnts, sdsps, MPI.BYTE)
+        rmsg = (rtmp, rcnts, rdsps, MPI.BYTE)
+        vcoll(comm, smsg, rmsg)
+        rtmp = memoryview(rtmp).cast("B")
+        for disp, tdsp, count in zip(rdispls, rdsps, rcnts):
+            start = disp + offset
+            rview[start : start + count] = rtmp[tdsp : tdsp + count]
+    return rbuf, rdispls
+
+
+def _vcoll_pack(items):
+    infos, payload = [], []
+    for data, bufs in items:
+        infos.append([len(data)] + [len(sbuf) for sbuf in bufs])
+        payload.append(data)
+        payload.extend(bufs)
+    if len(payload) == 1:
+        return infos, payload[0]
+    return infos, b"".join(payload)
+
+
+def _vcoll_unpack(rbuf, rdispls, infos):
+    objs = []
+    rview = memoryview(rbuf).cast("B")
+    for disp, info in zip(rdispls, infos):
+        parts = []
+        for count in info:
+            parts.append(rview[disp : disp + count])
+            disp += count
+        objs.append(_pickle_loads(parts[0], parts[1:]))
+    return objs
+
+
+def _allgatherv(comm, smsg, rmsg):
+    sbuf, scounts, _, stype = smsg
+    MPI.Comm.Allgatherv(comm, (sbuf, scounts[0], stype), rmsg)
+
+
+def _alltoallv(comm, smsg, rmsg):
+    MPI.Comm.Alltoallv(comm, smsg, rmsg)
+
+
+def _allgather_raw(comm, obj, size):
+    infos, sbuf = _vcoll_pack([_pickle_dumps(obj)])
+    infotype = _info_datatype()
+    sinfo = infos[0]
+    ninfo = _info_alloc(size)
+    MPI.Comm.Allgather(
+        comm, (_info_pack([len(sinfo)]), infotype), (ninfo, infotype)
+    )
+    ninfo = _info_unpack(ninfo)
+    rinfo = _info_alloc(sum(ninfo))
+    rdsps = _vcoll_displs(ninfo)
+    MPI.Comm.Allgatherv(
+        comm,
+        (_info_pack(sinfo), infotype),
+        (rinfo, ninfo, rdsps, infotype),
+    )
+    rinfo = _info_unpack(rinfo)
+    infos = [rinfo[d : d + n] for d, n in zip(rdsps, ninfo)]
+    scounts = [sum(sinfo)]
+    rcounts = [sum(info) for info in infos]
+    agreed = not comm.Is_inter()
+    rbuf, rdispls = _vcoll_raw(
+        comm, _allgatherv, sbuf, scounts, rcounts, agreed
+    )
+    return _vcoll_unpack(rbuf, rdispls, infos)
+
+
+def _alltoall_raw(comm, objs, size):
+    # pylint: disable=too-many-locals
+    infos, sbuf = _vcoll_pack(map(_pickle_dumps, objs))
+    infotype = _info_datatype()
+    sninfo = [len(info) for info in infos]
+    rninfo = _info_alloc(size)
+    MPI.Comm.Alltoall(comm, (_info_pack(sninfo), infotype), (rninfo, infotype))
+    rninfo = _info_unpack(rninfo)
+    sinfo = _info_pack([n for info in infos for n in info])
+    rinfo = _info_alloc(sum(rninfo))
+    sdsps = _vcoll_displs(sninfo)
+    rdsps = _vcoll_displs(rninfo)
+    MPI.Comm.Alltoallv(
+        comm,
+        (sinfo, sninfo, sdsps, infotype),
+        (rinfo, rninfo, rdsps, infotype),
+    )
+    rinfo = _info_unpack(rinfo)
+    rinfos = [rinfo[d : d + n] for d, n in zip(rdsps, rninfo)]
+    scounts = [sum(info) for info in infos]
+    rcounts = [sum(info) for info in rinfos]
+    rbuf, rdispls = _vcoll_raw(comm, _alltoallv, sbuf, scounts, rcounts)
+    return _vcoll_unpack(rbuf, rdispls, rinfos)
+
+
+def _allgather(comm, obj):
     if comm.Is_inter():
-        comm, tag, *_ = _commctx_inter(comm)
         size = comm.Get_remote_size()
     else:
-        comm, tag = _commctx_intra(comm)
         size = comm.Get_size()
-
-    data, bufs = _pickle_dumps(obj)
-    for dest in range(size):
-        _send_raw(comm, send, data, bufs, dest, tag)
-    objs = []
-    for source in range(size):
-        data, bufs = _recv_raw(comm, recv, None, source, tag)
-        obj = _pickle_loads(data, bufs)
-        objs.append(obj)
-    MPI.Request.Waitall(reqs)
-    return objs
+    with _comm_lock(comm, "allgather"):
+        return _allgather_raw(comm, obj, size)
 
 
 def _alltoall(comm, objs):
-    reqs, send, recv = _get_p2p_backend()
     if comm.Is_inter():
-        comm, tag, *_ = _commctx_inter(comm)
         size = comm.Get_remote_size()
     else:
-        comm, tag = _commctx_intra(comm)
         size = comm.Get_size()
-
-    if objs is None:
-        objs = [None] * size
-    elif not isinstance(objs, list):
-        objs = list(objs)
-    if len(objs) != size:
-        raise ValueError(f"expecting {size} items, got {len(objs)}")
-    for dest, obj in enumerate(objs):
-        data, bufs = _pickle_dumps(obj)
-        _send_raw(comm, send, data, bufs, dest, tag)
-    objs = []
-    for source in range(size):
-        data, bufs = _recv_raw(comm, recv, None, source, tag)
-        obj = _pickle_loads(data, bufs)
-        objs.append(obj)
-    MPI.Request.Waitall(reqs)
-    return objs
+    objs = _scatter_objs(objs, size)
+    with _comm_lock(comm, "alltoall"):
+        return _alltoall_raw(comm, objs, size)
 
 
 class Request(tuple):
@@ -542,6 +1285,7 @@ class Request(tuple):
 
     def get_status(self, status=None):
         """Non-destructive test for the completion of a request."""
+        _progress([self])
         statuses = [status] + [None] * max(len(self) - 1, 0)
         return all(map(MPI.Request.Get_status, self, statuses))
 
@@ -551,7 +1295,7 @@ class Request(tuple):
 
     def wait(self, status=None):
         """Wait for a request to complete."""
-        return _test(self, MPI.Request.Waitall, status)[1]
+        return _test(self, MPI.Request.Waitall, status, True)[1]
 
     @classmethod
     def get_status_all(cls, requests, statuses=None):
@@ -571,7 +1315,32 @@ class Request(tuple):
     @classmethod
     def waitall(cls, requests, statuses=None):
         """Wait for all requests to complete."""
-        return _testall(requests, MPI.Request.Waitall, statuses)[1]
+        return _testall(requests, MPI.Request.Waitall, statuses, True)[1]
+
+    @classmethod
+    def testany(cls, requests, status=None):
+        """Test for completion of any previously initiated request."""
+        return _testany(requests, MPI.Request.Testany, status)
+
+    @classmethod
+    def waitany(cls, requests, status=None):
+        """Wait for any previously initiated request to complete."""
+
+        def waitany(requests, status):
+            return (MPI.Request.Waitany(requests, status), True)
+
+        index, _, obj = _testany(requests, waitany, status, True)
+        return (index, obj)
+
+    @classmethod
+    def testsome(cls, requests, statuses=None):
+        """Test for completion of some previously initiated requests."""
+        return _testsome(requests, MPI.Request.Testsome, statuses)
+
+    @classmethod
+    def waitsome(cls, requests, statuses=None):
+        """Wait for some previously initiated requests to complete."""
+        return _testsome(requests, MPI.Request.Waitsome, statuses, True)
 
 
 class Message(tuple):
@@ -714,10 +1483,42 @@ class Comm(MPI.Comm):
         """All to All Scatter/Gather."""
         return _alltoall(self, sendobj)
 
+    def ibcast(self, obj, root=0):
+        """Nonblocking Broadcast."""
+        return _ibcast(self, obj, root)
+
+    def igather(self, sendobj, root=0):
+        """Nonblocking Gather."""
+        return _igather(self, sendobj, root)
+
+    def iscatter(self, sendobj, root=0):
+        """Nonblocking Scatter."""
+        return _iscatter(self, sendobj, root)
+
+    def iallgather(self, sendobj):
+        """Nonblocking Gather to All."""
+        return _iallgather(self, sendobj)
+
+    def ialltoall(self, sendobj):
+        """Nonblocking All to All Scatter/Gather."""
+        return _ialltoall(self, sendobj)
+
+    def set_buffer_provider(self, provider):
+        """Set the provider of receive buffers for out-of-band data."""
+        _buf_provider(self, provider)
+
 
 class Intracomm(Comm, MPI.Intracomm):
     """Intracommunicator."""
 
+    def attach_shared(self, size):
+        """Attach shared-memory segments for out-of-band buffers."""
+        _shm_attach(self, size)
+
+    def detach_shared(self):
+        """Detach shared-memory segments for out-of-band buffers."""
+        _shm_detach(self)
+
 
 class Intercomm(Comm, MPI.Intercomm):
     """Intercommunicator."""
@@ -1,5 +1,6 @@
 import sys
 from collections.abc import (
+    Callable,
     Iterable,
     Sequence,
 )
@@ -79,6 +80,30 @@ class Request(tuple[MPI.Request, ...]):
         requests: Sequence[Request],
         statuses: list[Status] | None = None,
     ) -> list[Any]: ...
+    @classmethod
+    def testany(
+        cls,
+        requests: Sequence[Request],
+        status: Status | None = None,
+    ) -> tuple[int, bool, Any | None]: ...
+    @classmethod
+    def waitany(
+        cls,
+        requests: Sequence[Request],
+        status: Status | None = None,
+    ) -> tuple[int, Any]: ...
+    @classmethod
+    def testsome(
+        cls,
+        requests: Sequence[Request],
+        statuses: list[Status] | None = None,
+    ) -> tuple[list[int] | None, list[Any] | None]: ...
+    @classmethod
+    def waitsome(
+        cls,
+        requests: Sequence[Request],
+        statuses: list[Status] | None = None,
+    ) -> tuple[list[int] | None, list[Any] | None]: ...
 
 class Message(tuple[MPI.Message, ...]):
     @overload
@@ -174,6 +199,36 @@ class Comm(MPI.Comm):
         self,
         sendobj: Sequence[Any],
     ) -> list[Any]: ...
+    def ibcast(
+        self,
+        obj: Any,
+        root: int = 0,
+    ) -> Request: ...
+    def igather(
+        self,
+        sendobj: Any,
+        root: int = 0,
+    ) -> Request: ...
+    def iscatter(
+        self,
+        sendobj: Sequence[Any] | None,
+        root: int = 0,
+    ) -> Request: ...
+    def iallgather(
+        self,
+        sendobj: Any,
+    ) -> Request: ...
+    def ialltoall(
+        self,
+        sendobj: Sequence[Any],
+    ) -> Request: ...
+    def set_buffer_provider(
+        self,
+        provider: Callable[[int], Buffer | None] | None,
+    ) -> None: ...
+
+class Intracomm(Comm, MPI.Intracomm):
+    def attach_shared(self, size: int) -> None: ...
+    def detach_shared(self) -> None: ...
 
-class Intracomm(Comm, MPI.Intracomm): ...
 class Intercomm(Comm, MPI.Intercomm): ...
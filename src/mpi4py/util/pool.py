@@ -111,7 +111,8 @@ class Pool:
 
         The *iterable* is choped into a number of chunks which are submitted as
         separate tasks. The (approximate) size of these chunks can be specified
-        by setting *chunksize* to a positive integer.
+        by setting *chunksize* to a positive integer, or adapted to measured
+        task durations by setting *chunksize* to ``"auto"``.
 
         Consider using `imap()` or `imap_unordered()` with explicit *chunksize*
         for better efficiency.
@@ -172,7 +173,8 @@ class Pool:
 
         The *iterable* is choped into a number of chunks which are submitted as
         separate tasks. The (approximate) size of these chunks can be specified
-        by setting *chunksize* to a positive integer.
+        by setting *chunksize* to a positive integer, or adapted to measured
+        task durations by setting *chunksize* to ``"auto"``.
 
         Consider using `istarmap()` or `istarmap_unordered()` with explicit
         *chunksize* for better efficiency.
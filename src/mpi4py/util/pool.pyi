@@ -8,6 +8,7 @@ from collections.abc import (
 from typing import (
     Any,
     Generic,
+    Literal,
 )
 
 if sys.version_info >= (3, 11):
@@ -54,13 +55,13 @@ class Pool:
         self,
         func: Callable[[S], T],
         iterable: Iterable[S],
-        chunksize: int | None = None,
+        chunksize: int | Literal["auto"] | None = None,
     ) -> list[T]: ...
     def map_async(
         self,
         func: Callable[[S], T],
         iterable: Iterable[S],
-        chunksize: int | None = None,
+        chunksize: int | Literal["auto"] | None = None,
         callback: Callable[[T], None] | None = None,
         error_callback: Callable[[BaseException], None] | None = None,
     ) -> MapResult[T]: ...
@@ -68,25 +69,25 @@ class Pool:
         self,
         func: Callable[[S], T],
         iterable: Iterable[S],
-        chunksize: int = 1,
+        chunksize: int | Literal["auto"] = 1,
     ) -> Iterator[T]: ...
     def imap_unordered(
         self,
         func: Callable[[S], T],
         iterable: Iterable[S],
-        chunksize: int = 1,
+        chunksize: int | Literal["auto"] = 1,
     ) -> Iterator[T]: ...
     def starmap(
         self,
         func: Callable[..., T],
         iterable: Iterable[Iterable[Any]],
-        chunksize: int | None = None,
+        chunksize: int | Literal["auto"] | None = None,
     ) -> list[T]: ...
     def starmap_async(
         self,
         func: Callable[..., T],
         iterable: Iterable[Iterable[Any]],
-        chunksize: int | None = None,
+        chunksize: int | Literal["auto"] | None = None,
         callback: Callable[[T], None] | None = None,
         error_callback: Callable[[BaseException], None] | None = None,
     ) -> MapResult[T]: ...
@@ -94,13 +95,13 @@ class Pool:
         self,
         func: Callable[..., T],
         iterable: Iterable[Iterable[Any]],
-        chunksize: int = 1,
+        chunksize: int | Literal["auto"] = 1,
     ) -> Iterator[T]: ...
     def istarmap_unordered(
         self,
         func: Callable[..., T],
         iterable: Iterable[Iterable[Any]],
-        chunksize: int = 1,
+        chunksize: int | Literal["auto"] = 1,
     ) -> Iterator[T]: ...
     def close(self) -> None: ...
     def terminate(self) -> None: ...
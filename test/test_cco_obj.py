@@ -1,10 +1,17 @@
 import operator
+import pickle
 from functools import reduce
 
 import mpiunittest as unittest
 
+import mpi4py
 from mpi4py import MPI
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 def cumsum(seq):
     return reduce(operator.add, seq, 0)
@@ -52,6 +59,49 @@ class BaseTestCCOObj(unittest.BaseMixin):
                 rmess = self.COMM.bcast(smess, root=root)
                 self.assertEqual(smess, rmess)
 
+    def testBcastBuffers(self):
+        threshold = MPI.pickle.THRESHOLD
+        for n in (0, 1, threshold - 1, threshold, threshold * 3):
+            smess = [bytearray(n), {"b": bytearray(b"x" * n)}, "mpi4py"]
+            for root in range(self.COMM.Get_size()):
+                rmess = self.COMM.bcast(smess, root=root)
+                self.assertEqual(smess, rmess)
+                self.assertIsNot(smess[0], rmess[0])
+
+    def testBcastPickleBuffer(self):
+        if MPI.pickle.PROTOCOL < 5:
+            self.skipTest("pickle-protocol")
+        threshold = MPI.pickle.THRESHOLD
+        for n in (1, threshold, threshold * 3):
+            data = bytes(range(256)) * (n // 256 + 1)
+            smess = [pickle.PickleBuffer(data), "mpi4py", data]
+            for root in range(self.COMM.Get_size()):
+                rmess = self.COMM.bcast(smess, root=root)
+                self.assertEqual(bytes(rmess[0]), data)
+                self.assertEqual(len(rmess[0]), len(data))
+                self.assertEqual(rmess[1:], smess[1:])
+
+    def testBcastAbort(self):
+        if not (mpi4py.rc.bcast_segsz or mpi4py.rc.pickle_oob):
+            self.skipTest("mpi4py-rc")
+        threshold = MPI.pickle.THRESHOLD
+
+        class Unpicklable:
+            def __reduce__(self):
+                raise ValueError("unpicklable")
+
+        rank = self.COMM.Get_rank()
+        for root in range(self.COMM.Get_size()):
+            smess = None
+            if rank == root:
+                data = bytearray(threshold)
+                smess = [pickle.PickleBuffer(data), Unpicklable()]
+            error = ValueError if rank == root else RuntimeError
+            with self.assertRaises(error):
+                self.COMM.bcast(smess, root=root)
+        rmess = self.COMM.bcast(rank, root=0)
+        self.assertEqual(rmess, 0)
+
     def testGather(self):
         size = self.COMM.Get_size()
         rank = self.COMM.Get_rank()
@@ -63,6 +113,25 @@ class BaseTestCCOObj(unittest.BaseMixin):
                 else:
                     self.assertIsNone(rmess)
 
+    def testGatherIter(self):
+        size = self.COMM.Get_size()
+        rank = self.COMM.Get_rank()
+        for smess in [*messages, messages]:
+            for root in range(size):
+                items = self.COMM.gather_iter([rank, smess], root=root)
+                if rank == root:
+                    rmess = list(items)
+                    self.assertEqual(rmess, [[i, smess] for i in range(size)])
+                    self.assertEqual(list(items), [])
+                else:
+                    self.assertIsNone(items)
+        for root in range(size):
+            items = self.COMM.gather_iter(rank, root=root)
+            if rank == root:
+                self.assertEqual(next(items), 0)
+                del items
+        self.COMM.Barrier()
+
     def testScatter(self):
         size = self.COMM.Get_size()
         rank = self.COMM.Get_rank()
@@ -88,6 +157,133 @@ class BaseTestCCOObj(unittest.BaseMixin):
             rmess = self.COMM.alltoall([smess] * size)
             self.assertEqual(rmess, [smess] * size)
 
+    def testIBcast(self):
+        for smess in messages:
+            for root in range(self.COMM.Get_size()):
+                request = self.COMM.ibcast(smess, root=root)
+                rmess = request.wait()
+                self.assertEqual(smess, rmess)
+                self.assertIsNone(request.wait())
+
+    def testIGather(self):
+        size = self.COMM.Get_size()
+        rank = self.COMM.Get_rank()
+        for smess in [*messages, messages]:
+            for root in range(size):
+                request = self.COMM.igather(smess, root=root)
+                rmess = request.wait()
+                if rank == root:
+                    self.assertEqual(rmess, [smess] * size)
+                else:
+                    self.assertIsNone(rmess)
+
+    def testIScatter(self):
+        size = self.COMM.Get_size()
+        rank = self.COMM.Get_rank()
+        for smess in [*messages, messages]:
+            for root in range(size):
+                if rank == root:
+                    request = self.COMM.iscatter([smess] * size, root=root)
+                else:
+                    request = self.COMM.iscatter(None, root=root)
+                rmess = request.wait()
+                self.assertEqual(rmess, smess)
+
+    def testIAllgather(self):
+        size = self.COMM.Get_size()
+        for smess in [*messages, messages]:
+            request = self.COMM.iallgather(smess)
+            flag, rmess = request.test()
+            if not flag:
+                rmess = request.wait()
+            self.assertEqual(rmess, [smess] * size)
+
+    def testIAlltoall(self):
+        size = self.COMM.Get_size()
+        for smess in [*messages, messages]:
+            request = self.COMM.ialltoall([smess] * size)
+            rmess = request.wait()
+            self.assertEqual(rmess, [smess] * size)
+
+    def testIMany(self):
+        size = self.COMM.Get_size()
+        rank = self.COMM.Get_rank()
+        requests = [
+            self.COMM.ibcast(messages, root=0),
+            self.COMM.igather(rank, root=0),
+            self.COMM.iscatter(list(range(size)), root=0),
+            self.COMM.iallgather(rank),
+            self.COMM.ialltoall([rank] * size),
+        ]
+        results = MPI.Request.waitall(requests)
+        self.assertEqual(results[0], messages)
+        if rank == 0:
+            self.assertEqual(results[1], list(range(size)))
+        else:
+            self.assertIsNone(results[1])
+        self.assertEqual(results[2], rank)
+        self.assertEqual(results[3], list(range(size)))
+        self.assertEqual(results[4], list(range(size)))
+
+    def testIBcastNoBlock(self):
+        size = self.COMM.Get_size()
+        rank = self.COMM.Get_rank()
+        if size < 2:
+            return
+        if rank == 0:
+            request = self.COMM.ibcast(None, root=1)
+            self.COMM.send(rank, dest=1, tag=7)
+            self.assertEqual(request.wait(), messages)
+        else:
+            if rank == 1:
+                self.assertEqual(self.COMM.recv(source=0, tag=7), 0)
+            request = self.COMM.ibcast(messages, root=1)
+            self.assertEqual(request.wait(), messages)
+
+    def testIManyReversed(self):
+        size = self.COMM.Get_size()
+        rank = self.COMM.Get_rank()
+        requests = [
+            self.COMM.ibcast(messages, root=0),
+            self.COMM.iallgather(rank),
+            self.COMM.ialltoall([rank] * size),
+        ]
+        results = [request.wait() for request in reversed(requests)]
+        self.assertEqual(results[0], list(range(size)))
+        self.assertEqual(results[1], list(range(size)))
+        self.assertEqual(results[2], messages)
+        request = self.COMM.iallgather(rank)
+        while not request.test()[0]:
+            pass
+        request = self.COMM.igather(rank, root=0)
+        index, result = MPI.Request.waitany([request])
+        self.assertEqual(index, 0)
+        if rank == 0:
+            self.assertEqual(result, list(range(size)))
+
+    def testGatherOutOfBand(self):
+        size = self.COMM.Get_size()
+        rank = self.COMM.Get_rank()
+        threshold = MPI.pickle.THRESHOLD
+        MPI.pickle.THRESHOLD = 64
+        try:
+            for n in (0, 100, 1 << 16):
+                smess = [bytearray([rank % 256]) * n, bytearray(n // 3)]
+                expected = [
+                    [bytearray([r % 256]) * n, bytearray(n // 3)]
+                    for r in range(size)
+                ]
+                rmess = self.COMM.gather(smess, root=0)
+                self.assertEqual(rmess, expected if rank == 0 else None)
+                rmess = self.COMM.allgather(smess)
+                self.assertEqual(rmess, expected)
+                rmess = self.COMM.igather(smess, root=0).wait()
+                self.assertEqual(rmess, expected if rank == 0 else None)
+                rmess = self.COMM.iallgather(smess).wait()
+                self.assertEqual(rmess, expected)
+        finally:
+            MPI.pickle.THRESHOLD = threshold
+
     def testReduce(self):
         size = self.COMM.Get_size()
         rank = self.COMM.Get_rank()
@@ -239,6 +435,105 @@ class BaseTestCCOObj(unittest.BaseMixin):
             else:
                 self.assertEqual(rscan, 0)
 
+    @unittest.skipIf(numpy is None, "numpy")
+    def testReduceArray(self):
+        size = self.COMM.Get_size()
+        rank = self.COMM.Get_rank()
+        for dtype in ("i", "l", "f", "d", "F", "D"):
+            sendobj = numpy.arange(5, dtype=dtype) + rank
+            expected = [
+                (MPI.SUM, sum(numpy.arange(5) + r for r in range(size))),
+                (MPI.MAX, numpy.arange(5) + size - 1),
+                (MPI.MIN, numpy.arange(5)),
+            ]
+            for op, value in expected:
+                if op != MPI.SUM and dtype in "FD":
+                    continue
+                if op != MPI.SUM and not mpi4py.rc.buffer_reduce:
+                    continue
+                for root in range(size):
+                    result = self.COMM.reduce(sendobj, op=op, root=root)
+                    if rank == root:
+                        self.assertIs(type(result), numpy.ndarray)
+                        self.assertEqual(result.dtype, sendobj.dtype)
+                        self.assertTrue(numpy.all(result == value))
+                    else:
+                        self.assertIsNone(result)
+                result = self.COMM.allreduce(sendobj, op=op)
+                self.assertIs(type(result), numpy.ndarray)
+                self.assertIsNot(result, sendobj)
+                self.assertEqual(result.dtype, sendobj.dtype)
+                self.assertTrue(numpy.all(result == value))
+            self.assertTrue(numpy.all(sendobj == numpy.arange(5) + rank))
+
+    @unittest.skipIf(numpy is None, "numpy")
+    def testScanArray(self):
+        rank = self.COMM.Get_rank()
+        for dtype in ("i", "d"):
+            sendobj = numpy.full((2, 3), rank + 1, dtype=dtype)[:, ::2]
+            result = self.COMM.scan(sendobj, op=MPI.SUM)
+            self.assertEqual(result.shape, sendobj.shape)
+            self.assertEqual(result.dtype, sendobj.dtype)
+            self.assertTrue(numpy.all(result == cumsum(range(1, rank + 2))))
+            result = self.COMM.exscan(sendobj, op=MPI.PROD)
+            if rank == 0:
+                self.assertIsNone(result)
+            else:
+                self.assertEqual(result.shape, sendobj.shape)
+                expected = cumprod(range(1, rank + 1))
+                self.assertTrue(numpy.all(result == expected))
+
+    @unittest.skipIf(numpy is None, "numpy")
+    def testReduceArrayReadonly(self):
+        size = self.COMM.Get_size()
+        rank = self.COMM.Get_rank()
+        sendobj = numpy.arange(5, dtype="d") + rank
+        sendobj.flags.writeable = False
+        expected = sum(numpy.arange(5) + r for r in range(size))
+        for root in range(size):
+            result = self.COMM.reduce(sendobj, op=MPI.SUM, root=root)
+            if rank == root:
+                self.assertIsNot(result, sendobj)
+                self.assertTrue(numpy.all(result == expected))
+            else:
+                self.assertIsNone(result)
+        result = self.COMM.allreduce(sendobj, op=MPI.SUM)
+        self.assertIsNot(result, sendobj)
+        self.assertTrue(numpy.all(result == expected))
+        self.assertTrue(numpy.all(sendobj == numpy.arange(5) + rank))
+
+    @unittest.skipIf(numpy is None, "numpy")
+    def testReduceArrayMixed(self):
+        size = self.COMM.Get_size()
+        rank = self.COMM.Get_rank()
+        dtype = "d" if rank == 0 else "i"
+        sendobj = numpy.arange(5, dtype=dtype) + rank
+        result = self.COMM.allreduce(sendobj, op=MPI.SUM)
+        expected = sum(numpy.arange(5) + r for r in range(size))
+        self.assertTrue(numpy.all(result == expected))
+        if rank == 0:
+            sendobj = numpy.float64(0)
+        else:
+            sendobj = numpy.full(5, rank, dtype="d")
+        result = self.COMM.allreduce(sendobj, op=MPI.SUM)
+        self.assertTrue(numpy.all(result == cumsum(range(size))))
+
+    @unittest.skipIf(numpy is None, "numpy")
+    def testReduceArrayObject(self):
+        size = self.COMM.Get_size()
+        rank = self.COMM.Get_rank()
+        sendobj = numpy.array([rank, str(rank)], dtype=object)
+        result = self.COMM.allreduce(sendobj, op=MPI.SUM)
+        self.assertEqual(result[0], cumsum(range(size)))
+        self.assertEqual(result[1], "".join(map(str, range(size))))
+        sendobj = numpy.float64(rank)
+        result = self.COMM.allreduce(sendobj, op=MPI.SUM)
+        self.assertEqual(result, cumsum(range(size)))
+        sendobj = numpy.arange(3) + rank
+        result = self.COMM.allreduce(sendobj, op=lambda x, y: x + y)
+        expected = sum(numpy.arange(3) + r for r in range(size))
+        self.assertTrue(numpy.all(result == expected))
+
 
 class TestCCOObjSelf(BaseTestCCOObj, unittest.TestCase):
     #
@@ -119,6 +119,34 @@ class BaseTestCCOObjInter(unittest.BaseMixin):
                         rmess = self.INTERCOMM.gather(smess, root=root)
                         self.assertIsNone(rmess)
 
+    def testGatherIter(self):
+        rank = self.INTERCOMM.Get_rank()
+        size = self.INTERCOMM.Get_size()
+        rsize = self.INTERCOMM.Get_remote_size()
+        for smess in [*messages, messages]:
+            for color in [0, 1]:
+                if self.COLOR == color:
+                    for root in range(size):
+                        if root == rank:
+                            items = self.INTERCOMM.gather_iter(
+                                None, root=MPI.ROOT
+                            )
+                            rmess = list(items)
+                            self.assertEqual(
+                                rmess, [[i, smess] for i in range(rsize)]
+                            )
+                        else:
+                            items = self.INTERCOMM.gather_iter(
+                                None, root=MPI.PROC_NULL
+                            )
+                            self.assertIsNone(items)
+                else:
+                    for root in range(rsize):
+                        items = self.INTERCOMM.gather_iter(
+                            [rank, smess], root=root
+                        )
+                        self.assertIsNone(items)
+
     @unittest.skipMPI("msmpi(<8.0.0)")
     def testScatter(self):
         rank = self.INTERCOMM.Get_rank()
@@ -159,6 +187,95 @@ class BaseTestCCOObjInter(unittest.BaseMixin):
             rmess = self.INTERCOMM.alltoall([smess] * rsize)
             self.assertEqual(rmess, [smess] * rsize)
 
+    @unittest.skipMPI("openmpi", MPI.COMM_WORLD.Get_size() >= 3)
+    def testIBcast(self):
+        rank = self.INTERCOMM.Get_rank()
+        size = self.INTERCOMM.Get_size()
+        rsize = self.INTERCOMM.Get_remote_size()
+        for smess in [*messages, messages]:
+            for color in [0, 1]:
+                if self.COLOR == color:
+                    for root in range(size):
+                        if root == rank:
+                            request = self.INTERCOMM.ibcast(
+                                smess, root=MPI.ROOT
+                            )
+                        else:
+                            request = self.INTERCOMM.ibcast(
+                                None, root=MPI.PROC_NULL
+                            )
+                        rmess = request.wait()
+                        self.assertIsNone(rmess)
+                else:
+                    for root in range(rsize):
+                        request = self.INTERCOMM.ibcast(None, root=root)
+                        rmess = request.wait()
+                        self.assertEqual(rmess, smess)
+
+    def testIGather(self):
+        rank = self.INTERCOMM.Get_rank()
+        size = self.INTERCOMM.Get_size()
+        rsize = self.INTERCOMM.Get_remote_size()
+        for smess in [*messages, messages]:
+            for color in [0, 1]:
+                if self.COLOR == color:
+                    for root in range(size):
+                        if root == rank:
+                            request = self.INTERCOMM.igather(
+                                smess, root=MPI.ROOT
+                            )
+                            rmess = request.wait()
+                            self.assertEqual(rmess, [smess] * rsize)
+                        else:
+                            request = self.INTERCOMM.igather(
+                                None, root=MPI.PROC_NULL
+                            )
+                            rmess = request.wait()
+                            self.assertIsNone(rmess)
+                else:
+                    for root in range(rsize):
+                        request = self.INTERCOMM.igather(smess, root=root)
+                        rmess = request.wait()
+                        self.assertIsNone(rmess)
+
+    def testIScatter(self):
+        rank = self.INTERCOMM.Get_rank()
+        size = self.INTERCOMM.Get_size()
+        rsize = self.INTERCOMM.Get_remote_size()
+        for smess in [*messages, messages]:
+            for color in [0, 1]:
+                if self.COLOR == color:
+                    for root in range(size):
+                        if root == rank:
+                            request = self.INTERCOMM.iscatter(
+                                [smess] * rsize, root=MPI.ROOT
+                            )
+                        else:
+                            request = self.INTERCOMM.iscatter(
+                                None, root=MPI.PROC_NULL
+                            )
+                        rmess = request.wait()
+                        self.assertIsNone(rmess)
+                else:
+                    for root in range(rsize):
+                        request = self.INTERCOMM.iscatter(None, root=root)
+                        rmess = request.wait()
+                        self.assertEqual(rmess, smess)
+
+    def testIAllgather(self):
+        rsize = self.INTERCOMM.Get_remote_size()
+        for smess in [*messages, messages]:
+            request = self.INTERCOMM.iallgather(smess)
+            rmess = request.wait()
+            self.assertEqual(rmess, [smess] * rsize)
+
+    def testIAlltoall(self):
+        rsize = self.INTERCOMM.Get_remote_size()
+        for smess in [*messages, messages]:
+            request = self.INTERCOMM.ialltoall([smess] * rsize)
+            rmess = request.wait()
+            self.assertEqual(rmess, [smess] * rsize)
+
     def testReduce(self):
         rank = self.INTERCOMM.Get_rank()
         size = self.INTERCOMM.Get_size()
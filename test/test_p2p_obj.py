@@ -1,9 +1,11 @@
 import os
+import pickle
 import threading
 import warnings
 
 import mpiunittest as unittest
 
+import mpi4py
 from mpi4py import MPI
 
 
@@ -172,6 +174,35 @@ class BaseTestP2PObj(unittest.BaseMixin):
             self.assertTrue(flag)
             self.assertIsNone(obj)
 
+    def testIRecvAdapt(self):
+        comm = self.COMM
+        rank = comm.Get_rank()
+        sizes = [1, 100, 1000, 10000, 10, 1000, 1]
+        for n in sizes * 5:
+            smess = b"x" * n
+            rreq = comm.irecv(None, rank, 1)
+            comm.send(smess, rank, 1)
+            rmess = rreq.wait()
+            self.assertEqual(rmess, smess)
+            sreq = comm.isend(smess, rank, 2)
+            rreq = comm.irecv(None, rank, 2)
+            rmess = rreq.wait()
+            sreq.wait()
+            self.assertEqual(rmess, smess)
+        if not (mpi4py.rc.irecv_adapt and mpi4py.rc.recv_mprobe):
+            return
+        smess = b"x" * mpi4py.rc.irecv_bufsz * 4
+        sreq = comm.isend(smess, rank, 3)
+        comm.probe(rank, 3)
+        rreq = comm.irecv(None, rank, 3)
+        rmess = rreq.wait()
+        sreq.wait()
+        self.assertEqual(rmess, smess)
+        rreq = comm.irecv(None, rank, 3)
+        comm.send(smess, rank, 3)
+        rmess = rreq.wait()
+        self.assertEqual(rmess, smess)
+
     def testIRecvAndISend(self):
         comm = self.COMM
         size = comm.Get_size()
@@ -548,6 +579,135 @@ class BaseTestP2PObj(unittest.BaseMixin):
             )
             self.assertIsNone(rmess)
 
+    def testOutOfBand(self):
+        comm = self.COMM
+        size = comm.Get_size()
+        rank = comm.Get_rank()
+        dest = (rank + 1) % size
+        source = (rank - 1) % size
+        threshold = MPI.pickle.THRESHOLD
+        MPI.pickle.THRESHOLD = 64
+        try:
+            for n in (0, 1, 64, 1024, 1 << 20):
+                smess = [bytearray(b"a") * n, b"b" * n, bytearray(n // 2)]
+                rmess = comm.sendrecv(smess, dest, 0, None, source, 0)
+                self.assertEqual(rmess, smess)
+                if size == 1 or rank > 1:
+                    continue
+                peer = 1 - rank
+                if rank == 0:
+                    comm.send(smess, peer, 1)
+                    comm.ssend(smess, peer, 2)
+                    comm.send(smess, peer, 3)
+                    comm.send(smess, peer, 4)
+                else:
+                    rmess = comm.recv(None, peer, 1)
+                    self.assertEqual(rmess, smess)
+                    rmess = comm.irecv(3 * n + 1024, peer, 2).wait()
+                    self.assertEqual(rmess, smess)
+                    rmess = comm.mprobe(peer, 3).recv()
+                    self.assertEqual(rmess, smess)
+                    rmess = comm.mprobe(peer, 4).irecv().wait()
+                    self.assertEqual(rmess, smess)
+        finally:
+            MPI.pickle.THRESHOLD = threshold
+
+    def testOutOfBandViews(self):
+        comm = self.COMM
+        size = comm.Get_size()
+        rank = comm.Get_rank()
+        dest = (rank + 1) % size
+        source = (rank - 1) % size
+        threshold = MPI.pickle.THRESHOLD
+        MPI.pickle.THRESHOLD = 64
+        try:
+            n = 1 << 12
+            results = []
+            for c in b"abc":
+                smess = [
+                    pickle.PickleBuffer(bytearray([c]) * n),
+                    pickle.PickleBuffer(bytearray([c + 1]) * n),
+                ]
+                rmess = comm.sendrecv(smess, dest, 0, None, source, 0)
+                results.append((c, rmess))
+                if mpi4py.rc.pickle_oob:
+                    rbuf1, rbuf2 = map(MPI.buffer, rmess)
+                    self.assertFalse(rbuf1.readonly)
+                    self.assertFalse(rbuf2.readonly)
+                    self.assertLess(rbuf1.address, rbuf2.address)
+                    self.assertLess(rbuf2.address - rbuf1.address, 2 * n)
+            for c, rmess in results:
+                self.assertEqual(bytes(rmess[0]), bytes([c]) * n)
+                self.assertEqual(bytes(rmess[1]), bytes([c + 1]) * n)
+        finally:
+            MPI.pickle.THRESHOLD = threshold
+
+    def testPersistent(self):
+        comm = self.COMM
+        size = comm.Get_size()
+        rank = comm.Get_rank()
+        dest = (rank + 1) % size
+        source = (rank - 1) % size
+        sreq = comm.send_init(dest, 7)
+        rreq = comm.recv_init(source, 7)
+        self.assertIsInstance(sreq, MPI.Prequest)
+        self.assertIsInstance(rreq, MPI.Prequest)
+        sizes = [0, 1, 10, 10, 1 << 12, 1 << 12, 1 << 16, 10, 1 << 20, 1]
+        for smess in [*messages, *[b"x" * n for n in sizes]]:
+            rreq.start()
+            sreq.start(smess)
+            rmess = rreq.wait()
+            self.assertIsNone(sreq.wait())
+            self.assertEqual(rmess, smess)
+            self.assertTrue(sreq)
+            self.assertTrue(rreq)
+        sreq.Free()
+        rreq.Free()
+        sreq = comm.send_init(MPI.PROC_NULL)
+        rreq = comm.recv_init(MPI.PROC_NULL)
+        for smess in messages:
+            rreq.start()
+            sreq.start(smess)
+            self.assertIsNone(rreq.wait())
+            self.assertIsNone(sreq.wait())
+        sreq.Free()
+        rreq.Free()
+
+    def testOutOfBandPrepost(self):
+        comm = self.COMM
+        size = comm.Get_size()
+        rank = comm.Get_rank()
+        if size == 1 or rank > 1:
+            return
+        if MPI.pickle.PROTOCOL < 5:
+            self.skipTest("pickle-protocol")
+        peer = 1 - rank
+        threshold = MPI.pickle.THRESHOLD
+        MPI.pickle.THRESHOLD = 64
+        try:
+            n = 1 << 16
+            smess = [
+                pickle.PickleBuffer(bytearray(b"a") * n),
+                pickle.PickleBuffer(bytearray(b"b") * n),
+            ]
+            if rank == 0:
+                requests = [
+                    comm.isend(smess[0], peer, 0),
+                    comm.issend(smess[1], peer, 0),
+                ]
+                MPI.Request.waitall(requests)
+                comm.send(smess[0], peer, 0)
+                comm.ssend(smess[1], peer, 0)
+            else:
+                for _ in range(2):
+                    requests = [comm.irecv(2 * n, peer, 0) for _ in range(2)]
+                    rmess = MPI.Request.waitall(requests)
+                    for rbuf, sbuf in zip(rmess, smess):
+                        self.assertEqual(len(rbuf), n)
+                        self.assertEqual(bytes(rbuf), bytes(sbuf.raw()))
+        finally:
+            MPI.pickle.THRESHOLD = threshold
+
     def testMixed(self):
         comm = self.COMM
         rank = comm.Get_rank()
@@ -35,6 +35,7 @@ class TestImport(unittest.TestCase):
 
     def testImportUtil(self):
         importlib.import_module("mpi4py.util")
+        importlib.import_module("mpi4py.util.cache")
         importlib.import_module("mpi4py.util.dtlib")
         importlib.import_module("mpi4py.util.pkl5")
         importlib.import_module("mpi4py.util.pool")
@@ -91,6 +91,32 @@ class TestPickle(unittest.TestCase):
                 self.do_pickle(obj, pickle)
             self.do_pickle(OBJS, pickle)
 
+    def testCompress(self):
+        pickle = self.pickle
+        self.assertIsNone(pickle.COMPRESS)
+        data = [b"0" * 1024 * 64, list(range(1024))]
+        for codec in ("zlib", "bz2", "lzma"):
+            for threshold in (0, 1024, None):
+                pickle.__init__(compress=codec, compress_threshold=threshold)
+                self.assertEqual(pickle.COMPRESS, codec)
+                for obj in OBJS:
+                    self.do_pickle(obj, pickle)
+                self.do_pickle(OBJS, pickle)
+                self.do_pickle(data, pickle)
+            pickle.COMPRESS_THRESHOLD = 0
+            s = pickle.dumps(data)
+            self.assertLess(len(s), len(data[0]))
+            pickle.COMPRESS = None
+            self.assertEqual(pickle.loads(s), data)
+            pickle.COMPRESS = codec
+            pickle.COMPRESS_THRESHOLD = None
+            s = pickle.dumps(None)
+            self.assertEqual(pickle.loads(s), None)
+        with self.assertRaises(ValueError):
+            pickle.__init__(compress="foobar")
+        with self.assertRaises(ValueError):
+            pickle.COMPRESS = "foobar"
+
     @unittest.skipIf(dill is None, "dill")
     def testDill(self):
         pickle = self.pickle
@@ -17,8 +17,13 @@ class TestRC(unittest.TestCase):
         rc(thread_level=rc.thread_level)
         rc(finalize=rc.finalize)
         rc(fast_reduce=rc.fast_reduce)
+        rc(buffer_reduce=rc.buffer_reduce)
         rc(recv_mprobe=rc.recv_mprobe)
         rc(irecv_bufsz=rc.irecv_bufsz)
+        rc(irecv_adapt=rc.irecv_adapt)
+        rc(recv_arena=rc.recv_arena)
+        rc(bcast_segsz=rc.bcast_segsz)
+        rc(pickle_oob=rc.pickle_oob)
         rc(errors=rc.errors)
         return rc
 
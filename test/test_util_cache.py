@@ -0,0 +1,77 @@
+import os
+import pathlib
+import sys
+
+import mpi4py.util.cache as cache
+from mpi4py import MPI
+
+try:
+    import mpiunittest as unittest
+except ImportError:
+    sys.path.append(os.fspath(pathlib.Path(__file__).resolve().parent))
+    import mpiunittest as unittest
+
+
+class BaseTestBcastCache(unittest.BaseMixin):
+    #
+    COMM = MPI.Intracomm(MPI.COMM_NULL)
+
+    def testBcast(self):
+        comm = self.COMM
+        bcache = cache.BcastCache(comm)
+        self.assertIs(bcache.comm, comm)
+        self.assertEqual(bcache.maxsize, 16)
+        self.assertEqual(len(bcache), 0)
+        for root in range(comm.size):
+            for value in (None, 42, "abc", [1, 2, 3], {"a": root}):
+                obj = value if comm.rank == root else None
+                rval1 = bcache.bcast(obj, root)
+                self.assertEqual(rval1, value)
+                rval2 = bcache.bcast(obj, root)
+                self.assertEqual(rval2, value)
+                self.assertIs(rval2, rval1)
+
+    def testEviction(self):
+        comm = self.COMM
+        bcache = cache.BcastCache(comm, maxsize=2)
+        self.assertEqual(bcache.maxsize, 2)
+        obj1 = bcache.bcast([1])
+        obj2 = bcache.bcast([2])
+        self.assertEqual(len(bcache), 2)
+        self.assertIs(bcache.bcast([1]), obj1)
+        obj3 = bcache.bcast([3])
+        self.assertEqual(len(bcache), 2)
+        self.assertIs(bcache.bcast([1]), obj1)
+        self.assertIs(bcache.bcast([3]), obj3)
+        self.assertIsNot(bcache.bcast([2]), obj2)
+        self.assertEqual(len(bcache), 2)
+
+    def testClear(self):
+        comm = self.COMM
+        bcache = cache.BcastCache(comm)
+        obj = bcache.bcast(list(range(10)))
+        self.assertEqual(len(bcache), 1)
+        bcache.clear()
+        self.assertEqual(len(bcache), 0)
+        self.assertIsNot(bcache.bcast(list(range(10))), obj)
+        self.assertEqual(len(bcache), 1)
+
+    def testArgs(self):
+        comm = self.COMM
+        for maxsize in (0, -1):
+            with self.assertRaises(ValueError):
+                cache.BcastCache(comm, maxsize)
+
+
+class TestBcastCacheSelf(BaseTestBcastCache, unittest.TestCase):
+    #
+    COMM = MPI.COMM_SELF
+
+
+class TestBcastCacheWorld(BaseTestBcastCache, unittest.TestCase):
+    #
+    COMM = MPI.COMM_WORLD
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -348,6 +348,73 @@ class BaseTest(unittest.BaseMixin):
         self.RequestType.waitall(requests1, statuses)
         self.assertEqual(statuses[0].error, 0)
 
+    def testWaitAnySome(self):
+        comm = self.COMM
+        size = comm.Get_size()
+        rank = comm.Get_rank()
+        dest = (rank + 1) % size
+        source = (rank - 1) % size
+        waitany = self.RequestType.waitany
+        testany = self.RequestType.testany
+        waitsome = self.RequestType.waitsome
+        testsome = self.RequestType.testsome
+        #
+        sreqs = [comm.isend(smess, dest, 1) for smess in messages]
+        rreqs = [comm.mprobe(source, 1).irecv() for _ in messages]
+        rmess = [None] * len(messages)
+        status = MPI.Status()
+        while True:
+            index, obj = waitany(rreqs, status)
+            if index == MPI.UNDEFINED:
+                break
+            self.assertEqual(status.source, source)
+            self.assertEqual(status.tag, 1)
+            rmess[index] = obj
+        self.assertEqual(rmess, messages)
+        self.assertEqual(testany(rreqs), (MPI.UNDEFINED, True, None))
+        self.assertEqual(waitany(rreqs), (MPI.UNDEFINED, None))
+        waitany(sreqs)
+        self.RequestType.waitall(sreqs)
+        #
+        sreqs = [comm.isend(smess, dest, 2) for smess in messages]
+        rreqs = [comm.mprobe(source, 2).irecv() for _ in messages]
+        rmess = [None] * len(messages)
+        statuses = []
+        while True:
+            indices, objs = waitsome(rreqs, statuses)
+            if indices is None:
+                break
+            self.assertGreater(len(indices), 0)
+            self.assertEqual(len(indices), len(objs))
+            self.assertGreaterEqual(len(statuses), len(indices))
+            for index, obj, sts in zip(indices, objs, statuses):
+                self.assertEqual(sts.source, source)
+                self.assertEqual(sts.tag, 2)
+                rmess[index] = obj
+        self.assertEqual(rmess, messages)
+        self.assertEqual(testsome(rreqs), (None, None))
+        self.RequestType.waitall(sreqs)
+        #
+        comm.barrier()
+        sreqs = [comm.issend(smess, dest, 3) for smess in messages]
+        index, flag, obj = testany(sreqs)
+        self.assertEqual(index, MPI.UNDEFINED)
+        self.assertFalse(flag)
+        self.assertIsNone(obj)
+        self.assertEqual(testsome(sreqs), ([], []))
+        comm.barrier()
+        rmess = [None] * len(messages)
+        rreqs = [comm.mprobe(source, 3).irecv() for _ in messages]
+        while True:
+            indices, objs = testsome(rreqs)
+            if indices is None:
+                break
+            for index, obj in zip(indices, objs):
+                rmess[index] = obj
+        self.assertEqual(rmess, messages)
+        while waitsome(sreqs)[0] is not None:
+            pass
+
     def testSendrecv(self):
         size = self.COMM.Get_size()
         rank = self.COMM.Get_rank()
@@ -846,6 +913,20 @@ class BaseTest(unittest.BaseMixin):
         )
         comm.Free()
 
+    def testGatherScatterTree(self):
+        comm = self.COMM
+        size = comm.Get_size()
+        rank = comm.Get_rank()
+        for root in range(size):
+            sobjs = [(root, i, bytearray(i)) for i in range(size)]
+            robj = comm.scatter(sobjs if rank == root else None, root)
+            self.assertEqual(robj, sobjs[rank])
+            robjs = comm.gather(robj, root)
+            if rank == root:
+                self.assertEqual(robjs, sobjs)
+            else:
+                self.assertIsNone(robjs)
+
     def testAllgatherIntra(self):
         comm = self.COMM
         size = comm.Get_size()
@@ -946,6 +1027,37 @@ class BaseTest(unittest.BaseMixin):
             check2 = lambda x: check(x[0]) and check(x[1])  # noqa: B023,E731
             self.testBcastIntra([(c, c.copy())], check2)
             self.testBcastInter([(c, c.copy())], check2)
+            rmess = comm.allgather((rank, a))
+            for i, (r, x) in enumerate(rmess):
+                self.assertEqual(r, i)
+                self.assertTrue(numpy.all(x == i))
+            smess = [(rank, a, c[: 8 * i]) for i in range(size)]
+            rmess = comm.alltoall(smess)
+            for i, (r, x, y) in enumerate(rmess):
+                self.assertEqual(r, i)
+                self.assertTrue(numpy.all(x == i))
+                self.assertEqual(len(y), 8 * rank)
+                self.assertTrue(check(y))
+
+    def testBigMPIInter(self):
+        comm, color = self.make_intercomm(self.COMM)
+        size = comm.Get_remote_size()
+        rank = comm.Get_rank()
+        bigmpi = self.bigmpi
+        for blocksize in (63, 1000, (1 << 12) + 1):
+            bigmpi.blocksize = blocksize
+            for count in (blocksize - 1, 5 * blocksize):
+                smess = bytes([color]) * count
+                rmess = comm.allgather(smess)
+                self.assertEqual(rmess, [bytes([1 - color]) * count] * size)
+                rmess = comm.alltoall([smess] * size)
+                self.assertEqual(rmess, [bytes([1 - color]) * count] * size)
+                smess = [(rank, bytes(rank * count))] * size
+                rmess = comm.alltoall(smess)
+                for i, (r, y) in enumerate(rmess):
+                    self.assertEqual(r, i)
+                    self.assertEqual(y, bytes(i * count))
+        comm.Free()
 
 
 class BaseTestPKL5(unittest.BaseMixin):
@@ -988,6 +1100,11 @@ class BaseTestPKL5(unittest.BaseMixin):
                     data, bufs = pickle.dumps_oob(sobj)
                     self.assertIs(type(data), bytes)
                     self.assertIs(type(bufs), list)
+                    cbufs = []
+                    data, bufs = pickle.dumps_oob(sobj, cbufs.append)
+                    self.assertEqual(len(cbufs), len(bufs))
+                    for cbuf, buf in zip(cbufs, bufs):
+                        self.assertIs(cbuf, buf)
                     robj = pickle.loads_oob(data, bufs)
                     self.assertTrue(numpy.all(sobj == robj))
                     if sobj.nbytes >= threshold:
@@ -996,6 +1113,263 @@ class BaseTestPKL5(unittest.BaseMixin):
                     else:
                         self.assertEqual(len(bufs), 0)
 
+    @unittest.skipIf(numpy is None, "numpy")
+    def testSharedMemory(self):
+        comm = self.COMM
+        size = comm.Get_size()
+        rank = comm.Get_rank()
+        dest = (rank + 1) % size
+        source = (rank - 1) % size
+        comm.attach_shared(1 << 16)
+        try:
+            sobj = numpy.full(64, rank, dtype="i")
+            robj = comm.sendrecv(sobj, dest, 0, None, source, 0)
+            self.assertTrue(numpy.all(robj == source))
+            self.assertFalse(robj.flags.writeable)
+            del robj
+            for count in (0, 1, 100, 1000, 5000):
+                for _ in range(8):
+                    sobj = numpy.full(count, rank, dtype="i")
+                    robj = comm.sendrecv(sobj, dest, 0, None, source, 0)
+                    self.assertEqual(len(robj), count)
+                    self.assertTrue(numpy.all(robj == source))
+                    sreq = comm.isend((sobj, sobj), dest, 1)
+                    robj = comm.mprobe(source, 1).recv()
+                    sreq.wait()
+                    self.assertTrue(numpy.all(robj[0] == source))
+                    self.assertTrue(numpy.all(robj[1] == source))
+                    sreq = comm.isend(sobj, dest, 2)
+                    robj = comm.mprobe(source, 2).irecv().wait()
+                    sreq.wait()
+                    self.assertTrue(numpy.all(robj == source))
+                    del robj
+            comm.barrier()
+            sobj = numpy.full(64, rank, dtype="i")
+            robj = comm.sendrecv(sobj, dest, 0, None, source, 0)
+        finally:
+            comm.detach_shared()
+        self.assertTrue(numpy.all(robj == source))
+        del robj
+        sobj = numpy.full(64, rank, dtype="i")
+        robj = comm.sendrecv(sobj, dest, 0, None, source, 0)
+        self.assertTrue(numpy.all(robj == source))
+        self.assertTrue(robj.flags.writeable)
+
+    @unittest.skipIf(numpy is None, "numpy")
+    def testBcastStream(self):
+        comm = self.COMM
+        size = comm.Get_size()
+        rank = comm.Get_rank()
+        chunksize_prev = pkl5._bcast_chunksize
+        try:
+            for chunksize in (1, 64, 1000, chunksize_prev):
+                pkl5._bcast_chunksize = chunksize
+                for root in range(size):
+                    a = numpy.arange(1 << 12, dtype="i") + root
+                    b = numpy.arange(777, dtype="f")
+                    b.flags.writeable = False
+                    smess = [a, "abc", b, a[::2], numpy.empty(0, dtype="i")]
+                    rmess = comm.bcast(smess if rank == root else None, root)
+                    self.assertEqual(len(rmess), len(smess))
+                    self.assertEqual(rmess[1], "abc")
+                    del rmess[1], smess[1]
+                    for x, y in zip(rmess, smess):
+                        self.assertTrue(numpy.all(x == y))
+                    self.assertFalse(b.flags.writeable)
+        finally:
+            pkl5._bcast_chunksize = chunksize_prev
+
+    @unittest.skipIf(numpy is None, "numpy")
+    def testBufferProvider(self):
+        comm = self.COMM
+        size = comm.Get_size()
+        rank = comm.Get_rank()
+        dest = (rank + 1) % size
+        source = (rank - 1) % size
+        sizes = []
+        arrays = []
+
+        def provider(nbytes):
+            sizes.append(nbytes)
+            if nbytes == 0:
+                return None
+            if nbytes == 8:
+                return bytes(nbytes)
+            if nbytes == 12:
+                return bytearray(nbytes - 1)
+            array = numpy.empty(nbytes // 4 + 1, dtype="i")
+            arrays.append(array)
+            return array
+
+        with self.assertRaises(TypeError):
+            comm.set_buffer_provider(42)
+        comm.set_buffer_provider(provider)
+        try:
+            for count in (0, 2, 3, 64, 1000):
+                sobj = [numpy.full(count, rank, dtype="i") for _ in "ab"]
+                robj = comm.sendrecv(sobj, dest, 0, None, source, 0)
+                self.assertEqual(sizes, [4 * count] * 2)
+                for rarr in robj:
+                    self.assertTrue(numpy.all(rarr == source))
+                    self.assertTrue(rarr.flags.writeable)
+                for rarr, array in zip(robj, arrays):
+                    self.assertTrue(numpy.shares_memory(rarr, array))
+                    self.assertTrue(numpy.all(array[:count] == source))
+                sizes.clear()
+                arrays.clear()
+                sreq = comm.isend(sobj[0], dest, 1)
+                robj = comm.mprobe(source, 1).recv()
+                sreq.wait()
+                self.assertTrue(numpy.all(robj == source))
+                self.assertEqual(sizes, [4 * count])
+                for array in arrays:
+                    self.assertTrue(numpy.shares_memory(robj, array))
+                sizes.clear()
+                arrays.clear()
+                for root in range(size):
+                    sobj = numpy.full(count, root, dtype="i")
+                    robj = comm.bcast(sobj if rank == root else None, root)
+                    self.assertTrue(numpy.all(robj == root))
+                    if rank != root:
+                        self.assertEqual(sizes, [4 * count])
+                    for array in arrays:
+                        self.assertTrue(numpy.shares_memory(robj, array))
+                    sizes.clear()
+                    arrays.clear()
+            comm.barrier()
+        finally:
+            comm.set_buffer_provider(None)
+        comm.set_buffer_provider(None)
+        sobj = numpy.full(64, rank, dtype="i")
+        robj = comm.sendrecv(sobj, dest, 0, None, source, 0)
+        self.assertTrue(numpy.all(robj == source))
+        self.assertEqual(sizes, [])
+
+    def testNonblockingCollIntra(self):
+        comm = self.COMM
+        size = comm.Get_size()
+        rank = comm.Get_rank()
+        for smess in messages:
+            for root in range(size):
+                isroot = rank == root
+                requests = [
+                    comm.ibcast(smess if isroot else None, root),
+                    comm.igather(smess, root),
+                    comm.iscatter([smess] * size if isroot else None, root),
+                    comm.iallgather(smess),
+                    comm.ialltoall([smess] * size),
+                ]
+                for request in requests:
+                    self.assertIsInstance(request, pkl5.Request)
+                rmess = pkl5.Request.waitall(requests)
+                self.assertEqual(rmess[0], smess)
+                if isroot:
+                    self.assertEqual(rmess[1], [smess] * size)
+                else:
+                    self.assertIsNone(rmess[1])
+                self.assertEqual(rmess[2], smess)
+                self.assertEqual(rmess[3], [smess] * size)
+                self.assertEqual(rmess[4], [smess] * size)
+        for root in range(size):
+            sobjs = [(root, i) for i in range(size)]
+            robj = comm.iscatter(sobjs if rank == root else None, root).wait()
+            self.assertEqual(robj, sobjs[rank])
+            robjs = comm.igather(robj, root).wait()
+            self.assertEqual(robjs, sobjs if rank == root else None)
+        robjs = comm.ialltoall([(rank, i) for i in range(size)]).wait()
+        self.assertEqual(robjs, [(i, rank) for i in range(size)])
+        requests = [comm.iallgather(i) for i in range(3)]
+        results = [None] * len(requests)
+        index, obj = pkl5.Request.waitany(requests)
+        results[index] = obj
+        while True:
+            indices, objs = pkl5.Request.waitsome(requests)
+            if indices is None:
+                break
+            for i, obj in zip(indices, objs):
+                results[i] = obj
+        self.assertEqual(results, [[i] * size for i in range(3)])
+        request = comm.iallgather(rank)
+        while not request.get_status():
+            pass
+        self.assertEqual(request.test(), (True, list(range(size))))
+        self.assertRaises(ValueError, comm.ialltoall, [None] * (size + 1))
+        self.assertRaises(MPI.Exception, comm.igather, None, root=size)
+        self.assertRaises(MPI.Exception, comm.iscatter, None, root=size)
+
+    def testNonblockingCollNoBlock(self):
+        comm = self.COMM
+        size = comm.Get_size()
+        rank = comm.Get_rank()
+        if size < 2:
+            return
+        smess = messages[-1]
+        if rank == 0:
+            requests = [
+                comm.ibcast(None, root=1),
+                comm.iscatter(None, root=1),
+                comm.igather(smess, root=1),
+            ]
+            comm.send(rank, dest=1, tag=7)
+            rmess = pkl5.Request.waitall(requests)
+            self.assertEqual(rmess, [smess, smess, None])
+        else:
+            if rank == 1:
+                self.assertEqual(comm.recv(source=0, tag=7), 0)
+            requests = [
+                comm.ibcast(smess, root=1),
+                comm.iscatter([smess] * size if rank == 1 else None, root=1),
+                comm.igather(smess, root=1),
+            ]
+            rmess = [request.wait() for request in reversed(requests)]
+            glist = [smess] * size if rank == 1 else None
+            self.assertEqual(rmess, [glist, smess, smess])
+
+    def testNonblockingCollInter(self):
+        comm, COLOR = self.make_intercomm(self.COMM)
+        rank = comm.Get_rank()
+        size = comm.Get_size()
+        rsize = comm.Get_remote_size()
+        for smess in messages:
+            for color in [0, 1]:
+                if color == COLOR:
+                    for root in range(size):
+                        if root == rank:
+                            requests = [
+                                comm.ibcast(smess, MPI.ROOT),
+                                comm.igather(None, MPI.ROOT),
+                                comm.iscatter([smess] * rsize, MPI.ROOT),
+                            ]
+                            rmess = pkl5.Request.waitall(requests)
+                            rlist = [None, [smess] * rsize, None]
+                            self.assertEqual(rmess, rlist)
+                        else:
+                            requests = [
+                                comm.ibcast(None, MPI.PROC_NULL),
+                                comm.igather(None, MPI.PROC_NULL),
+                                comm.iscatter(None, MPI.PROC_NULL),
+                            ]
+                            rmess = pkl5.Request.waitall(requests)
+                            self.assertEqual(rmess, [None, None, None])
+                else:
+                    for root in range(rsize):
+                        requests = [
+                            comm.ibcast(None, root),
+                            comm.igather(smess, root),
+                            comm.iscatter(None, root),
+                        ]
+                        rmess = pkl5.Request.waitall(requests)
+                        self.assertEqual(rmess, [smess, None, smess])
+            requests = [
+                comm.iallgather(smess),
+                comm.ialltoall([smess] * rsize),
+            ]
+            rmess = pkl5.Request.waitall(requests)
+            self.assertEqual(rmess, [[smess] * rsize, [smess] * rsize])
+        root = max(size, rsize)
+        self.assertRaises(MPI.Exception, comm.igather, None, root=root)
+        comm.Free()
+
 
 class TestMPISelf(BaseTest, unittest.TestCase):
     #
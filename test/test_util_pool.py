@@ -130,6 +130,10 @@ class BaseTestPool(BaseMixin):
             self.pool.map(sqr, list(range(100)), chunksize=20),
             list(map(sqr, list(range(100)))),
         )
+        self.assertEqual(
+            self.pool.map(sqr, range(100), chunksize="auto"),
+            list(map(sqr, list(range(100)))),
+        )
 
     def test_imap(self):
         self.assertEqual(